@@ -0,0 +1,31 @@
+"""Measures the per-call cost of the boollist conversions for typical assembly sizes.
+
+Usage: python benchmarks/boollist_benchmark.py
+"""
+
+import os
+import timeit
+from edcon.utils.boollist import bytes_to_boollist, boollist_to_bytes
+
+ASSEMBLY_SIZES = [8, 64, 512]
+NUMBER = 2000
+
+
+def main():
+    """Prints the per-call cost (in us) for each assembly size"""
+    print(f"{'bytes':>6} {'bytes_to_boollist':>20} {'boollist_to_bytes':>20}")
+    for size in ASSEMBLY_SIZES:
+        data = os.urandom(size)
+        boollist = bytes_to_boollist(data)
+        assert boollist_to_bytes(boollist) == data
+
+        to_list = timeit.timeit(lambda: bytes_to_boollist(data), number=NUMBER)
+        to_bytes = timeit.timeit(lambda: boollist_to_bytes(boollist), number=NUMBER)
+        print(
+            f"{size:>6} {to_list / NUMBER * 1e6:>17.2f} us "
+            f"{to_bytes / NUMBER * 1e6:>17.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measures the per-call overhead of logging in the PNU access hot path.
+
+Usage: python benchmarks/logging_benchmark.py
+"""
+
+import logging
+import timeit
+from edcon.utils.logging import Logging
+from edcon.edrive.com_base import ComBase
+
+NUMBER = 20000
+RAW = b"\x10\x27\x00\x00"
+
+
+class LoopbackCom(ComBase):
+    """Communication driver returning constant raw PNU data"""
+
+    def read_pnu_raw(self, pnu: int, subindex: int = 0, num_elements: int = 1) -> bytes:
+        return RAW
+
+
+def per_call(func) -> float:
+    """Returns the per-call cost (in us) of func"""
+    return timeit.timeit(func, number=NUMBER) / NUMBER * 1e6
+
+
+def main():
+    """Prints the per-call cost (in us) of eager and deferred log messages"""
+    Logging.logger.addHandler(logging.NullHandler())
+    Logging.logger.propagate = False
+    logger = Logging.get_logger("benchmark")
+    com = LoopbackCom()
+    pnu, subindex = 11000, 0
+
+    for level in [logging.INFO, logging.WARNING]:
+        Logging.logger.setLevel(level)
+        print(f"edcon logger level: {logging.getLevelName(level)}")
+        print(
+            "  eager f-string message:   "
+            f"{per_call(lambda: logger.info(f'Read PNU {pnu} ({subindex}): {RAW}')):8.2f} us"
+        )
+        print(
+            "  deferred %-style message: "
+            f"{per_call(lambda: logger.info('Read PNU %s (%s): %s', pnu, subindex, RAW)):8.2f} us"
+        )
+        print(
+            f"  ComBase.read_pnu:         {per_call(lambda: com.read_pnu(pnu)):8.2f} us"
+        )
+
+    # Only silence the PNU packing messages
+    Logging.logger.setLevel(logging.INFO)
+    logging.getLogger("edcon.pnu").setLevel(logging.WARNING)
+    print("edcon logger level: INFO, edcon.pnu logger level: WARNING")
+    print(f"  ComBase.read_pnu:         {per_call(lambda: com.read_pnu(pnu)):8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
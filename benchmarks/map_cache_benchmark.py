@@ -0,0 +1,45 @@
+"""Measures the time to load the PNU and ICP map files with and without binary cache.
+
+Usage: python benchmarks/map_cache_benchmark.py
+"""
+
+import os
+import tempfile
+import timeit
+from edcon.edrive.parameter_mapping import read_pnu_map_file
+from edcon.edrive.diagnosis import read_icp_map_file
+
+NUMBER = 50
+
+
+def per_load(func) -> float:
+    """Returns the per-load cost (in ms) of the uncached func"""
+
+    def load():
+        func.cache_clear()
+        func()
+
+    return timeit.timeit(load, number=NUMBER) / NUMBER * 1e3
+
+
+def main():
+    """Prints the load time (in ms) of the map files"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for name, func in [
+            ("pnu_map.csv", read_pnu_map_file),
+            ("icp_map.csv", read_icp_map_file),
+        ]:
+            os.environ["EDCON_CACHE_DIR"] = ""
+            csv_time = per_load(func)
+            os.environ["EDCON_CACHE_DIR"] = cache_dir
+            func.cache_clear()
+            func()  # Creates the cache file
+            cached_time = per_load(func)
+            print(
+                f"{name}: csv {csv_time:6.2f} ms, cached {cached_time:6.2f} ms "
+                f"({csv_time / cached_time:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
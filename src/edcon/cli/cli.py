@@ -5,10 +5,12 @@ import argparse
 from edcon.cli.position import add_position_parser
 from edcon.cli.pnu import add_pnu_parser
 from edcon.cli.parameter_set_load import add_parameter_set_load_parser
+from edcon.cli.parameter_set_save import add_parameter_set_save_parser
 from edcon.cli.tg1 import add_tg1_parser
 from edcon.cli.tg9 import add_tg9_parser
 from edcon.cli.tg102 import add_tg102_parser
 from edcon.cli.tg111 import add_tg111_parser
+from edcon.cli.daemon import add_daemon_parser
 from edcon.utils.logging import Logging
 
 # pylint: disable=duplicate-code
@@ -37,6 +39,19 @@ def main():
         help="use EtherNet/IP (instead of ModbusTCP) as underlying communication.",
     )
 
+    # Daemon specific options
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="reuse the connection of a running daemon (see subcommand daemon).",
+    )
+    parser.add_argument(
+        "--daemon-socket",
+        default=None,
+        help="Unix socket of the daemon (default: festo-edcon-<user>.sock "
+        "in $XDG_RUNTIME_DIR or the temp directory).",
+    )
+
     subparsers = parser.add_subparsers(
         dest="subcommand",
         required=True,
@@ -52,6 +67,7 @@ def main():
 
     # Options for parameter_set
     add_parameter_set_load_parser(subparsers)
+    add_parameter_set_save_parser(subparsers)
 
     # Options for tg1
     add_tg1_parser(subparsers)
@@ -65,6 +81,9 @@ def main():
     # Options for tg111
     add_tg111_parser(subparsers)
 
+    # Options for daemon
+    add_daemon_parser(subparsers)
+
     args = parser.parse_args()
 
     Logging(logging.WARNING if args.quiet else logging.INFO)
@@ -0,0 +1,54 @@
+"""Contains functions to create the communication driver selected on the command line.
+
+The drivers are imported on demand, so only the fieldbus stack
+that is actually used has to be loaded.
+"""
+
+from edcon.utils.logging import Logging
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
+
+
+def create_driver(ip_address: str, ethernetip: bool = False):
+    """Creates a communication driver for the provided IP address
+
+    Parameters:
+        ip_address (str): IP address of the EDrive
+        ethernetip (bool): If True, ComEthernetip is used, otherwise ComModbus
+                           (with batched PNU mailbox access)
+
+    Returns:
+        ComBase: ComEthernetip or ComModbus instance
+    """
+    if ethernetip:
+        from edcon.edrive.com_ethernetip import ComEthernetip
+
+        return ComEthernetip(ip_address)
+
+    from edcon.edrive.com_modbus import ComModbus
+
+    return ComModbus(ip_address, batched_pnu_access=True)
+
+
+def create_com(args):
+    """Creates the communication driver selected by the provided arguments.
+    If requested, the connection of a running daemon is used.
+
+    Parameters:
+        args (Namespace): Parsed arguments containing ip_address, ethernetip,
+                          daemon and daemon_socket
+
+    Returns:
+        ComBase: ComDaemonClient, ComEthernetip or ComModbus instance
+    """
+    if getattr(args, "daemon", False):
+        from edcon.edrive.com_daemon import ComDaemonClient
+
+        try:
+            return ComDaemonClient(args.ip_address, args.ethernetip, args.daemon_socket)
+        except OSError as error:
+            Logging.logger.warning(
+                f"Daemon not reachable ({error}), connecting directly"
+            )
+    return create_driver(args.ip_address, args.ethernetip)
@@ -0,0 +1,24 @@
+"""CLI tool that keeps connections to EDrive devices open for other CLI calls."""
+
+from edcon.cli.com_factory import create_driver
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
+
+
+def add_daemon_parser(subparsers):
+    """Adds arguments to a provided subparsers instance"""
+    parser_daemon = subparsers.add_parser("daemon")
+    parser_daemon.set_defaults(func=daemon_func)
+
+
+def daemon_func(args):
+    """Executes subcommand based on provided arguments"""
+    from edcon.edrive.com_daemon import ComDaemon
+
+    with ComDaemon(create_driver, socket_path=args.daemon_socket) as daemon:
+        print(f"Listening on {daemon.socket_path} (stop with Ctrl+C)")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
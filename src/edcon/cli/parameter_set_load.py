@@ -1,10 +1,12 @@
 """CLI Tool to write whole paremeter set EDrive device using .pck file."""
 
-from edcon.utils.logging import Logging
-from edcon.edrive.parameter_set import ParameterSet
-from edcon.edrive.parameter_handler import ParameterHandler
-from edcon.edrive.com_modbus import ComModbus
-from edcon.edrive.com_ethernetip import ComEthernetip
+import argparse
+import sys
+import time
+from edcon.cli.com_factory import create_com
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
 
 
 def add_parameter_set_load_parser(subparsers):
@@ -13,26 +15,98 @@ def add_parameter_set_load_parser(subparsers):
     parser_pnu.set_defaults(func=parameter_set_load_func)
 
     parser_pnu.add_argument("file", help="Parameter set to write.")
+    parser_pnu.add_argument(
+        "-d",
+        "--diff",
+        action="store_true",
+        help="Read the configured values first and only write parameters that differ.",
+    )
+    parser_pnu.add_argument(
+        "--verify",
+        action="store_true",
+        help="Read back the written parameters and compare them.",
+    )
+    parser_pnu.add_argument(
+        "-t",
+        "--targets",
+        nargs="+",
+        metavar="IP_ADDRESS",
+        help="Deploy the parameter set to multiple drives (instead of --ip-address).",
+    )
+    parser_pnu.add_argument(
+        "--inventory",
+        help="CSV file containing the IP addresses of the drives in the first column.",
+    )
+    parser_pnu.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=8,
+        help="Maximum number of drives configured concurrently (default: %(default)s).",
+    )
 
 
 def parameter_set_load_func(args):
     """Executes subcommand based on provided arguments"""
-    # Initialize driver
-    com = (
-        ComEthernetip(args.ip_address)
-        if args.ethernetip
-        else ComModbus(args.ip_address)
-    )
+    from edcon.edrive.parameter_set import ParameterSet
+    from edcon.edrive.parameter_handler import ParameterHandler
+
     parameter_set = ParameterSet(args.file)
+    if args.targets or args.inventory:
+        parameter_set_deploy(args, list(parameter_set))
+        return
+
+    # Initialize driver
+    com = create_com(args)
     parameter_handler = ParameterHandler(com)
 
-    i = None
-    for i, parameter in enumerate(parameter_set):
-        status = parameter_handler.write(parameter)
+    result = parameter_handler.load_parameters(
+        list(parameter_set), only_changed=args.diff, verify=args.verify
+    )
+    print(f"Parameter set loaded: {result.summary()}")
+    if result.failed:
+        sys.exit(1)
+
+
+def parameter_set_deploy(args, parameters: list):
+    """Deploys the parameters to all drives provided by targets and inventory"""
+    from edcon.edrive.parameter_deployment import (
+        deploy_parameters,
+        read_inventory_file,
+    )
+
+    ip_addresses = list(args.targets or [])
+    if args.inventory:
+        ip_addresses += read_inventory_file(args.inventory)
+    ip_addresses = list(dict.fromkeys(ip_addresses))
+
+    def drive_com(ip_address):
+        return create_com(
+            argparse.Namespace(**{**vars(args), "ip_address": ip_address})
+        )
+
+    finished = []
 
-        if not status:
-            Logging.logger.error(
-                f"Setting {parameter.uid()}" f"to {parameter.value} failed"
-            )
+    def report(deployment):
+        finished.append(deployment)
+        print(f"[{len(finished)}/{len(ip_addresses)}] {deployment.summary()}")
 
-    print(f"{i+1} PNUs succesfully written!")
+    start = time.monotonic()
+    results = deploy_parameters(
+        drive_com,
+        ip_addresses,
+        parameters,
+        args.jobs,
+        only_changed=args.diff,
+        verify=args.verify,
+        callback=report,
+    )
+    failed = [deployment for deployment in results if not deployment.ok]
+    print(
+        f"Parameter set deployed to {len(results) - len(failed)} of {len(results)} "
+        f"drives in {time.monotonic() - start:.1f} s"
+    )
+    for deployment in failed:
+        print(f"Failed: {deployment.summary()}")
+    if failed:
+        sys.exit(1)
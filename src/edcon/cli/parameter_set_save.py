@@ -0,0 +1,56 @@
+"""CLI Tool to save the parameters of an EDrive device to a .pck file."""
+
+import datetime
+from edcon.cli.com_factory import create_com
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
+
+
+def add_parameter_set_save_parser(subparsers):
+    """Adds arguments to a provided subparsers instance"""
+    parser_save = subparsers.add_parser("parameter-set-save")
+    parser_save.set_defaults(func=parameter_set_save_func)
+
+    parser_save.add_argument("file", help="Parameter set (.pck) to write.")
+    parser_save.add_argument(
+        "-b",
+        "--baseline",
+        help="Previous snapshot (.pck or binary), only its parameters are read.",
+    )
+    parser_save.add_argument(
+        "--binary",
+        help="Additionally write the compact binary representation to this file.",
+    )
+
+
+def parameter_set_save_func(args):
+    """Executes subcommand based on provided arguments"""
+    from edcon.edrive.parameter_set import ParameterSet, write_parameter_set
+    from edcon.edrive.parameter_handler import ParameterHandler
+
+    baseline = None
+    if args.baseline:
+        baseline = ParameterSet(args.baseline, strip_null_terminators=False)
+
+    com = create_com(args)
+    snapshot = ParameterHandler(com).snapshot(baseline)
+
+    header = [
+        "Created by festo-edcon parameter-set-save",
+        f"IP address: {args.ip_address}",
+        f"Date: {datetime.datetime.now().isoformat(timespec='seconds')}",
+    ]
+    write_parameter_set(args.file, snapshot, header)
+    if args.binary:
+        write_parameter_set(args.binary, snapshot, binary=True)
+
+    summary = f"{len(snapshot)} parameters saved"
+    if baseline is not None:
+        previous = {parameter.uid(): parameter.value_raw for parameter in baseline}
+        changed = sum(
+            previous.get(parameter.uid()) != parameter.value_raw
+            for parameter in snapshot
+        )
+        summary += f" ({changed} changed since baseline)"
+    print(summary)
@@ -1,7 +1,15 @@
 """CLI Tool to read or write PNUs of a EDrive device."""
 
-from edcon.edrive.com_modbus import ComModbus
-from edcon.edrive.com_ethernetip import ComEthernetip
+import argparse
+import csv
+import json
+import sys
+from collections import namedtuple
+from edcon.cli.com_factory import create_com
+
+PnuCommand = namedtuple("PnuCommand", ["line", "command", "pnu", "subindex", "value"])
+
+PNU_BATCH_FIELDS = ["line", "command", "pnu", "subindex", "value", "ok"]
 
 
 def add_pnu_parser(subparsers):
@@ -37,15 +45,174 @@ def add_pnu_parser(subparsers):
     parser_write = subparsers_pnu.add_parser("write")
     parser_write.add_argument("value", help="Value to be written")
 
+    # Options for executing a batch of PNU accesses
+    parser_batch = subparsers_pnu.add_parser(
+        "batch",
+        description="Executes 'read PNU[.subindex]' and 'write PNU[.subindex] value' "
+        "lines using a single connection.",
+    )
+    parser_batch.add_argument(
+        "file",
+        nargs="?",
+        type=argparse.FileType("r"),
+        default="-",
+        help="File containing the PNU accesses (default: stdin).",
+    )
+    parser_batch.add_argument(
+        "-f",
+        "--format",
+        choices=["csv", "json"],
+        default="csv",
+        help="Output format of the results (default: %(default)s).",
+    )
+
+
+def parse_pnu_batch(lines) -> list:
+    """Parses lines of PNU accesses
+
+    Each line contains either 'read PNU[.subindex]' or 'write PNU[.subindex] value'.
+    Empty lines and lines starting with '#' are ignored.
+
+    Parameters:
+        lines (Iterable): Lines that should be parsed
+
+    Returns:
+        list: PnuCommand for each PNU access
+
+    Raises:
+        ValueError: If a line is invalid
+    """
+    commands = []
+    for line_number, line in enumerate(lines, start=1):
+        tokens = line.split(maxsplit=2)
+        if not tokens or tokens[0].startswith("#"):
+            continue
+        try:
+            command = tokens[0].lower()
+            pnu, _, subindex = tokens[1].partition(".")
+            if command == "read" and len(tokens) == 2:
+                value = None
+            elif command == "write" and len(tokens) == 3:
+                value = tokens[2].strip()
+            else:
+                raise ValueError
+            commands.append(
+                PnuCommand(line_number, command, int(pnu), int(subindex or 0), value)
+            )
+        except (ValueError, IndexError) as error:
+            raise ValueError(
+                f"Invalid PNU access in line {line_number}: {line.strip()}"
+            ) from error
+    return commands
+
+
+def _execute_pnu_commands(com, commands: list) -> tuple:
+    """Executes PNU accesses of the same kind using one bulk transfer
+
+    Returns:
+        tuple: Values and status list of the PNU accesses
+
+    Raises:
+        ValueError: If a value can not be packed for its PNU
+        KeyError: If a PNU is not available in the pnu_map
+    """
+    if commands[0].command == "read":
+        values = com.read_pnus([(cmd.pnu, cmd.subindex) for cmd in commands])
+        return values, [value is not None for value in values]
+    status_list = com.write_pnus(
+        [(cmd.pnu, cmd.subindex, cmd.value) for cmd in commands]
+    )
+    return [cmd.value for cmd in commands], status_list
+
+
+def _execute_pnu_commands_separately(com, commands: list) -> tuple:
+    """Executes PNU accesses one by one, invalid accesses fail without aborting
+
+    Returns:
+        tuple: Values and status list of the PNU accesses
+    """
+    values, status_list = [], []
+    for cmd in commands:
+        try:
+            (value,), (status,) = _execute_pnu_commands(com, [cmd])
+        except (ValueError, KeyError) as error:
+            print(
+                f"Line {cmd.line}: {cmd.command} {cmd.pnu} failed ({error})",
+                file=sys.stderr,
+            )
+            value, status = cmd.value, False
+        values.append(value)
+        status_list.append(status)
+    return values, status_list
+
+
+def execute_pnu_batch(com, commands: list) -> list:
+    """Executes PNU accesses, consecutive accesses of the same kind
+    are combined to a bulk transfer. If a bulk transfer contains an invalid
+    access (unknown PNU or invalid value), its accesses are executed separately
+    and only the invalid ones fail.
+
+    Parameters:
+        com (ComBase): Communication driver to use
+        commands (list): PnuCommand for each PNU access
+
+    Returns:
+        list: Result dict (see PNU_BATCH_FIELDS) for each PNU access
+    """
+    results = []
+    start = 0
+    while start < len(commands):
+        end = start
+        while end < len(commands) and commands[end].command == commands[start].command:
+            end += 1
+        batch = commands[start:end]
+        try:
+            values, status_list = _execute_pnu_commands(com, batch)
+        except (ValueError, KeyError):
+            values, status_list = _execute_pnu_commands_separately(com, batch)
+        for cmd, value, status in zip(batch, values, status_list):
+            if isinstance(value, bytes):
+                value = value.decode("ascii", errors="replace").rstrip("\x00")
+            results.append({**cmd._asdict(), "value": value, "ok": bool(status)})
+        start = end
+    return results
+
+
+def print_pnu_batch_results(results: list, output_format: str):
+    """Prints results of execute_pnu_batch as CSV or JSON lines"""
+    if output_format == "json":
+        for result in results:
+            print(json.dumps(result))
+        return
+    writer = csv.DictWriter(sys.stdout, fieldnames=PNU_BATCH_FIELDS)
+    writer.writeheader()
+    writer.writerows(results)
+
+
+def pnu_batch_func(args):
+    """Executes the PNU accesses of a batch file"""
+    with args.file as batch_file:
+        try:
+            commands = parse_pnu_batch(batch_file)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            sys.exit(1)
+
+    com = create_com(args)
+    results = execute_pnu_batch(com, commands)
+    print_pnu_batch_results(results, args.format)
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
 
 def pnu_func(args):
     """Executes subcommand based on provided arguments"""
+    if args.subcommand == "batch":
+        pnu_batch_func(args)
+        return
+
     # Initialize driver
-    com = (
-        ComEthernetip(args.ip_address)
-        if args.ethernetip
-        else ComModbus(args.ip_address)
-    )
+    com = create_com(args)
     pnu = int(args.pnu)
     subindex = int(args.subindex)
     if args.subcommand == "read":
@@ -2,9 +2,10 @@
 
 import sys
 import traceback
-from edcon.edrive.motion_handler import MotionHandler
-from edcon.edrive.com_modbus import ComModbus
-from edcon.edrive.com_ethernetip import ComEthernetip
+from edcon.cli.com_factory import create_com
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
 
 
 def add_position_parser(subparsers):
@@ -37,12 +38,10 @@ def add_position_parser(subparsers):
 
 def position_func(args):
     """Executes subcommand based on provided arguments"""
+    from edcon.edrive.motion_handler import MotionHandler
+
     # Initialize driver
-    com = (
-        ComEthernetip(args.ip_address)
-        if args.ethernetip
-        else ComModbus(args.ip_address)
-    )
+    com = create_com(args)
     try:
         with MotionHandler(com, config_mode="write") as mot:
             if not mot.acknowledge_faults():
@@ -1,9 +1,10 @@
 """CLI tool that performs a sequence on Telegram1 and EDrive classes."""
 
 import sys
-from edcon.edrive.telegram1_handler import Telegram1Handler
-from edcon.edrive.com_modbus import ComModbus
-from edcon.edrive.com_ethernetip import ComEthernetip
+from edcon.cli.com_factory import create_com
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
 
 
 def add_tg1_parser(subparsers):
@@ -20,12 +21,10 @@ def add_tg1_parser(subparsers):
 
 def tg1_func(args):
     """Executes subcommand based on provided arguments"""
+    from edcon.edrive.telegram1_handler import Telegram1Handler
+
     # Initialize driver
-    com = (
-        ComEthernetip(args.ip_address)
-        if args.ethernetip
-        else ComModbus(args.ip_address)
-    )
+    com = create_com(args)
     with Telegram1Handler(com, config_mode="write") as tg1:
         if not tg1.acknowledge_faults():
             sys.exit(1)
@@ -1,9 +1,10 @@
 """CLI tool that performs a sequence on Telegram102 and EDrive classes."""
 
 import sys
-from edcon.edrive.telegram102_handler import Telegram102Handler
-from edcon.edrive.com_modbus import ComModbus
-from edcon.edrive.com_ethernetip import ComEthernetip
+from edcon.cli.com_factory import create_com
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
 
 
 def add_tg102_parser(subparsers):
@@ -26,12 +27,10 @@ def add_tg102_parser(subparsers):
 
 def tg102_func(args):
     """Executes subcommand based on provided arguments"""
+    from edcon.edrive.telegram102_handler import Telegram102Handler
+
     # Initialize driver
-    com = (
-        ComEthernetip(args.ip_address)
-        if args.ethernetip
-        else ComModbus(args.ip_address)
-    )
+    com = create_com(args)
     with Telegram102Handler(com, config_mode="write") as tg102:
         tg102.telegram.momred.value = round(
             16384.0 * float(args.moment_reduction) / 100.0
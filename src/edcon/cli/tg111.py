@@ -1,9 +1,10 @@
 """CLI tool that performs a sequence on Telegram111 and EDrive classes."""
 
 import sys
-from edcon.edrive.telegram111_handler import Telegram111Handler
-from edcon.edrive.com_modbus import ComModbus
-from edcon.edrive.com_ethernetip import ComEthernetip
+from edcon.cli.com_factory import create_com
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
 
 
 def add_tg111_parser(subparsers):
@@ -21,12 +22,10 @@ def add_tg111_parser(subparsers):
 
 def tg111_func(args):
     """Executes subcommand based on provided arguments"""
+    from edcon.edrive.telegram111_handler import Telegram111Handler
+
     # Initialize driver
-    com = (
-        ComEthernetip(args.ip_address)
-        if args.ethernetip
-        else ComModbus(args.ip_address)
-    )
+    com = create_com(args)
     with Telegram111Handler(com, config_mode="write") as tg111:
         tg111.telegram.override.value = int(16384 * (float(args.over_v) / 100.0))
         tg111.telegram.mdi_acc.value = 16384
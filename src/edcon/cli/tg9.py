@@ -1,9 +1,10 @@
 """CLI tool that performs a sequence on Telegram9 and EDrive classes."""
 
 import sys
-from edcon.edrive.telegram9_handler import Telegram9Handler
-from edcon.edrive.com_modbus import ComModbus
-from edcon.edrive.com_ethernetip import ComEthernetip
+from edcon.cli.com_factory import create_com
+
+# pylint: disable=import-outside-toplevel
+# Imports are deferred to keep the startup time of the CLI low
 
 
 def add_tg9_parser(subparsers):
@@ -21,12 +22,10 @@ def add_tg9_parser(subparsers):
 
 def tg9_func(args):
     """Executes subcommand based on provided arguments"""
+    from edcon.edrive.telegram9_handler import Telegram9Handler
+
     # Initialize driver
-    com = (
-        ComEthernetip(args.ip_address)
-        if args.ethernetip
-        else ComModbus(args.ip_address)
-    )
+    com = create_com(args)
     with Telegram9Handler(com, config_mode="write") as tg9:
         if not tg9.acknowledge_faults():
             sys.exit(1)
@@ -0,0 +1,133 @@
+"""Contains AsyncComBase class which contains common code for asyncio EDrive drivers."""
+
+from typing import Any
+from edcon.edrive.com_base import (
+    unpack_read_result,
+    pack_write_value,
+    check_write_result,
+    unpack_read_results,
+    pack_write_values,
+    check_write_results,
+)
+
+
+class AsyncComBase:
+    """Class that contains common functions for asyncio EDrive communication drivers."""
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, trc_bck):
+        await self.shutdown()
+
+    async def connect(self):
+        """Establishes the connection to the EDrive"""
+
+    async def shutdown(self):
+        """Stops the i/o data process and closes the connection"""
+
+    async def read_pnu_raw(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1
+    ) -> bytes:
+        """Reads a PNU from the EDrive without interpreting the data"""
+        raise NotImplementedError
+
+    async def read_pnu(self, pnu: int, subindex: int = 0, forced_format=None) -> Any:
+        """Reads a PNU from the EDrive"""
+        return unpack_read_result(
+            pnu, await self.read_pnu_raw(pnu, subindex), forced_format
+        )
+
+    async def write_pnu_raw(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
+    ) -> bool:
+        """Writes raw bytes to a PNU on the EDrive"""
+        raise NotImplementedError
+
+    async def write_pnu(
+        self, pnu: int, subindex: int = 0, value: Any = 0, forced_format=None
+    ) -> bool:
+        """Writes a value to a PNU to the EDrive"""
+        raw = pack_write_value(pnu, value, forced_format)
+        return check_write_result(
+            pnu, await self.write_pnu_raw(pnu, subindex, value=raw)
+        )
+
+    async def read_pnus_raw(self, pnus: list) -> list:
+        """Reads multiple PNUs from the EDrive without interpreting the data
+
+        Parameters:
+            pnus (list): List of (pnu, subindex) tuples that should be read
+
+        Returns:
+            list: Raw bytes for each provided PNU (None if the read failed)
+        """
+        return [await self.read_pnu_raw(pnu, subindex) for pnu, subindex in pnus]
+
+    async def read_pnus(self, pnus: list, forced_format=None) -> list:
+        """Reads multiple PNUs from the EDrive
+
+        Parameters:
+            pnus (list): List of (pnu, subindex) tuples that should be read
+            forced_format (str): Optional format char (see struct) used for all PNUs
+
+        Returns:
+            list: Unpacked value for each provided PNU (None if the read failed)
+        """
+        return unpack_read_results(pnus, await self.read_pnus_raw(pnus), forced_format)
+
+    async def write_pnus_raw(self, pnus: list) -> list:
+        """Writes raw bytes to multiple PNUs on the EDrive
+
+        Parameters:
+            pnus (list): List of (pnu, subindex, value) tuples with raw bytes values
+
+        Returns:
+            list: Write status (bool) for each provided PNU
+        """
+        return [
+            await self.write_pnu_raw(pnu, subindex, value=value)
+            for pnu, subindex, value in pnus
+        ]
+
+    async def write_pnus(self, pnus: list, forced_format=None) -> list:
+        """Writes values to multiple PNUs on the EDrive
+
+        Parameters:
+            pnus (list): List of (pnu, subindex, value) tuples that should be written
+            forced_format (str): Optional format char (see struct) used for all PNUs
+
+        Returns:
+            list: Write status (bool) for each provided PNU
+        """
+        raw_pnus = pack_write_values(pnus, forced_format)
+        return check_write_results(raw_pnus, await self.write_pnus_raw(raw_pnus))
+
+    def io_active(self):
+        """Provides information about connection status."""
+        raise NotImplementedError
+
+    async def start_io(self):
+        """Configures and starts i/o data process"""
+
+    async def stop_io(self):
+        """Stops i/o data process"""
+
+    async def send_io(self, data: bytes, nonblocking: bool = False):
+        """Sends data to the output
+
+        Parameters:
+            nonblocking (bool): If True, function returns immediately.
+                                Otherwise function awaits the next i/o cycle.
+        """
+        raise NotImplementedError
+
+    async def recv_io(self, nonblocking: bool = False) -> bytes:
+        """Receives data from the input
+
+        Parameters:
+            nonblocking (bool): If True, function returns immediately.
+                                Otherwise function awaits the next i/o cycle.
+        """
+        raise NotImplementedError
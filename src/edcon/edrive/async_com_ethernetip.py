@@ -0,0 +1,139 @@
+"""
+Contains AsyncComEthernetip class to configure and communicate with EDrive devices
+from an asyncio event loop.
+
+The python-ethernetip library only provides blocking sockets, so explicit messages
+are executed in a worker thread while the i/o frame notifications of the library
+threads are forwarded to the event loop.
+"""
+
+import asyncio
+from edcon.utils.logging import Logging
+from edcon.utils.boollist import bytes_to_boollist, boollist_to_bytes
+from edcon.edrive.async_com_base import AsyncComBase
+from edcon.edrive.com_ethernetip import ComEthernetip, IO_WAIT_TIMEOUT_CYCLES
+
+logger = Logging.get_logger("com.ethernetip")
+
+
+class AsyncComEthernetip(AsyncComBase):
+    """Class to configure and communicate with EDrive devices via EtherNet/IP using asyncio."""
+
+    def __init__(self, ip_address, cycle_time: int = 10):
+        """Constructor of the AsyncComEthernetip class.
+        The connection is established by awaiting connect() (or using async with).
+
+        Parameters:
+            ip_address (str): Required IP address as string e.g. ('192.168.0.1')
+            cycle_time (int): Cycle time (in ms) that should be used for I/O transfers
+        """
+        self.ip_address = ip_address
+        self.cycle_time = cycle_time
+        self.com = None
+        self.frame_event = asyncio.Event()
+        self._loop = None
+
+    async def connect(self):
+        """Opens the explicit connection and reads the process data sizes"""
+        self._loop = asyncio.get_running_loop()
+        self.com = await asyncio.to_thread(
+            ComEthernetip, self.ip_address, self.cycle_time
+        )
+        self.com.connection.frame_callbacks.append(self._on_frame)
+
+    async def shutdown(self):
+        """Stops the i/o data process"""
+        if self.com is not None:
+            self.com.connection.frame_callbacks.remove(self._on_frame)
+            await asyncio.to_thread(self.com.shutdown)
+
+    def _on_frame(self):
+        """Called by the EtherNet/IP threads for every produced or consumed frame"""
+        self._loop.call_soon_threadsafe(self._notify_frame)
+
+    def _notify_frame(self):
+        """Wakes up all coroutines waiting for a new frame"""
+        event = self.frame_event
+        self.frame_event = asyncio.Event()
+        event.set()
+
+    async def _wait_for_frame(self, condition) -> bool:
+        """Waits until the provided condition is satisfied after a frame notification
+
+        Returns:
+            bool: True if condition was satisfied, False on timeout
+        """
+
+        async def wait():
+            while not condition():
+                await self.frame_event.wait()
+
+        timeout = IO_WAIT_TIMEOUT_CYCLES * self.cycle_time * 0.001
+        try:
+            await asyncio.wait_for(wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def read_pnu_raw(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1
+    ) -> bytes:
+        """Reads a PNU from the EDrive without interpreting the data"""
+        return await asyncio.to_thread(
+            self.com.read_pnu_raw, pnu, subindex, num_elements
+        )
+
+    async def write_pnu_raw(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
+    ) -> bool:
+        """Writes raw bytes to a PNU on the EDrive"""
+        return await asyncio.to_thread(
+            self.com.write_pnu_raw, pnu, subindex, num_elements, value
+        )
+
+    async def read_pnus_raw(self, pnus: list) -> list:
+        """Reads multiple PNUs using CIP Multiple Service Packets"""
+        return await asyncio.to_thread(self.com.read_pnus_raw, pnus)
+
+    async def write_pnus_raw(self, pnus: list) -> list:
+        """Writes multiple PNUs using CIP Multiple Service Packets"""
+        return await asyncio.to_thread(self.com.write_pnus_raw, pnus)
+
+    def io_active(self):
+        """Provides information about connection status."""
+        return self.com.io_active()
+
+    async def start_io(self):
+        """Configures and starts i/o data process"""
+        await asyncio.to_thread(self.com.start_io)
+
+    async def stop_io(self):
+        """Stops i/o data process"""
+        await asyncio.to_thread(self.com.stop_io)
+
+    async def send_io(self, data: bytes, nonblocking: bool = False):
+        """Sends data to the output
+
+        Parameters:
+            nonblocking (bool): If True, function returns immediately.
+                                Otherwise function awaits the frame containing the data.
+        """
+        connection = self.com.connection
+        frame = connection.set_output(bytes_to_boollist(data, self.com.outsize))
+        if not nonblocking:
+            if not await self._wait_for_frame(lambda: connection.produced >= frame):
+                logger.warning("Timeout while waiting for output frame")
+
+    async def recv_io(self, nonblocking: bool = False) -> bytes:
+        """Receives data from the input
+
+        Parameters:
+            nonblocking (bool): If True, function returns immediately.
+                                Otherwise function awaits the next input frame.
+        """
+        connection = self.com.connection
+        if not nonblocking:
+            frame = connection.consumed + 1
+            if not await self._wait_for_frame(lambda: connection.consumed >= frame):
+                logger.warning("Timeout while waiting for input frame")
+        return boollist_to_bytes(connection.inAssem)
@@ -0,0 +1,267 @@
+"""
+Contains AsyncComModbus class to configure and communicate with EDrive devices
+from an asyncio event loop.
+
+This implementation uses the asyncio client of the pymodbus library
+https://pymodbus.readthedocs.io/en/latest/index.html
+"""
+
+import asyncio
+import traceback
+from pymodbus.exceptions import ConnectionException, ModbusException
+from pymodbus.client import AsyncModbusTcpClient
+from edcon.utils.logging import Logging
+from edcon.utils.cycle_statistics import CycleStatistics
+from edcon.edrive.async_com_base import AsyncComBase
+from edcon.edrive.com_modbus import (
+    REG_OUTPUT_DATA,
+    REG_INPUT_DATA,
+    REG_TIMEOUT,
+    IO_DATA_SIZE,
+    REG_PNU_MAILBOX_PNU,
+    REG_PNU_MAILBOX_EXEC,
+    REG_PNU_MAILBOX_DATA_LEN,
+    REG_PNU_MAILBOX_DATA,
+    PNU_MAILBOX_EXEC_READ,
+    PNU_MAILBOX_EXEC_WRITE,
+    PNU_MAILBOX_PREFETCH_DATA_REGS,
+    words_from_bytes,
+    bytes_from_registers,
+    parse_device_info,
+    check_timeout_register,
+    mailbox_header,
+    parse_mailbox_read,
+    mailbox_read_result,
+    mailbox_write_result,
+)
+
+logger = Logging.get_logger("com.modbus")
+
+
+class AsyncComModbus(AsyncComBase):
+    """Class to configure and communicate with EDrive devices via Modbus using asyncio.
+
+    The i/o data is exchanged by a task of the running event loop, so many
+    drives can be controlled from one event loop without additional threads.
+    PNU accesses always use batched mailbox transfers.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # Eleven is needed here
+
+    def __init__(self, ip_address, cycle_time: int = 10, timeout_ms: int = 1000):
+        """Constructor of the AsyncComModbus class.
+        The connection is established by awaiting connect() (or using async with).
+
+        Parameters:
+            ip_address (str): Required IP address as string e.g. ('192.168.0.1')
+            cycle_time (int): Cycle time (in ms) that should be used for I/O transfers
+            timeout_ms (int): Modbus timeout (in ms) that should be configured on the slave
+        """
+        self.ip_address = ip_address
+        self.cycle_time = cycle_time
+        self.timeout_ms = timeout_ms
+
+        self.in_data = b"\x00" * IO_DATA_SIZE
+        self.out_data = b"\x00" * IO_DATA_SIZE
+        self.device_info = None
+        self.io_task = None
+        self.statistics = CycleStatistics(cycle_time)
+        self.lock = asyncio.Lock()
+        self.cycle_event = asyncio.Event()
+
+        self.modbus_client = AsyncModbusTcpClient(ip_address)
+
+    async def connect(self):
+        """Connects to the EDrive, reads device info and configures the modbus timeout"""
+        logger.info("Starting Modbus connection on %s", self.ip_address)
+        if await self.modbus_client.connect():
+            self.device_info = await self.read_device_info()
+            await self.set_timeout(self.timeout_ms)
+
+    async def shutdown(self):
+        """Stops the i/o data task and closes the modbus connection"""
+        if self.io_task is not None:
+            await self.stop_io()
+        self.modbus_client.close()
+
+    def connected(self):
+        """Provides information about connection status."""
+        return self.modbus_client.connected
+
+    async def read_device_info(self) -> dict:
+        """Reads device info from the CMMT and returns dict with containing values
+
+        Returns:
+            dict: Contains device information values
+        """
+        try:
+            async with self.lock:
+                basic = await self.modbus_client.read_device_information(read_code=0x1)
+                regular = await self.modbus_client.read_device_information(
+                    read_code=0x2
+                )
+        except ConnectionException as e:
+            raise ConnectionAbortedError(str(e)) from e
+        return parse_device_info(basic.information, regular.information)
+
+    async def set_timeout(self, timeout_ms) -> bool:
+        """Sets the modbus timeout to the provided value"""
+        logger.info("Setting modbus timeout to %s ms", timeout_ms)
+        async with self.lock:
+            await self.modbus_client.write_registers(REG_TIMEOUT, [timeout_ms, 0])
+            # Check if it actually succeeded
+            indata = await self.modbus_client.read_holding_registers(
+                address=REG_TIMEOUT, count=1
+            )
+        return check_timeout_register(indata.registers[0], timeout_ms)
+
+    async def perform_io(self):
+        """Reads input data from and writes output data to according modbus registers."""
+        async with self.lock:
+            indata = await self.modbus_client.read_holding_registers(
+                address=REG_INPUT_DATA, count=int(IO_DATA_SIZE / 2)
+            )
+        self.in_data = bytes_from_registers(indata.registers)
+
+        async with self.lock:
+            await self.modbus_client.write_registers(
+                REG_OUTPUT_DATA, words_from_bytes(self.out_data)
+            )
+
+    async def _io_loop(self):
+        """Executes perform_io on absolute deadlines of the event loop clock."""
+        loop = asyncio.get_running_loop()
+        period = self.cycle_time * 0.001
+        deadline = loop.time()
+        while True:
+            self.statistics.record_cycle(loop.time())
+            try:
+                await self.perform_io()
+            except (ModbusException, OSError, AttributeError):
+                logger.error(traceback.format_exc())
+                self.io_task = None
+                self._notify_cycle()
+                return
+            self._notify_cycle()
+
+            deadline += period
+            now = loop.time()
+            if now > deadline:
+                # Skip the missed cycles and continue on the original time grid
+                self.statistics.record_overrun()
+                deadline += (int((now - deadline) / period) + 1) * period
+            await asyncio.sleep(deadline - now)
+
+    def _notify_cycle(self):
+        """Wakes up all coroutines waiting for the current i/o cycle"""
+        event = self.cycle_event
+        self.cycle_event = asyncio.Event()
+        event.set()
+
+    async def read_pnu_raw(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1
+    ) -> bytes:
+        """Reads a PNU from the EDrive without interpreting the data"""
+        prefetch_offset = REG_PNU_MAILBOX_DATA - REG_PNU_MAILBOX_EXEC
+        async with self.lock:
+            await self.modbus_client.write_registers(
+                REG_PNU_MAILBOX_PNU,
+                mailbox_header(pnu, subindex, num_elements, PNU_MAILBOX_EXEC_READ),
+            )
+            registers = (
+                await self.modbus_client.read_holding_registers(
+                    address=REG_PNU_MAILBOX_EXEC,
+                    count=prefetch_offset + PNU_MAILBOX_PREFETCH_DATA_REGS,
+                )
+            ).registers
+
+            data_regs, missing = parse_mailbox_read(pnu, registers)
+            if missing > 0:
+                data_regs += (
+                    await self.modbus_client.read_holding_registers(
+                        address=REG_PNU_MAILBOX_DATA + len(data_regs), count=missing
+                    )
+                ).registers
+
+        return mailbox_read_result(pnu, subindex, data_regs)
+
+    async def write_pnu_raw(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
+    ) -> bool:
+        """Writes raw bytes to a PNU on the EDrive"""
+        async with self.lock:
+            await self.modbus_client.write_registers(
+                REG_PNU_MAILBOX_DATA_LEN, [len(value)]
+            )
+            await self.modbus_client.write_registers(
+                REG_PNU_MAILBOX_DATA, words_from_bytes(value)
+            )
+            await self.modbus_client.write_registers(
+                REG_PNU_MAILBOX_PNU,
+                mailbox_header(pnu, subindex, num_elements, PNU_MAILBOX_EXEC_WRITE),
+            )
+            status = (
+                await self.modbus_client.read_holding_registers(
+                    address=REG_PNU_MAILBOX_EXEC, count=1
+                )
+            ).registers[0]
+
+        return mailbox_write_result(pnu, subindex, value, status)
+
+    def io_active(self):
+        """Provides information about connection status."""
+        return self.io_task is not None
+
+    def io_statistics(self) -> dict:
+        """Provides timing statistics of the i/o data task.
+
+        Returns:
+            dict: Containing cycles, overruns, achieved period and jitter (in ms)
+        """
+        return self.statistics.summary()
+
+    async def start_io(self):
+        """Starts i/o data task (if not already running)"""
+        if self.io_active():
+            return
+        self.statistics.reset()
+        self.io_task = asyncio.create_task(self._io_loop())
+
+    async def stop_io(self):
+        """Stops i/o data task"""
+        await self.send_io(b"\x00" * IO_DATA_SIZE)
+        task, self.io_task = self.io_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._notify_cycle()
+
+    async def send_io(self, data: bytes, nonblocking: bool = False):
+        """Sends data to the output
+
+        Parameters:
+            nonblocking (bool): If True, function returns immediately.
+                                Otherwise function awaits the next i/o cycle.
+        """
+        if self.io_task is None:
+            return
+        self.out_data = data
+        if not nonblocking:
+            await self.cycle_event.wait()
+
+    async def recv_io(self, nonblocking: bool = False) -> bytes:
+        """Receives data from the input
+
+        Parameters:
+            nonblocking (bool): If True, function returns immediately.
+                                Otherwise function awaits the next i/o cycle.
+        """
+        if self.io_task is None:
+            return None
+        if not nonblocking:
+            await self.cycle_event.wait()
+        return self.in_data
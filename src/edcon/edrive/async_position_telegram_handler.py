@@ -0,0 +1,148 @@
+"""Class definition containing asyncio position telegram execution functions."""
+
+from edcon.utils.logging import Logging
+from edcon.edrive.async_telegram_handler import AsyncTelegramHandler
+from edcon.edrive.telegram_handler_base import PositionTelegramHandlerBase
+
+
+class AsyncPositionTelegramHandler(AsyncTelegramHandler, PositionTelegramHandlerBase):
+    """Basic class for executing position telegrams from an asyncio event loop."""
+
+    def __init__(self, telegram, com) -> None:
+        super().__init__(telegram, com)
+        self._configure_position_bits()
+
+    async def _wait_for_input(self, predicate, description: str, info_string) -> bool:
+        """Waits until predicate (evaluated on fresh inputs) is satisfied
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        Logging.logger.info(f"Wait for {description}")
+
+        async def cond():
+            await self.update_inputs()
+            return predicate()
+
+        return await self.wait_until_or_not_operational(cond, info_string=info_string)
+
+    async def wait_for_traversing_task_ack(self) -> bool:
+        """Waits for traversing task to be acknowledged
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        if not await self._wait_for_input(
+            lambda: self.telegram.zsw1.traversing_task_ack,
+            "traversing task to be acknowledged",
+            self.position_info_string,
+        ):
+            return False
+        Logging.logger.info("=> Traversing task acknowledged")
+        return True
+
+    async def wait_for_target_position(self) -> bool:
+        """Waits for target position to be reached
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        if not await self._wait_for_input(
+            lambda: self.telegram.zsw1.target_position_reached,
+            "target position to be reached",
+            self.position_info_string,
+        ):
+            return False
+        Logging.logger.info("=> Target position reached")
+        return True
+
+    async def wait_for_stop(self) -> bool:
+        """Waits for drive to stop
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        if not await self._wait_for_input(
+            lambda: self.telegram.zsw1.drive_stopped,
+            "drive to stop",
+            self.velocity_info_string,
+        ):
+            return False
+        Logging.logger.info("=> Drive stopped")
+        return True
+
+    async def wait_for_position_motion_execution(self) -> bool:
+        """Waits for position motion to be finished
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        if not await self.wait_for_traversing_task_ack():
+            return False
+
+        if not await self.wait_for_target_position():
+            return False
+        await self.stop_motion_task()
+        Logging.logger.info("=> Finished position motion task")
+        return True
+
+    async def stop_motion_task(self):
+        """Stops any currently active motion task"""
+        Logging.logger.info("Stopping motion")
+
+        self._prepare_stop_motion_task_bits()
+        await self.update_outputs()
+
+        self.telegram.stw1.do_not_reject_traversing_task = True
+
+        await self.wait_for_stop()
+
+    async def _prepare_activate_traversing_task(self):
+        # If continuous update not active: ensure the generation of a rising edge
+        if self._rising_edge_required():
+            self.telegram.stw1.activate_traversing_task = False
+            await self.update_outputs()
+        self.telegram.stw1.activate_traversing_task = True
+
+    async def _prepare_position_task_bits(
+        self,
+        position: int,
+        velocity: int,
+        absolute: bool = False,  # pylint: disable=unused-argument
+    ):
+        """Prepares the telegram bits for positioning task"""
+        self._prepare_position_setpoints(position, velocity)
+        await self._prepare_activate_traversing_task()
+
+    async def position_task(
+        self,
+        position: int,
+        velocity: int,
+        absolute: bool = False,
+        nonblocking: bool = False,
+    ) -> bool:
+        """Perform a position task with the given parameters
+
+        Parameters:
+            position (int): position setpoint in user units (depends on parametrization)
+            velocity (int): velocity setpoint in user units (depends on parametrization)
+            absolute (bool): If true, position is considered absolute,
+                             otherwise relative to starting position
+            nonblocking (bool): If True, tasks returns immediately after starting the task.
+                                Otherwise function awaits for finish (or fault).
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        if not await self.ready_for_motion():
+            Logging.logger.error("Traversing task aborted")
+            return False
+        Logging.logger.info("Start traversing task")
+
+        await self._prepare_position_task_bits(position, velocity, absolute)
+        await self.update_outputs()
+
+        if nonblocking:
+            return True
+
+        return await self.wait_for_position_motion_execution()
@@ -0,0 +1,98 @@
+"""Class definition containing asyncio telegram 111 execution functions."""
+
+import asyncio
+import time
+from edcon.utils.logging import Logging
+from edcon.edrive.diagnosis import fault_description
+from edcon.edrive.async_position_telegram_handler import AsyncPositionTelegramHandler
+from edcon.edrive.parameter import Parameter
+from edcon.edrive.parameter_mapping import ParameterMap
+from edcon.profidrive.telegram111 import Telegram111
+
+
+class AsyncTelegram111Handler(AsyncPositionTelegramHandler):
+    """Basic class for executing telegram 111 from an asyncio event loop.
+
+    Parameters:
+        com (AsyncComBase): asyncio communication driver
+        config_mode (str): configuration mode (None, "write", "validate")
+    """
+
+    def __init__(self, com, config_mode=None) -> None:
+        super().__init__(Telegram111(), com)
+        self.config_mode = config_mode
+
+    # pylint: disable=invalid-overridden-method
+    # The asyncio wait functions await the error string
+    async def fault_string(self) -> str:
+        """Returns string containing fault reason
+
+        Returns:
+            str: String containing the fault reason
+        """
+        return await self.await_fault_code()
+
+    async def start(self):
+        """Configures the telegram selection and starts the process data"""
+        parameter = Parameter.from_uid("P0.3030101.0.0", 111)
+        pnu = ParameterMap()[parameter.uid()].pnu
+        if self.config_mode == "write":
+            await self.com.write_pnu_raw(
+                pnu, parameter.subindex, value=parameter.value_raw
+            )
+        elif self.config_mode == "validate":
+            configured_value = await self.com.read_pnu(pnu, parameter.subindex)
+            assert configured_value == parameter.value, (
+                f"Incorrect value configured on {pnu} -> "
+                f"Expected: {parameter.value}, Actual: {configured_value}"
+            )
+        await super().start()
+
+    def _prepare_stop_motion_task_bits(self):
+        """Prepares the telegram bits for stopping the current motion"""
+        super()._prepare_stop_motion_task_bits()
+        # Reset referencing bits (in case referencing motion was performed)
+        self.telegram.pos_stw2.set_reference_point = False
+
+    async def _prepare_position_task_bits(
+        self, position: int, velocity: int, absolute: bool = False
+    ):
+        """Prepares the telegram bits for positioning task"""
+        await super()._prepare_position_task_bits(position, velocity, absolute)
+        self.telegram.pos_stw1.activate_mdi = True
+        self.telegram.pos_stw1.absolute_position = absolute
+
+    async def current_position(self):
+        """Read the current position
+
+        Returns:
+            int: Current position in user units
+        """
+        await self.update_inputs()
+        return self.telegram.xist_a.value
+
+    async def current_fault_code(self) -> int:
+        """Read the current fault code
+
+        Returns:
+            int: Current fault code
+        """
+        await self.update_inputs()
+        Logging.logger.info(f"Current fault code: {int(self.telegram.fault_code)}")
+        return int(self.telegram.fault_code)
+
+    async def await_fault_code(self, timeout=0.5):
+        """Waits for fault code to be available and produces log afterwards.
+
+        Returns:
+            str: Description of the fault (or why it could not be determined)
+        """
+        fault_code = 0
+        start_time = time.monotonic()
+        while not fault_code:
+            fault_code = await self.current_fault_code()
+            await asyncio.sleep(0.01)
+            if time.monotonic() - start_time > timeout:
+                return f"Fault reason could not be determined within {timeout} s"
+
+        return fault_description(fault_code)
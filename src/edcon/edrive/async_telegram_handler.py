@@ -0,0 +1,186 @@
+"""Class definition containing generic asyncio telegram execution functions."""
+
+from collections.abc import Callable
+from edcon.utils.logging import Logging
+from edcon.utils.func_helpers import async_func_sequence, async_wait_until
+from edcon.edrive.telegram_handler_base import TelegramHandlerBase
+
+
+class AsyncTelegramHandler(TelegramHandlerBase):
+    """Basic class for executing telegrams from an asyncio event loop.
+
+    The process data is started by awaiting start() (or using async with).
+    """
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, trc_bck):
+        await self.shutdown()
+
+    async def start(self):
+        """Starts the process data and performs a first update"""
+        await self.com.start_io()
+        await self.update_io()
+
+    async def shutdown(self):
+        """Tries to disable the powerstage and stops the communication"""
+        self.telegram.reset()
+        await self.com.send_io(self.telegram.output_bytes())
+        await self.com.shutdown()
+
+    async def update_inputs(self):
+        """Awaits current input process data and updates telegram"""
+        if not self.com.io_active():
+            raise ConnectionError("Connection of communication driver was interrupted")
+
+        self.telegram.input_bytes(await self.com.recv_io())
+
+    async def update_outputs(self):
+        """Writes current telegram value to output process data"""
+        if not self.com.io_active():
+            raise ConnectionError("Connection of communication driver was interrupted")
+
+        await self.com.send_io(self.telegram.output_bytes())
+
+    async def update_io(self):
+        """Updates process data in both directions (I/O)"""
+        await self.update_inputs()
+        await self.update_outputs()
+
+    async def wait_until_or_fault(
+        self,
+        cond,
+        timeout: float = 0.0,
+        info_string: Callable[[], str] = None,
+    ):
+        """Waits for condition to be met until fault is present."""
+        return await async_wait_until(
+            cond,
+            self.fault_present,
+            timeout=timeout,
+            **self._wait_arguments(info_string),
+        )
+
+    async def wait_until_or_not_operational(
+        self,
+        cond,
+        timeout: float = 0.0,
+        info_string: Callable[[], str] = None,
+    ):
+        """Waits for condition to be met until not_operational is present."""
+        return await async_wait_until(
+            cond,
+            self.not_operational,
+            timeout=timeout,
+            **self._wait_arguments(info_string),
+        )
+
+    def fault_present(self) -> bool:
+        """Gives information whether a fault is present (using last received inputs)
+
+        Returns:
+            bool: True if fault present, False otherwise
+        """
+        return self._fault_bit_present()
+
+    def not_operational(self) -> bool:
+        """Gives information whether drive is not operational (using last received inputs)
+
+        Returns:
+            bool: True if fault present or operation not enabled, False otherwise
+        """
+        return self._not_operational_bits_present()
+
+    async def plc_control_granted(self) -> bool:
+        """Gives information if PLC control is granted
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        Logging.logger.info("Check if PLC control is granted")
+
+        await self.update_inputs()
+        return self._plc_control_bit_granted()
+
+    async def ready_for_motion(self):
+        """Gives information if motion tasks can be started
+
+        Returns:
+            bool: True if drive is ready for motion tasks, False otherwise
+        """
+        if not await self.plc_control_granted():
+            return False
+        Logging.logger.info("Check if drive is ready for motion")
+        return self._ready_for_motion_bits_present()
+
+    async def acknowledge_faults(self, timeout: float = 5.0) -> bool:
+        """Send telegram to acknowledge present faults of the EDrive
+
+        Parameter:
+            timeout (float): time that should be waited for acknowledgement
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        Logging.logger.info("Acknowledge any present faults")
+
+        async def toggle_func(value):
+            self.telegram.stw1.fault_ack = value
+            await self.update_outputs()
+
+        await async_func_sequence(toggle_func, [True, False])
+
+        async def cond():
+            await self.update_inputs()
+            return not self.telegram.zsw1.fault_present
+
+        if not await self.wait_until_or_fault(cond, timeout=timeout):
+            return False
+
+        Logging.logger.info("=> No fault present")
+        return True
+
+    async def enable_powerstage(self, timeout: float = 10.0) -> bool:
+        """Send telegram to enable the power stage
+
+        Parameter:
+            timeout (float): time that should be waited for enabling
+
+        Returns:
+            bool: True if succesful, False otherwise
+        """
+        if not await self.plc_control_granted():
+            Logging.logger.error("Enabling powerstage is not possible")
+            return False
+        Logging.logger.info("Enable powerstage")
+
+        # Toggle to low (in case it is already True)
+        async def toggle_func(value):
+            self.telegram.stw1.on = value
+            await self.update_outputs()
+
+        await async_func_sequence(toggle_func, [False, True])
+
+        async def cond():
+            await self.update_inputs()
+            return self.telegram.zsw1.operation_enabled
+
+        return self._powerstage_result(
+            await self.wait_until_or_fault(cond, timeout=timeout), "enabled"
+        )
+
+    async def disable_powerstage(self, timeout: float = 5.0) -> bool:
+        """Send telegram to disable the power stage"""
+        Logging.logger.info("Disable powerstage")
+        self.telegram.stw1.on = False
+        await self.update_outputs()
+
+        async def cond():
+            await self.update_inputs()
+            return not self.telegram.zsw1.operation_enabled
+
+        return self._powerstage_result(
+            await self.wait_until_or_fault(cond, timeout=timeout), "disabled"
+        )
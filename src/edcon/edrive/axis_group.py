@@ -0,0 +1,228 @@
+"""
+Contains AxisGroup class which performs the i/o data exchange of multiple
+ComModbus connections in one common cycle.
+"""
+
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Condition, Lock
+from pymodbus.exceptions import ModbusException
+from edcon.utils.logging import Logging
+from edcon.edrive.com_modbus import IOThread
+
+logger = Logging.get_logger("com.modbus")
+
+
+class AxisGroup:
+    """Class to exchange the i/o data of multiple ComModbus connections
+    using a single i/o thread.
+
+    All connections of the group are served in the same cycle. Outputs provided
+    within synchronized() are applied to all axes in the same cycle, which allows
+    to start multi-axis motions simultaneously. A connection whose i/o data
+    exchange fails is removed from the group (its i/o is reported as inactive),
+    the remaining axes continue to be served.
+    """
+
+    def __init__(
+        self,
+        coms: list = None,
+        cycle_time: int = 10,
+        overrun_policy: str = "skip",
+        concurrent: bool = False,
+    ):
+        """Constructor of the AxisGroup class.
+
+        Parameters:
+            coms (list): ComModbus instances that should be added to the group
+            cycle_time (int): Cycle time (in ms) that should be used for I/O transfers
+            overrun_policy (str): One of ['skip', 'catch-up'], determines how the I/O thread
+                                  handles missed cycle deadlines (see IOThread)
+            concurrent (bool): If True, the transfers of the connections are performed
+                               concurrently using a thread pool. Otherwise they are
+                               performed sequentially in the order of the group.
+        """
+        self.coms = []
+        self.cycle_time = cycle_time
+        self.overrun_policy = overrun_policy
+        self.concurrent = concurrent
+
+        self.io_thread = None
+        self.executor = None
+        self.lock = Lock()
+        self.cycle_condition = Condition()
+        self.cycle_count = 0
+        self.frozen_out_data = None
+
+        for com in coms or []:
+            self.add(com)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trc_bck):
+        self.shutdown()
+
+    def add(self, com):
+        """Adds a connection to the group
+
+        Parameters:
+            com (ComModbus): Connection whose i/o data should be exchanged by the group
+        """
+        if com.io_thread is not None and com.io_thread.active:
+            raise ValueError("Connection has an active i/o thread")
+        with self.lock:
+            com.io_scheduler = self
+            self.coms.append(com)
+
+    def remove(self, com):
+        """Removes a connection from the group
+
+        Parameters:
+            com (ComModbus): Connection that should no longer be served by the group
+        """
+        with self.lock:
+            if com in self.coms:
+                self.coms.remove(com)
+            com.io_scheduler = None
+
+    def perform_io(self):
+        """Performs the i/o data exchange of all connections of the group"""
+        with self.lock:
+            coms = list(self.coms)
+            frozen_out_data = self.frozen_out_data
+
+        def exchange(com):
+            try:
+                if frozen_out_data is not None and com in frozen_out_data:
+                    com.perform_io(frozen_out_data[com])
+                else:
+                    com.perform_io()
+            except (ModbusException, OSError, AttributeError):
+                logger.error(traceback.format_exc())
+                return False
+            return True
+
+        if self.executor is not None:
+            results = list(self.executor.map(exchange, coms))
+        else:
+            results = [exchange(com) for com in coms]
+        for com, success in zip(coms, results):
+            if not success:
+                self._detach_failed(com)
+
+        with self.cycle_condition:
+            self.cycle_count += 1
+            self.cycle_condition.notify_all()
+
+    def _detach_failed(self, com):
+        """Removes a connection whose i/o data exchange failed from the group.
+        It gets an inactive i/o thread, so its users notice the interruption."""
+        logger.error("Removing connection from axis group after i/o failure")
+        self.remove(com)
+        com.io_thread = IOThread(com.perform_io, com.cycle_time, com.overrun_policy)
+
+    def wait_for_cycle(self, cycle: int, timeout: float = None) -> bool:
+        """Waits until the provided cycle has been completed
+
+        Parameters:
+            cycle (int): Cycle count that should be reached
+            timeout (float): Maximum time (in s) to wait
+
+        Returns:
+            bool: True if the cycle was completed, False on timeout
+        """
+        with self.cycle_condition:
+            return self.cycle_condition.wait_for(
+                lambda: self.cycle_count >= cycle, timeout
+            )
+
+    @contextmanager
+    def synchronized(self):
+        """Context manager which applies all outputs provided within the block
+        to all axes in the same cycle.
+
+        While the block is executed, the outputs present on entering are kept
+        on the bus. On leaving, the new outputs of all axes are written in the
+        next cycle and the call returns once this cycle has been completed.
+        """
+        with self.lock:
+            self.frozen_out_data = {com: com.out_data for com in self.coms}
+        try:
+            yield self
+        finally:
+            with self.cycle_condition:
+                # The cycle currently in progress may still use the frozen outputs
+                release_cycle = self.cycle_count + 2
+            with self.lock:
+                self.frozen_out_data = None
+            if self.io_active():
+                self.wait_for_cycle(release_cycle, timeout=self._wait_timeout())
+
+    def _wait_timeout(self) -> float:
+        """Returns the maximum time (in s) to wait for a cycle"""
+        return 10 * self.cycle_time * 0.001 + 1.0
+
+    def io_active(self) -> bool:
+        """Provides information about the status of the i/o thread."""
+        return self.io_thread is not None and self.io_thread.active
+
+    def io_statistics(self) -> dict:
+        """Provides timing statistics of the common i/o thread.
+
+        Returns:
+            dict: Containing cycles, overruns, achieved period and jitter (in ms)
+        """
+        if self.io_thread is None:
+            return None
+        return self.io_thread.statistics.summary()
+
+    def start_io(self) -> IOThread:
+        """Starts the common i/o thread (if not already running)
+
+        Returns:
+            IOThread: The i/o thread serving all connections of the group
+        """
+        with self.lock:
+            if self.io_active():
+                return self.io_thread
+            logger.info(
+                "Starting i/o thread for %s axes (cycle time: %s ms)",
+                len(self.coms),
+                self.cycle_time,
+            )
+            if self.concurrent:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=max(1, len(self.coms)),
+                    thread_name_prefix="edcon-axis-group",
+                )
+            self.io_thread = IOThread(
+                self.perform_io, self.cycle_time, self.overrun_policy
+            )
+            for com in self.coms:
+                com.io_thread = self.io_thread
+            self.io_thread.start()
+            return self.io_thread
+
+    def stop_io(self):
+        """Stops the common i/o thread"""
+        if self.io_thread is not None:
+            self.io_thread.stop()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def shutdown(self):
+        """Stops the common i/o thread and shuts down all connections of the group"""
+        with self.lock:
+            coms = list(self.coms)
+        for com in coms:
+            com.out_data = b"\x00" * len(com.out_data)
+        if self.io_active():
+            with self.cycle_condition:
+                cycle = self.cycle_count + 2
+            self.wait_for_cycle(cycle, timeout=self._wait_timeout())
+        self.stop_io()
+        for com in coms:
+            com.shutdown()
@@ -2,7 +2,97 @@
 
 from typing import Any
 from edcon.utils.logging import Logging
-from edcon.edrive.pnu_packing import pnu_pack, pnu_unpack
+from edcon.edrive.pnu_packing import (
+    pnu_pack,
+    pnu_unpack,
+    pnu_pack_many,
+    pnu_unpack_many,
+)
+
+logger = Logging.get_logger("com")
+
+
+def unpack_read_result(pnu: int, raw: bytes, forced_format=None) -> Any:
+    """Unpacks the result of a PNU read (logs an error if the read failed)
+
+    Returns:
+        Any: Unpacked value, None if the read failed
+    """
+    if raw:
+        param = pnu_unpack(pnu, raw, forced_format)
+        logger.info("Unpacked %s to %s", raw, param)
+
+        return param
+
+    logger.error("PNU %s read failed", pnu)
+    return None
+
+
+def pack_write_value(pnu: int, value: Any, forced_format=None) -> bytes:
+    """Packs a value that should be written to a PNU
+
+    Returns:
+        bytes: Raw value
+    """
+    raw = pnu_pack(pnu, value, forced_format)
+    logger.info("Packed %s to %s", value, raw)
+    return raw
+
+
+def check_write_result(pnu: int, status: bool) -> bool:
+    """Logs an error if a PNU write failed
+
+    Returns:
+        bool: Write status
+    """
+    if status:
+        return True
+    logger.error("PNU %s write failed", pnu)
+    return False
+
+
+def unpack_read_results(pnus: list, raw_list: list, forced_format=None) -> list:
+    """Unpacks the results of a bulk PNU read (logs an error for failed reads)
+
+    Parameters:
+        pnus (list): List of (pnu, subindex) tuples that were read
+        raw_list (list): Raw bytes for each PNU (None if the read failed)
+        forced_format (str): Optional format char (see struct) used for all PNUs
+
+    Returns:
+        list: Unpacked value for each provided PNU (None if the read failed)
+    """
+    for (pnu, _), raw in zip(pnus, raw_list):
+        if not raw:
+            logger.error("PNU %s read failed", pnu)
+    return pnu_unpack_many(
+        [(pnu, raw) for (pnu, _), raw in zip(pnus, raw_list)], forced_format
+    )
+
+
+def pack_write_values(pnus: list, forced_format=None) -> list:
+    """Packs the values of a bulk PNU write
+
+    Parameters:
+        pnus (list): List of (pnu, subindex, value) tuples that should be written
+        forced_format (str): Optional format char (see struct) used for all PNUs
+
+    Returns:
+        list: (pnu, subindex, raw value) tuples
+    """
+    raw_values = pnu_pack_many([(pnu, value) for pnu, _, value in pnus], forced_format)
+    return [(pnu, subindex, raw) for (pnu, subindex, _), raw in zip(pnus, raw_values)]
+
+
+def check_write_results(pnus: list, status_list: list) -> list:
+    """Logs an error for each failed PNU write of a bulk write
+
+    Returns:
+        list: Write status (bool) for each provided PNU
+    """
+    for (pnu, _, _), status in zip(pnus, status_list):
+        check_write_result(pnu, status)
+    return status_list
 
 
 class ComBase:
@@ -14,15 +104,7 @@ class ComBase:
 
     def read_pnu(self, pnu: int, subindex: int = 0, forced_format=None) -> Any:
         """Reads a PNU from the EDrive"""
-        raw = self.read_pnu_raw(pnu, subindex)
-        if raw:
-            param = pnu_unpack(pnu, raw, forced_format)
-            Logging.logger.info(f"Unpacked {raw} to {param}")
-
-            return param
-
-        Logging.logger.error(f"PNU {pnu} read failed")
-        return None
+        return unpack_read_result(pnu, self.read_pnu_raw(pnu, subindex), forced_format)
 
     def write_pnu_raw(
         self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
@@ -34,17 +116,72 @@ class ComBase:
         self, pnu: int, subindex: int = 0, value: Any = 0, forced_format=None
     ) -> bool:
         """Writes a value to a PNU to the EDrive"""
-        raw = pnu_pack(pnu, value, forced_format)
-        Logging.logger.info(f"Packed {value} to {raw}")
-        if self.write_pnu_raw(pnu, subindex, value=raw):
-            return True
-        Logging.logger.error(f"PNU {pnu} write failed")
-        return False
+        raw = pack_write_value(pnu, value, forced_format)
+        return check_write_result(pnu, self.write_pnu_raw(pnu, subindex, value=raw))
+
+    def read_pnus_raw(self, pnus: list) -> list:
+        """Reads multiple PNUs from the EDrive without interpreting the data
+
+        Parameters:
+            pnus (list): List of (pnu, subindex) tuples that should be read
+
+        Returns:
+            list: Raw bytes for each provided PNU (None if the read failed)
+        """
+        return [self.read_pnu_raw(pnu, subindex) for pnu, subindex in pnus]
+
+    def read_pnus(self, pnus: list, forced_format=None) -> list:
+        """Reads multiple PNUs from the EDrive
+
+        Parameters:
+            pnus (list): List of (pnu, subindex) tuples that should be read
+            forced_format (str): Optional format char (see struct) used for all PNUs
+
+        Returns:
+            list: Unpacked value for each provided PNU (None if the read failed)
+        """
+        return unpack_read_results(pnus, self.read_pnus_raw(pnus), forced_format)
+
+    def write_pnus_raw(self, pnus: list) -> list:
+        """Writes raw bytes to multiple PNUs on the EDrive
+
+        Parameters:
+            pnus (list): List of (pnu, subindex, value) tuples with raw bytes values
+
+        Returns:
+            list: Write status (bool) for each provided PNU
+        """
+        return [
+            self.write_pnu_raw(pnu, subindex, value=value)
+            for pnu, subindex, value in pnus
+        ]
+
+    def write_pnus(self, pnus: list, forced_format=None) -> list:
+        """Writes values to multiple PNUs on the EDrive
+
+        Parameters:
+            pnus (list): List of (pnu, subindex, value) tuples that should be written
+            forced_format (str): Optional format char (see struct) used for all PNUs
+
+        Returns:
+            list: Write status (bool) for each provided PNU
+        """
+        raw_pnus = pack_write_values(pnus, forced_format)
+        return check_write_results(raw_pnus, self.write_pnus_raw(raw_pnus))
 
     def io_active(self):
         """Provides information about connection status."""
         raise NotImplementedError
 
+    def io_cycle_event(self):
+        """Provides the event which is set (or condition which is notified)
+        whenever an i/o data cycle was executed.
+
+        Returns:
+            Event: Event or Condition of the i/o data process, None if not available
+        """
+        return None
+
     def start_io(self):
         """Configures and starts i/o data process"""
 
@@ -0,0 +1,218 @@
+"""
+Contains CachedCom class which wraps a communication driver and caches the
+results of PNU reads.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from edcon.utils.logging import Logging
+from edcon.edrive.com_base import ComBase
+
+logger = Logging.get_logger("com")
+
+# Cached values of PNUs with this TTL only expire when they are written or invalidated
+TTL_STATIC = None
+
+# Configuration PNUs which are read repeatedly but only change when they are written
+DEFAULT_TTL_POLICIES = {
+    3490: TTL_STATIC,  # telegramSelection (P0.3030101.0.0)
+    11724: TTL_STATIC,  # prefixPosition
+    11725: TTL_STATIC,  # prefixVelocity
+    12345: TTL_STATIC,  # velocityReference
+}
+
+
+class CachedCom(ComBase):
+    """Class which wraps a communication driver and caches the results of PNU reads.
+
+    Read values are cached per (pnu, subindex, num_elements) for the TTL of the PNU.
+    A TTL of TTL_STATIC (None) never expires, a TTL of 0 disables caching of the PNU
+    (e.g. for live values). All cached values of a PNU are invalidated when the PNU is
+    written using this instance. If more than max_entries values are cached, the least
+    recently used ones are evicted. All other attributes are provided by the wrapped driver.
+    """
+
+    def __init__(
+        self,
+        com: ComBase,
+        default_ttl: float = 0.0,
+        ttl_policies: dict = None,
+        max_entries: int = 1024,
+    ):
+        """Constructor of the CachedCom class.
+
+        Parameters:
+            com (ComBase): Communication driver whose PNU reads should be cached
+            default_ttl (float): TTL (in s) of PNUs without a policy, 0 disables caching
+            ttl_policies (dict): TTL (in s) per PNU (default: DEFAULT_TTL_POLICIES)
+            max_entries (int): Maximum number of cached values
+        """
+        self.com = com
+        self.default_ttl = default_ttl
+        self.ttl_policies = (
+            DEFAULT_TTL_POLICIES if ttl_policies is None else dict(ttl_policies)
+        )
+        self.max_entries = max_entries
+
+        # (pnu, subindex, num_elements) -> (expiry time or None, raw value)
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Incremented on invalidation, values read before are not stored afterwards
+        self.generation = 0
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the cache, e.g. device_info
+        if name == "com":
+            raise AttributeError(name)
+        return getattr(self.com, name)
+
+    def ttl(self, pnu: int) -> float:
+        """Returns the TTL (in s) used for the provided PNU
+
+        Returns:
+            float: TTL in s, None if the value never expires
+        """
+        return self.ttl_policies.get(pnu, self.default_ttl)
+
+    def _lookup(self, key: tuple, now: float) -> bytes:
+        """Returns the cached value for the key (None if missing or expired).
+        Must be called with the lock held."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            expiry, value = entry
+            if expiry is None or now < expiry:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self.entries[key]
+        self.misses += 1
+        return None
+
+    def _store(self, key: tuple, value: bytes, now: float):
+        """Caches a read value according to the TTL of its PNU.
+        Must be called with the lock held."""
+        ttl = self.ttl(key[0])
+        if value is None or (ttl is not None and ttl <= 0):
+            return
+        self.entries[key] = (None if ttl is None else now + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, pnu: int = None):
+        """Removes cached values
+
+        Parameters:
+            pnu (int): PNU whose values should be removed (default: all PNUs)
+        """
+        with self.lock:
+            self.generation += 1
+            if pnu is None:
+                self.entries.clear()
+                return
+            for key in [key for key in self.entries if key[0] == pnu]:
+                del self.entries[key]
+
+    def statistics(self) -> dict:
+        """Provides the counters of the cache.
+
+        Returns:
+            dict: Containing hits, misses, evictions, number of entries and hit rate
+        """
+        with self.lock:
+            reads = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "hit_rate": self.hits / reads if reads else 0.0,
+            }
+
+    def read_pnu_raw(self, pnu: int, subindex: int = 0, num_elements: int = 1) -> bytes:
+        """Reads a PNU from the cache or (if not cached) from the EDrive"""
+        key = (pnu, subindex, num_elements)
+        with self.lock:
+            value = self._lookup(key, time.monotonic())
+            generation = self.generation
+        if value is not None:
+            logger.debug("PNU %s (subindex: %s) read from cache", pnu, subindex)
+            return value
+
+        value = self.com.read_pnu_raw(pnu, subindex, num_elements)
+        with self.lock:
+            if generation == self.generation:
+                self._store(key, value, time.monotonic())
+        return value
+
+    def write_pnu_raw(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
+    ) -> bool:
+        """Writes raw bytes to a PNU on the EDrive and invalidates its cached values"""
+        try:
+            return self.com.write_pnu_raw(pnu, subindex, num_elements, value)
+        finally:
+            # Also invalidate on failure, the state of the PNU is unknown
+            self.invalidate(pnu)
+
+    def read_pnus_raw(self, pnus: list) -> list:
+        """Reads multiple PNUs, PNUs that are not cached are read using one bulk
+        access of the wrapped driver"""
+        now = time.monotonic()
+        with self.lock:
+            values = [self._lookup((pnu, subindex, 1), now) for pnu, subindex in pnus]
+            generation = self.generation
+        missing = [index for index, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+
+        read_values = self.com.read_pnus_raw([pnus[index] for index in missing])
+        now = time.monotonic()
+        with self.lock:
+            for index, value in zip(missing, read_values):
+                values[index] = value
+                if generation == self.generation:
+                    self._store((*pnus[index], 1), value, now)
+        return values
+
+    def write_pnus_raw(self, pnus: list) -> list:
+        """Writes raw bytes to multiple PNUs and invalidates their cached values"""
+        try:
+            return self.com.write_pnus_raw(pnus)
+        finally:
+            for pnu in {pnu for pnu, _, _ in pnus}:
+                self.invalidate(pnu)
+
+    def io_active(self):
+        """Provides information about connection status."""
+        return self.com.io_active()
+
+    def io_cycle_event(self):
+        """Provides the i/o cycle event of the wrapped driver"""
+        return self.com.io_cycle_event()
+
+    def start_io(self):
+        """Configures and starts i/o data process"""
+        return self.com.start_io()
+
+    def stop_io(self):
+        """Stops i/o data process"""
+        return self.com.stop_io()
+
+    def send_io(self, data: bytes, nonblocking: bool = False):
+        """Sends data to the output"""
+        return self.com.send_io(data, nonblocking)
+
+    def recv_io(self, nonblocking: bool = False) -> bytes:
+        """Receives data from the input"""
+        return self.com.recv_io(nonblocking)
+
+    def shutdown(self):
+        """Clears the cache and shuts down the wrapped driver"""
+        self.invalidate()
+        self.com.shutdown()
@@ -0,0 +1,363 @@
+"""
+Contains ComDaemon class which keeps connections to EDrive devices open and
+serves them to other processes via a Unix socket, and ComDaemonClient class
+which uses such a connection with the common communication driver interface.
+
+Each request is a JSON object on a single line containing the IP address,
+the bus type, the method that should be executed and its arguments. The
+daemon answers with a JSON object containing either the result or an error.
+Bytes are transferred as hex strings.
+"""
+
+import getpass
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import traceback
+from threading import RLock
+from pymodbus.exceptions import ModbusException
+from edcon.utils.logging import Logging
+from edcon.edrive.com_base import ComBase
+
+logger = Logging.get_logger("com.daemon")
+
+# Methods of the communication drivers that can be executed by the daemon
+REMOTE_METHODS = {
+    "read_pnu_raw",
+    "write_pnu_raw",
+    "read_pnus_raw",
+    "write_pnus_raw",
+    "io_active",
+    "start_io",
+    "stop_io",
+    "send_io",
+    "recv_io",
+    "release",
+}
+
+
+def default_socket_path() -> str:
+    """Returns the default path of the daemon socket of the current user"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"festo-edcon-{getpass.getuser()}.sock")
+
+
+def encode_value(value):
+    """Converts a value to a JSON serializable representation (bytes as hex)"""
+    if isinstance(value, (bytes, bytearray)):
+        return {"bytes": value.hex()}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    return value
+
+
+def decode_value(value):
+    """Converts a value created by encode_value back to its original representation"""
+    if isinstance(value, dict):
+        return bytes.fromhex(value["bytes"])
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    return value
+
+
+class ComDaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Handles the requests of a single client connection"""
+
+    def setup(self):
+        super().setup()
+        self.io_keys = set()
+
+    def handle(self):
+        for line in self.rfile:
+            response = self.handle_request(line)
+            self.wfile.write(json.dumps(response).encode("ascii") + b"\n")
+            self.wfile.flush()
+
+    def handle_request(self, line: bytes) -> dict:
+        """Decodes and executes a single request line, returns the response"""
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            logger.error("Malformed request: %s", error)
+            return {"error": f"Malformed request: {error}"}
+        if not isinstance(request, dict):
+            return {"error": "Malformed request: Expected a JSON object"}
+        response = self.server.com_daemon.execute(request)
+        key = self.server.com_daemon.connection_key(request)
+        if request.get("method") == "start_io":
+            self.io_keys.add(key)
+        elif request.get("method") in ["stop_io", "release"]:
+            self.io_keys.discard(key)
+        return response
+
+    def finish(self):
+        # Stop the i/o data of clients that disconnected without releasing it
+        for key in self.io_keys:
+            self.server.com_daemon.release(key)
+        super().finish()
+
+
+class ComDaemon:
+    """Class that keeps connections to EDrive devices open and serves them
+    to other processes via a Unix socket.
+
+    Connections are created on the first request for an IP address and
+    reused by all following requests. A connection is closed and created
+    again if a request fails. Requests are executed one at a time, so the
+    requests of different clients never interleave on a connection (e.g.
+    within a PNU mailbox transaction).
+    """
+
+    def __init__(self, com_factory, socket_path: str = None):
+        """Constructor of the ComDaemon class.
+
+        Parameters:
+            com_factory (Callable): Creates a communication driver from (ip_address, ethernetip)
+            socket_path (str): Path of the Unix socket (default: default_socket_path())
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.com_factory = com_factory
+        self.coms = {}
+        self.io_started = set()
+        # Serializes the requests of all clients (reentrant for release and close)
+        self.lock = RLock()
+        self.server = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, trc_bck):
+        self.shutdown()
+
+    @staticmethod
+    def connection_key(request: dict) -> tuple:
+        """Returns the key identifying the connection used by a request"""
+        return (request.get("ip_address"), bool(request.get("ethernetip", False)))
+
+    def connection(self, key: tuple) -> ComBase:
+        """Returns the open connection for the provided key (created if necessary)"""
+        with self.lock:
+            if key not in self.coms:
+                logger.info("Open connection to %s", key[0])
+                self.coms[key] = self.com_factory(*key)
+            return self.coms[key]
+
+    def close(self, key: tuple):
+        """Closes the connection for the provided key"""
+        with self.lock:
+            com = self.coms.pop(key, None)
+            self.io_started.discard(key)
+        if com is not None:
+            logger.info("Close connection to %s", key[0])
+            com.shutdown()
+
+    def release(self, key: tuple):
+        """Stops the i/o data of the connection for the provided key (if started)"""
+        with self.lock:
+            if key not in self.io_started:
+                return
+            self.io_started.discard(key)
+            self.coms[key].stop_io()
+
+    def execute(self, request: dict) -> dict:
+        """Executes a request on the corresponding connection
+
+        Parameters:
+            request (dict): Containing ip_address, ethernetip, method and args
+
+        Returns:
+            dict: Containing the result or an error message
+        """
+        key = self.connection_key(request)
+        method = request.get("method")
+        if method not in REMOTE_METHODS:
+            return {"error": f"Method {method} is not supported"}
+        with self.lock:
+            try:
+                com = self.connection(key)
+                if method == "release":
+                    self.release(key)
+                    return {"result": None}
+                result = getattr(com, method)(*decode_value(request.get("args", [])))
+                if method == "start_io":
+                    self.io_started.add(key)
+                elif method == "stop_io":
+                    self.io_started.discard(key)
+                return {"result": encode_value(result)}
+            except (
+                ModbusException,
+                ValueError,
+                KeyError,
+                TypeError,
+                ConnectionError,
+                OSError,
+            ) as error:
+                # TypeError is raised by requests with malformed arguments
+                logger.error(traceback.format_exc())
+                self.close(key)
+                return {"error": f"{type(error).__name__}: {error}"}
+
+    def serve_forever(self):
+        """Listens on the Unix socket and serves requests until shutdown() is called"""
+        if os.path.exists(self.socket_path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                if sock.connect_ex(self.socket_path) == 0:
+                    raise RuntimeError(f"Daemon already running on {self.socket_path}")
+            # Remove stale socket of a daemon that was not shut down properly
+            os.unlink(self.socket_path)
+
+        # Only the current user may connect, the socket is created with mode 0o600
+        umask = os.umask(0o177)
+        try:
+            self.server = socketserver.ThreadingUnixStreamServer(
+                self.socket_path, ComDaemonRequestHandler
+            )
+        finally:
+            os.umask(umask)
+        self.server.daemon_threads = True
+        self.server.com_daemon = self
+        logger.info("Daemon listening on %s", self.socket_path)
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self.server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def shutdown(self):
+        """Stops serving requests and closes all connections"""
+        if self.server is not None:
+            self.server.shutdown()
+        with self.lock:
+            keys = list(self.coms)
+        for key in keys:
+            self.release(key)
+            self.close(key)
+
+
+class ComDaemonClient(ComBase):
+    """Class to communicate with EDrive devices using a connection of a ComDaemon."""
+
+    def __init__(
+        self, ip_address, ethernetip: bool = False, socket_path: str = None
+    ) -> None:
+        """Constructor of the ComDaemonClient class.
+
+        Parameters:
+            ip_address (str): Required IP address as string e.g. ('192.168.0.1')
+            ethernetip (bool): If True, the daemon uses EtherNet/IP instead of ModbusTCP
+            socket_path (str): Path of the daemon socket (default: default_socket_path())
+
+        Raises:
+            OSError: If the daemon is not reachable
+        """
+        self.ip_address = ip_address
+        self.ethernetip = ethernetip
+        self.socket_path = socket_path or default_socket_path()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.sock.connect(self.socket_path)
+        except OSError:
+            self.sock.close()
+            self.sock = None
+            raise
+        self.file = self.sock.makefile("rwb")
+
+    def __del__(self):
+        self.shutdown()
+
+    def call(self, method: str, *args):
+        """Executes a method of the communication driver within the daemon
+
+        Parameters:
+            method (str): Name of the method (see REMOTE_METHODS)
+            args: Arguments of the method
+
+        Returns:
+            Any: Return value of the method
+        """
+        if self.sock is None:
+            raise ConnectionError("Connection to daemon is closed")
+        request = {
+            "ip_address": self.ip_address,
+            "ethernetip": self.ethernetip,
+            "method": method,
+            "args": encode_value(args),
+        }
+        self.file.write(json.dumps(request).encode("ascii") + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("Connection to daemon was closed")
+        response = json.loads(line)
+        if "error" in response:
+            raise ConnectionError(response["error"])
+        return decode_value(response["result"])
+
+    def shutdown(self):
+        """Stops the i/o data process and closes the connection to the daemon.
+        The connection of the daemon to the EDrive stays open."""
+        if getattr(self, "sock", None) is None:
+            return
+        try:
+            self.call("release")
+        except OSError:
+            # The daemon is not reachable anymore, nothing to release
+            pass
+        try:
+            self.file.close()
+        except OSError:
+            pass
+        self.sock.close()
+        self.sock = None
+
+    def read_pnu_raw(self, pnu: int, subindex: int = 0, num_elements: int = 1) -> bytes:
+        """Reads a PNU from the EDrive without interpreting the data"""
+        return self.call("read_pnu_raw", pnu, subindex, num_elements)
+
+    def write_pnu_raw(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
+    ) -> bool:
+        """Writes raw bytes to a PNU on the EDrive"""
+        return self.call("write_pnu_raw", pnu, subindex, num_elements, value)
+
+    def read_pnus_raw(self, pnus: list) -> list:
+        """Reads multiple PNUs from the EDrive without interpreting the data"""
+        return self.call("read_pnus_raw", pnus)
+
+    def write_pnus_raw(self, pnus: list) -> list:
+        """Writes raw bytes to multiple PNUs on the EDrive"""
+        return self.call("write_pnus_raw", pnus)
+
+    def io_active(self):
+        """Provides information about connection status."""
+        return self.call("io_active")
+
+    def start_io(self):
+        """Configures and starts i/o data process"""
+        self.call("start_io")
+
+    def stop_io(self):
+        """Stops i/o data process"""
+        self.call("stop_io")
+
+    def send_io(self, data: bytes, nonblocking: bool = False):
+        """Sends data to the output
+
+        Parameters:
+            nonblocking (bool): If True, function returns immediately.
+                                Otherwise function awaits I/O thread to be executed.
+        """
+        self.call("send_io", data, nonblocking)
+
+    def recv_io(self, nonblocking: bool = False) -> bytes:
+        """Receives data from the input
+
+        Parameters:
+            nonblocking (bool): If True, function returns immediately.
+                                Otherwise function awaits I/O thread to be executed.
+        """
+        return self.call("recv_io", nonblocking)
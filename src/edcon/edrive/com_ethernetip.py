@@ -5,18 +5,206 @@ This implementation uses the python-ethernetip library by
 Sebastian Block (https://codeberg.org/paperwork/python-ethernetip)
 """
 
-import time
+import functools
+import select
+from threading import Condition, RLock
 import ethernetip
 
 from edcon.utils.logging import Logging
 from edcon.utils.boollist import bytes_to_boollist, boollist_to_bytes
 from edcon.edrive.com_base import ComBase
 
+logger = Logging.get_logger("com.ethernetip")
+
 O_T_STD_PROCESS_DATA = 100  # Originator to Target
 T_O_STD_PROCESS_DATA = 101  # Target to Originator
 O_T_EXT_PROCESS_DATA = 110  # Originator to Target
 T_O_EXT_PROCESS_DATA = 111  # Target to Originator
 
+CIP_OBJ_MESSAGE_ROUTER = 0x02
+CIP_OBJ_PNU = 0x401
+CIP_SRV_MULTIPLE_SERVICE_PACKET = 0x0A
+CIP_SRV_GET_ATTR_SINGLE = 0x0E
+CIP_SRV_SET_ATTR_SINGLE = 0x10
+CIP_STATUS_SUCCESS = 0x00
+CIP_STATUS_EMBEDDED_SERVICE_ERROR = 0x1E
+
+# Number of cycles after which blocking I/O calls give up waiting for a new frame
+IO_WAIT_TIMEOUT_CYCLES = 10
+
+# Maximum number of PNU requests packed into one Multiple Service Packet
+# (keeps the explicit message below the unconnected message size limit)
+MULTIPLE_SERVICE_PACKET_MAX_REQUESTS = 16
+
+
+def pack_multiple_service_request(requests: list) -> bytes:
+    """Packs explicit requests into the data of a CIP Multiple Service Packet
+
+    Parameters:
+        requests (list): List of (service, request path + data) tuples
+
+    Returns:
+        bytes: Request data (number of services, offsets and embedded requests)
+    """
+    # Offsets are relative to the start of the number of services field
+    offset = 2 + 2 * len(requests)
+    offsets = b""
+    embedded = b""
+    for service, request in requests:
+        offsets += offset.to_bytes(2, "little")
+        embedded += bytes([service]) + request
+        offset += 1 + len(request)
+    return len(requests).to_bytes(2, "little") + offsets + embedded
+
+
+def unpack_multiple_service_response(data: bytes) -> list:
+    """Unpacks the data of a CIP Multiple Service Packet response
+
+    Parameters:
+        data (bytes): Response data (number of replies, offsets and embedded replies)
+
+    Returns:
+        list: (status, data) tuple for each embedded reply
+    """
+    num_replies = int.from_bytes(data[0:2], "little")
+    offsets = [
+        int.from_bytes(data[2 + 2 * i : 4 + 2 * i], "little")
+        for i in range(num_replies)
+    ] + [len(data)]
+    replies = []
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        # Reply: service, reserved, general status, additional status size (words)
+        data_start = start + 4 + 2 * data[start + 3]
+        replies.append((data[start + 2], data[data_start:end]))
+    return replies
+
+
+def pnu_transaction(func):
+    """Decorator which executes a method of ComEthernetip while holding its PNU lock.
+
+    PNU accesses use explicit messages on the shared session of the connection,
+    so requests and replies of different threads must not interleave.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.pnu_lock:
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+class NotifyingExpConnection(ethernetip.EtherNetIPExpConnection):
+    """Explicit connection which notifies waiting threads about i/o frames.
+
+    Every produced (O->T) and consumed (T->O) frame increments a counter,
+    wakes up all threads waiting on the io_condition and calls the
+    registered frame_callbacks (from the i/o thread).
+    """
+
+    # pylint: disable=invalid-name
+    # Method names are defined by python-ethernetip
+
+    def __init__(self, ipaddr):
+        super().__init__(ipaddr)
+        self.io_condition = Condition()
+        self.produce_started = 0
+        self.produced = 0
+        self.consumed = 0
+        self.frame_callbacks = []
+
+    def _notify_frame(self):
+        """Notifies waiting threads and callbacks about a new frame"""
+        self.io_condition.notify_all()
+        for callback in self.frame_callbacks:
+            callback()
+
+    def sendUdpIO(self, runidle=True):
+        """Produces one O->T frame and notifies waiting threads"""
+        with self.io_condition:
+            self.produce_started += 1
+            frame = self.produce_started
+        super().sendUdpIO(runidle)
+        with self.io_condition:
+            self.produced = frame
+            self._notify_frame()
+
+    def set_output(self, boollist: list) -> int:
+        """Sets the output assembly
+
+        Returns:
+            int: Number of the first frame that contains the new output data
+        """
+        with self.io_condition:
+            self.outAssem = boollist
+            return self.produce_started + 1
+
+    def set_input(self, boollist: list):
+        """Updates the input assembly in place and notifies waiting threads"""
+        with self.io_condition:
+            self.inAssem[:] = boollist
+            self.consumed += 1
+            self._notify_frame()
+
+    def wait_for_produced(self, frame: int, timeout: float = None) -> bool:
+        """Waits until the provided O->T frame has been produced
+
+        Returns:
+            bool: True if frame was produced, False on timeout
+        """
+        with self.io_condition:
+            return self.io_condition.wait_for(lambda: self.produced >= frame, timeout)
+
+    def wait_for_consumed(self, timeout: float = None) -> bool:
+        """Waits until the next T->O frame has been consumed
+
+        Returns:
+            bool: True if a new frame was consumed, False on timeout
+        """
+        with self.io_condition:
+            frame = self.consumed + 1
+            return self.io_condition.wait_for(lambda: self.consumed >= frame, timeout)
+
+
+class NotifyingEtherNetIP(ethernetip.EtherNetIP):
+    """EtherNet/IP class whose connections notify about i/o frames."""
+
+    # pylint: disable=invalid-name
+    # Method names are defined by python-ethernetip
+
+    def explicit_conn(self, ipaddr=None):
+        """Creates an explicit connection notifying about i/o frames"""
+        if ipaddr is None:
+            ipaddr = self.ip
+        exp = NotifyingExpConnection(ipaddr)
+        self.explicit.append(exp)
+        return exp
+
+    def listenUDP(self):
+        """Receives T->O frames and updates the input assemblies of the connections"""
+        while self.io_state == 1:
+            readable, _, _ = select.select([self.udpsock], [], [], 2)
+            if not readable:
+                continue
+            try:
+                buf, addr = self.udpsock.recvfrom(1024)
+            except OSError:
+                # If the socket is closed asynchronously, recv fails
+                if self.io_state == 0:
+                    return
+                raise
+
+            pkt = ethernetip.UdpRecvDataPacket(buf)
+            # pylint: disable=no-member
+            # Members are generated by dpkt
+            for conn, iotype, bits in self.assembly.values():
+                if (
+                    conn.ipaddr == addr[0]
+                    and iotype == ethernetip.EtherNetIP.ENIP_IO_TYPE_INPUT
+                    and pkt.conn_id == conn.toconnid
+                ):
+                    conn.set_input(bytes_to_boollist(pkt.data, len(bits) // 8))
+
 
 class EtherNetIPSingleton:
     """Class to lazyly create an EtherNet/IP singleton object."""
@@ -30,7 +218,7 @@ class EtherNetIPSingleton:
     def get_instance(cls):
         """If no instace exists yet, create one. Returns instance."""
         if not cls.__instance:
-            cls.__instance = ethernetip.EtherNetIP()
+            cls.__instance = NotifyingEtherNetIP()
         return cls.__instance
 
 
@@ -45,7 +233,8 @@ class ComEthernetip(ComBase):
             cycle_time (int): Cycle time (in ms) that should be used for I/O transfers
         """
         self.cycle_time = cycle_time
-        Logging.logger.info(f"Starting EtherNet/IP connection on {ip_address}")
+        self.pnu_lock = RLock()
+        logger.info("Starting EtherNet/IP connection on %s", ip_address)
         self.eip = EtherNetIPSingleton.get_instance()
 
         self.connection = self.eip.explicit_conn(ip_address)
@@ -54,8 +243,8 @@ class ComEthernetip(ComBase):
         # Read product name
         pkt = self.connection.listID()
         if pkt:
-            Logging.logger.info(
-                f"Product name: {pkt.product_name.decode()}"
+            logger.info(
+                "Product name: %s", pkt.product_name.decode()
             )  # pylint: disable=no-member
 
         # read process data input size of EDrive from global system object
@@ -63,8 +252,8 @@ class ComEthernetip(ComBase):
         status, attribute = self.connection.getAttrSingle(0x4, O_T_STD_PROCESS_DATA, 4)
         if status == 0:
             self.outsize = int.from_bytes(attribute, "little")
-            Logging.logger.info(
-                f"Process data input size (data: {attribute}): {self.outsize}"
+            logger.info(
+                "Process data input size (data: %s): %s", attribute, self.outsize
             )
 
         # read process data output size of EDrive from global system object
@@ -72,8 +261,8 @@ class ComEthernetip(ComBase):
         status, attribute = self.connection.getAttrSingle(0x4, T_O_STD_PROCESS_DATA, 4)
         if status == 0:
             self.insize = int.from_bytes(attribute, "little")
-            Logging.logger.info(
-                f"Process data output size (data: {attribute}): {self.insize}"
+            logger.info(
+                "Process data output size (data: %s): %s", attribute, self.insize
             )
 
         # read extended process data input size of EDrive from global system object
@@ -81,8 +270,10 @@ class ComEthernetip(ComBase):
         status, attribute = self.connection.getAttrSingle(0x4, O_T_EXT_PROCESS_DATA, 4)
         if status == 0:
             self.epd_outsize = int.from_bytes(attribute, "little")
-            Logging.logger.info(
-                f"Extended process data input size (data: {attribute}): {self.epd_outsize}"
+            logger.info(
+                "Extended process data input size (data: %s): %s",
+                attribute,
+                self.epd_outsize,
             )
 
         # read extended process data output size of EDrive from global system object
@@ -90,8 +281,10 @@ class ComEthernetip(ComBase):
         status, attribute = self.connection.getAttrSingle(0x4, T_O_EXT_PROCESS_DATA, 4)
         if status == 0:
             self.epd_insize = int.from_bytes(attribute, "little")
-            Logging.logger.info(
-                f"Extended process data output size (data: {attribute}): {self.epd_insize}"
+            logger.info(
+                "Extended process data output size (data: %s): %s",
+                attribute,
+                self.epd_insize,
             )
 
     def __del__(self):
@@ -102,18 +295,20 @@ class ComEthernetip(ComBase):
         if hasattr(self, "eip") and hasattr(self, "connection"):
             self.stop_io()
 
+    @pnu_transaction
     def read_pnu_raw(self, pnu: int, subindex: int = 0, num_elements: int = 1) -> bytes:
         """Reads a PNU from the EDrive without interpreting the data"""
         # read the PNU (CIP obj 0x401, inst {pnu}, attr {subindex})
         status, data = self.connection.getAttrSingle(0x401, pnu, subindex)
         if status != 0:
-            Logging.logger.error(f"Error reading PNU {pnu}, status: {status}")
+            logger.error("Error reading PNU %s, status: %s", pnu, status)
             return None
-        Logging.logger.info(
-            f"Successful read of PNU {pnu} (subindex: {subindex}): {data})"
+        logger.info(
+            "Successful read of PNU %s (subindex: %s): %s)", pnu, subindex, data
         )
         return data
 
+    @pnu_transaction
     def write_pnu_raw(
         self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
     ) -> bool:
@@ -122,24 +317,137 @@ class ComEthernetip(ComBase):
         status, data = self.connection.setAttrSingle(0x401, pnu, subindex, value)
 
         if status != 0:
-            Logging.logger.error(
-                f"Error writing PNU {pnu}, status: {status}, data: {data}"
+            logger.error(
+                "Error writing PNU %s, status: %s, data: %s", pnu, status, data
             )
             return False
 
-        Logging.logger.info(
-            f"Successful write of PNU {pnu} (subindex: {subindex}): {value} "
+        logger.info(
+            "Successful write of PNU %s (subindex: %s): %s ", pnu, subindex, value
         )
         return True
 
+    def _multiple_service_request(self, requests: list) -> list:
+        """Sends multiple explicit requests within one CIP Multiple Service Packet
+
+        Parameters:
+            requests (list): List of (service, request path + data) tuples
+
+        Returns:
+            list: (status, data) tuple for each request or None if the packet failed
+                  or the number of replies differs from the number of requests
+        """
+        path = self.connection.mkReqPath(CIP_OBJ_MESSAGE_ROUTER, 1, None)
+        ret = self.connection.unconnSend(
+            CIP_SRV_MULTIPLE_SERVICE_PACKET,
+            path + pack_multiple_service_request(requests),
+        )
+        if ret is None:
+            return None
+        status, data = ret
+        if status not in (CIP_STATUS_SUCCESS, CIP_STATUS_EMBEDDED_SERVICE_ERROR):
+            logger.info("Multiple service packet failed, status: %s", status)
+            return None
+        replies = unpack_multiple_service_response(data)
+        if len(replies) != len(requests):
+            # Replies can not be assigned to the requests reliably
+            logger.error(
+                "Multiple service packet returned %s replies for %s requests",
+                len(replies),
+                len(requests),
+            )
+            return None
+        return replies
+
+    @pnu_transaction
+    def read_pnus_raw(self, pnus: list) -> list:
+        """Reads multiple PNUs from the EDrive without interpreting the data.
+
+        The requests are packed into CIP Multiple Service Packets. If the
+        device rejects the packet (or the replies do not match the requests)
+        the PNUs are read one by one.
+        """
+        data_list = []
+        for i in range(0, len(pnus), MULTIPLE_SERVICE_PACKET_MAX_REQUESTS):
+            chunk = pnus[i : i + MULTIPLE_SERVICE_PACKET_MAX_REQUESTS]
+            replies = self._multiple_service_request(
+                [
+                    (
+                        CIP_SRV_GET_ATTR_SINGLE,
+                        self.connection.mkReqPath(CIP_OBJ_PNU, pnu, subindex),
+                    )
+                    for pnu, subindex in chunk
+                ]
+            )
+            if replies is None:
+                data_list += super().read_pnus_raw(chunk)
+                continue
+
+            for (pnu, subindex), (status, data) in zip(chunk, replies):
+                if status != 0:
+                    logger.error("Error reading PNU %s, status: %s", pnu, status)
+                    data_list.append(None)
+                    continue
+                logger.info(
+                    "Successful read of PNU %s (subindex: %s): %s)", pnu, subindex, data
+                )
+                data_list.append(data)
+        return data_list
+
+    @pnu_transaction
+    def write_pnus_raw(self, pnus: list) -> list:
+        """Writes raw bytes to multiple PNUs on the EDrive.
+
+        The requests are packed into CIP Multiple Service Packets. If the
+        device rejects the packet (or the replies do not match the requests)
+        the PNUs are written one by one.
+        """
+        status_list = []
+        for i in range(0, len(pnus), MULTIPLE_SERVICE_PACKET_MAX_REQUESTS):
+            chunk = pnus[i : i + MULTIPLE_SERVICE_PACKET_MAX_REQUESTS]
+            replies = self._multiple_service_request(
+                [
+                    (
+                        CIP_SRV_SET_ATTR_SINGLE,
+                        self.connection.mkReqPath(CIP_OBJ_PNU, pnu, subindex) + value,
+                    )
+                    for pnu, subindex, value in chunk
+                ]
+            )
+            if replies is None:
+                status_list += super().write_pnus_raw(chunk)
+                continue
+
+            for (pnu, subindex, value), (status, data) in zip(chunk, replies):
+                if status != 0:
+                    logger.error(
+                        "Error writing PNU %s, status: %s, data: %s", pnu, status, data
+                    )
+                    status_list.append(False)
+                    continue
+                logger.info(
+                    "Successful write of PNU %s (subindex: %s): %s ",
+                    pnu,
+                    subindex,
+                    value,
+                )
+                status_list.append(True)
+        return status_list
+
     def io_active(self):
         """Provides information about connection status."""
         return self.eip.io_state and self.connection.prod_state
 
+    def io_cycle_event(self):
+        """Provides the condition which is notified on every produced or consumed frame."""
+        return self.connection.io_condition
+
     def start_io(self):
         """Configures and starts i/o data process"""
-        Logging.logger.info(
-            f"Configure i/o data with {self.insize} input bytes and {self.outsize} output bytes"
+        logger.info(
+            "Configure i/o data with %s input bytes and %s output bytes",
+            self.insize,
+            self.outsize,
         )
         self.eip.registerAssembly(
             ethernetip.EtherNetIP.ENIP_IO_TYPE_INPUT,
@@ -166,7 +474,7 @@ class ComEthernetip(ComBase):
             otrpi=self.cycle_time,
         )
         if status != 0:
-            Logging.logger.error(f"Could not open connection: {status}")
+            logger.error("Could not open connection: %s", status)
             raise ConnectionError
         self.connection.produce()
 
@@ -183,14 +491,11 @@ class ComEthernetip(ComBase):
             nonblocking (bool): If True, function returns immediately.
                                 Otherwise function awaits I/O thread to be executed.
         """
-        self.connection.outAssem = bytes_to_boollist(data, self.outsize)
+        frame = self.connection.set_output(bytes_to_boollist(data, self.outsize))
         if not nonblocking:
-            # Unfortunately we have no event
-            #   -> wait for twice the worst case cycle time
-            try:
-                time.sleep(2 * self.cycle_time * 0.001)
-            except OSError:
-                pass
+            # Wait until a frame containing the new data has been produced
+            if not self.connection.wait_for_produced(frame, self._io_wait_timeout()):
+                logger.warning("Timeout while waiting for output frame")
 
     def recv_io(self, nonblocking: bool = False) -> bytes:
         """Receives data from the input
@@ -200,7 +505,11 @@ class ComEthernetip(ComBase):
                                 Otherwise function awaits I/O thread to be executed.
         """
         if not nonblocking:
-            # Unfortunately we have no event
-            #   -> wait for worst case cycle time
-            time.sleep(self.cycle_time * 0.001)
+            # Wait until a new frame has been received
+            if not self.connection.wait_for_consumed(self._io_wait_timeout()):
+                logger.warning("Timeout while waiting for input frame")
         return boollist_to_bytes(self.connection.inAssem)
+
+    def _io_wait_timeout(self) -> float:
+        """Returns the timeout (in s) for blocking i/o calls"""
+        return IO_WAIT_TIMEOUT_CYCLES * self.cycle_time * 0.001
@@ -5,14 +5,18 @@ This implementation uses the pymodbus library
 https://pymodbus.readthedocs.io/en/latest/index.html
 """
 
-from threading import Thread, Event, Lock
+import functools
+from threading import Thread, Event, Lock, RLock
 import time
 import traceback
 from pymodbus.exceptions import ConnectionException
 from pymodbus.client.tcp import ModbusTcpClient as ModbusClient
 from edcon.utils.logging import Logging
+from edcon.utils.cycle_statistics import CycleStatistics
 from edcon.edrive.com_base import ComBase
 
+logger = Logging.get_logger("com.modbus")
+
 REG_OUTPUT_DATA = 0
 REG_INPUT_DATA = 100
 REG_TIMEOUT = 400
@@ -31,27 +35,144 @@ PNU_MAILBOX_EXEC_WRITE = 0x02
 PNU_MAILBOX_EXEC_ERROR = 0x03
 PNU_MAILBOX_EXEC_DONE = 0x10
 
+# Number of data registers which are fetched together with the mailbox status
+# when using batched PNU access (covers all non-string data types)
+PNU_MAILBOX_PREFETCH_DATA_REGS = 16
+
+
+def words_from_bytes(data: bytes) -> list:
+    """Converts bytes to a list of modbus words (little endian)"""
+    return [int.from_bytes(data[i : i + 2], "little") for i in range(0, len(data), 2)]
+
+
+def bytes_from_registers(registers: list) -> bytes:
+    """Converts a list of modbus registers to bytes (little endian)"""
+    return b"".join(reg.to_bytes(2, "little") for reg in registers)
+
+
+def parse_device_info(basic_info: dict, regular_info: dict) -> dict:
+    """Creates the device info from the objects of the basic (read code 0x1)
+    and regular (read code 0x2) device identification and logs the values
+
+    Returns:
+        dict: Contains device information values
+    """
+    dev_info = {
+        "vendor_name": basic_info[0].decode("ascii"),
+        "product_code": basic_info[1].decode("ascii"),
+        "revision": basic_info[2].decode("ascii"),
+        "vendor_url": regular_info[3].decode("ascii"),
+        "product_name": regular_info[4].decode("ascii"),
+        "model_name": regular_info[5].decode("ascii"),
+    }
+    for key, value in dev_info.items():
+        logger.info("%s: %s", key.replace("_", " ").title(), value)
+    return dev_info
+
+
+def check_timeout_register(register: int, timeout_ms: int) -> bool:
+    """Checks the read back timeout register after setting the modbus timeout"""
+    if register != timeout_ms:
+        logger.error("Setting of modbus timeout was not successful")
+        return False
+    return True
+
+
+def mailbox_header(pnu: int, subindex: int, num_elements: int, command: int) -> list:
+    """Returns the registers of the PNU mailbox header (starting at REG_PNU_MAILBOX_PNU)
+    including the execute command"""
+    return [pnu, subindex, num_elements, command]
+
+
+def parse_mailbox_read(pnu: int, registers: list) -> tuple:
+    """Evaluates the registers of a batched PNU read (starting at REG_PNU_MAILBOX_EXEC)
+
+    Returns:
+        tuple: (prefetched data registers, number of data registers that still
+               have to be read), (None, 0) if the read failed
+    """
+    status = registers[0]
+    if status != PNU_MAILBOX_EXEC_DONE:
+        logger.error("Error reading PNU %s, status: %s", pnu, status)
+        return None, 0
+
+    length = registers[REG_PNU_MAILBOX_DATA_LEN - REG_PNU_MAILBOX_EXEC]
+    count = int((length + 1) / 2)
+    data_regs = registers[REG_PNU_MAILBOX_DATA - REG_PNU_MAILBOX_EXEC :][:count]
+    return data_regs, count - len(data_regs)
+
+
+def mailbox_read_result(pnu: int, subindex: int, data_regs: list) -> bytes:
+    """Converts the data registers of a PNU read to bytes (None if the read failed)"""
+    if data_regs is None:
+        return None
+    data = bytes_from_registers(data_regs)
+    logger.info("Successful read of PNU %s (subindex: %s): %s)", pnu, subindex, data)
+    return data
+
+
+def mailbox_write_result(pnu: int, subindex: int, value: bytes, status: int) -> bool:
+    """Evaluates the mailbox status of a PNU write
+
+    Returns:
+        bool: True if the write was successful
+    """
+    if status != PNU_MAILBOX_EXEC_DONE:
+        logger.error("Error writing PNU %s, status: %s", pnu, status)
+        return False
+
+    logger.info("Successful write of PNU %s (subindex: %s): %s ", pnu, subindex, value)
+    return True
+
+
+def mailbox_transaction(func):
+    """Decorator which executes a method of ComModbus while holding its mailbox lock.
+
+    The PNU mailbox only holds one request at a time, so PNU accesses of
+    different threads must not interleave. The i/o data lock is released
+    between the transfers of a transaction to not delay the i/o thread.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.mailbox_lock:
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
 
 class IOThread(Thread):
     """Class to handle I/O transfers in a separate thread."""
 
-    def __init__(self, perform_io=None, cycle_time: int = 10):
+    def __init__(
+        self, perform_io=None, cycle_time: int = 10, overrun_policy: str = "skip"
+    ):
         """Constructor of the IOThread class.
 
         Parameters:
             perform_io (function): function that is called periodically (with interval cycle_time)
                                    and performs the I/O data transfer
             cycle_time (int): Cycle time (in ms) that should be used for I/O transfers
+            overrun_policy (str): One of ['skip', 'catch-up'], determines how missed
+                                  deadlines are handled. 'skip' drops the missed cycles and
+                                  continues with the next deadline in the future, 'catch-up'
+                                  executes the missed cycles without delay.
         """
+        assert overrun_policy in ["skip", "catch-up"]
         self.perform_io = perform_io
         self.cycle_time = cycle_time
+        self.overrun_policy = overrun_policy
         self.active = False
         self.exe_event = Event()
+        self.statistics = CycleStatistics(cycle_time)
         Thread.__init__(self, daemon=True)
 
     def run(self):
-        """Method that needs to be implemented by child."""
+        """Executes perform_io on absolute deadlines (monotonic clock)."""
+        period = self.cycle_time * 0.001
+        next_deadline = time.monotonic()
         while self.active:
+            self.statistics.record_cycle(time.monotonic())
             try:
                 self.perform_io()
                 self.exe_event.set()
@@ -59,10 +180,25 @@ class IOThread(Thread):
 
             # pylint: disable=bare-except
             except:
-                Logging.logger.error(traceback.format_exc())
+                logger.error(traceback.format_exc())
                 self.stop()
 
-            time.sleep(self.cycle_time * 0.001)
+            next_deadline = self._next_deadline(next_deadline, period)
+            time.sleep(max(0.0, next_deadline - time.monotonic()))
+
+    def _next_deadline(self, deadline: float, period: float) -> float:
+        """Determines the deadline of the next cycle and detects overruns"""
+        deadline += period
+        now = time.monotonic()
+        if now <= deadline:
+            return deadline
+
+        self.statistics.record_overrun()
+        if self.overrun_policy == "skip":
+            # Continue on the next deadline of the original time grid
+            missed = int((now - deadline) / period) + 1
+            deadline += missed * period
+        return deadline
 
     def start(self):
         """Starts the thread."""
@@ -77,22 +213,49 @@ class IOThread(Thread):
 class ComModbus(ComBase):
     """Class to configure and communicate with EDrive devices via Modbus."""
 
-    def __init__(self, ip_address, cycle_time: int = 10, timeout_ms: int = 1000):
+    # pylint: disable=too-many-instance-attributes
+    # Eleven is needed here
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        ip_address,
+        cycle_time: int = 10,
+        timeout_ms: int = 1000,
+        *,
+        batched_pnu_access: bool = False,
+        overrun_policy: str = "skip",
+        readwrite_io: bool = False,
+    ):
         """Constructor of the ComModbus class.
 
         Parameters:
             ip_address (str): Required IP address as string e.g. ('192.168.0.1')
             cycle_time (int): Cycle time (in ms) that should be used for I/O transfers
             timeout_ms (int): Modbus timeout (in ms) that should be configured on the slave
+            batched_pnu_access (bool): If True, the PNU mailbox registers are accessed
+                                       using multi-register transfers (fewer round-trips).
+                                       The mailbox only holds one request at a time, so
+                                       bulk accesses (read_pnus/write_pnus) still transfer
+                                       the PNUs one after another.
+            overrun_policy (str): One of ['skip', 'catch-up'], determines how the I/O thread
+                                  handles missed cycle deadlines (see IOThread)
+            readwrite_io (bool): If True, I/O data is exchanged in a single transaction using
+                                 function code 23 (Read/Write Multiple Registers). Falls back to
+                                 separate read and write transactions if the device rejects it.
         """
         self.cycle_time = cycle_time
+        self.overrun_policy = overrun_policy
+        self.readwrite_io = readwrite_io
+        self.batched_pnu_access = batched_pnu_access
 
         self.in_data = b"\x00" * IO_DATA_SIZE
         self.out_data = b"\x00" * IO_DATA_SIZE
         self.io_thread = None
+        self.io_scheduler = None
         self.lock = Lock()
+        self.mailbox_lock = RLock()
 
-        Logging.logger.info(f"Starting Modbus connection on {ip_address}")
+        logger.info("Starting Modbus connection on %s", ip_address)
         self.modbus_client = ModbusClient(ip_address)
         if self.modbus_client.connect():
             self.device_info = self.read_device_info()
@@ -103,7 +266,10 @@ class ComModbus(ComBase):
 
     def shutdown(self):
         """Tries stop the communication thread and closes the modbus connection"""
-        if hasattr(self, "io_thread"):
+        if getattr(self, "io_scheduler", None) is not None:
+            # The i/o thread is shared with the other connections of the group
+            self.io_scheduler.remove(self)
+        elif hasattr(self, "io_thread"):
             if self.io_thread is not None:
                 self.io_thread.stop()
         if hasattr(self, "modbus_client"):
@@ -120,65 +286,81 @@ class ComModbus(ComBase):
         Returns:
             dict: Contains device information values
         """
-        dev_info = {}
-
-        # Read device information
         try:
             with self.lock:
-                rres = self.modbus_client.read_device_information(read_code=0x1)
+                basic = self.modbus_client.read_device_information(read_code=0x1)
+                regular = self.modbus_client.read_device_information(read_code=0x2)
         except ConnectionException as e:
             raise ConnectionAbortedError(str(e)) from e
-        dev_info["vendor_name"] = rres.information[0].decode("ascii")
-        dev_info["product_code"] = rres.information[1].decode("ascii")
-        dev_info["revision"] = rres.information[2].decode("ascii")
-
-        try:
-            with self.lock:
-                rres = self.modbus_client.read_device_information(read_code=0x2)
-        except ConnectionException as e:
-            raise ConnectionAbortedError(str(e)) from e
-        dev_info["vendor_url"] = rres.information[3].decode("ascii")
-        dev_info["product_name"] = rres.information[4].decode("ascii")
-        dev_info["model_name"] = rres.information[5].decode("ascii")
-
-        for key, value in dev_info.items():
-            Logging.logger.info(f"{key.replace('_',' ').title()}: {value}")
-
-        return dev_info
+        return parse_device_info(basic.information, regular.information)
 
     def set_timeout(self, timeout_ms) -> bool:
         """Sets the modbus timeout to the provided value"""
-        Logging.logger.info(f"Setting modbus timeout to {timeout_ms} ms")
+        logger.info("Setting modbus timeout to %s ms", timeout_ms)
         with self.lock:
             self.modbus_client.write_registers(REG_TIMEOUT, [timeout_ms, 0])
             # Check if it actually succeeded
             indata = self.modbus_client.read_holding_registers(
                 address=REG_TIMEOUT, count=1
             )
-        if indata.registers[0] != timeout_ms:
-            Logging.logger.error("Setting of modbus timeout was not successful")
-            return False
-        return True
+        return check_timeout_register(indata.registers[0], timeout_ms)
+
+    def perform_io(self, out_data: bytes = None):
+        """Reads input data from and writes output data to according modbus registers.
+
+        Parameters:
+            out_data (bytes): Optional output data that should be written
+                              instead of the data provided using send_io
+        """
+        if out_data is None:
+            out_data = self.out_data
+
+        if self.readwrite_io:
+            self._perform_io_readwrite(out_data)
+            return
 
-    def perform_io(self):
-        """Reads input data from and writes output data to according modbus registers."""
         # Inputs, convert to bytes
         with self.lock:
             indata = self.modbus_client.read_holding_registers(
                 address=REG_INPUT_DATA, count=int(IO_DATA_SIZE / 2)
             )
-        self.in_data = b"".join(reg.to_bytes(2, "little") for reg in indata.registers)
+        self.in_data = bytes_from_registers(indata.registers)
 
         # Outputs, convert to list of modbus words
-        word_list = [
-            int.from_bytes(self.out_data[i : i + 2], "little")
-            for i in range(0, len(self.out_data), 2)
-        ]
+        word_list = words_from_bytes(out_data)
         with self.lock:
             self.modbus_client.write_registers(REG_OUTPUT_DATA, word_list)
 
+    def _perform_io_readwrite(self, out_data: bytes):
+        """Writes output data and reads input data using a single
+        Read/Write Multiple Registers (function code 23) transaction."""
+        # Outputs, convert to list of modbus words
+        word_list = words_from_bytes(out_data)
+        with self.lock:
+            indata = self.modbus_client.readwrite_registers(
+                read_address=REG_INPUT_DATA,
+                read_count=int(IO_DATA_SIZE / 2),
+                write_address=REG_OUTPUT_DATA,
+                values=word_list,
+            )
+        if indata.isError():
+            logger.warning(
+                "Read/Write Multiple Registers rejected by device, "
+                "falling back to separate read and write transactions"
+            )
+            self.readwrite_io = False
+            self.perform_io(out_data)
+            return
+
+        # Inputs, convert to bytes
+        self.in_data = bytes_from_registers(indata.registers)
+
+    @mailbox_transaction
     def read_pnu_raw(self, pnu: int, subindex: int = 0, num_elements: int = 1) -> bytes:
         """Reads a PNU from the EDrive without interpreting the data"""
+        if self.batched_pnu_access:
+            return self._read_pnu_raw_batched(pnu, subindex, num_elements)
+
         with self.lock:
             self.modbus_client.write_register(REG_PNU_MAILBOX_PNU, pnu)
             self.modbus_client.write_register(REG_PNU_MAILBOX_SUBINDEX, subindex)
@@ -194,7 +376,7 @@ class ComModbus(ComBase):
             ).registers[0]
 
         if status != PNU_MAILBOX_EXEC_DONE:
-            Logging.logger.error(f"Error reading PNU {pnu}, status: {status}")
+            logger.error("Error reading PNU %s, status: %s", pnu, status)
             return None
 
         with self.lock:
@@ -207,17 +389,44 @@ class ComModbus(ComBase):
                 address=REG_PNU_MAILBOX_DATA, count=int((length + 1) / 2)
             )
 
-        # Convert to integer
-        data = b"".join(reg.to_bytes(2, "little") for reg in indata.registers)
-        Logging.logger.info(
-            f"Successful read of PNU {pnu} (subindex: {subindex}): {data})"
-        )
-        return data
+        return mailbox_read_result(pnu, subindex, indata.registers)
 
+    @mailbox_transaction
+    def _read_pnu_raw_batched(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1
+    ) -> bytes:
+        """Reads a PNU using one multi-register write for the mailbox header
+        and one contiguous read for status, length and (prefetched) data."""
+        prefetch_offset = REG_PNU_MAILBOX_DATA - REG_PNU_MAILBOX_EXEC
+        with self.lock:
+            # Header and execute command are written in ascending register order
+            self.modbus_client.write_registers(
+                REG_PNU_MAILBOX_PNU,
+                mailbox_header(pnu, subindex, num_elements, PNU_MAILBOX_EXEC_READ),
+            )
+            registers = self.modbus_client.read_holding_registers(
+                address=REG_PNU_MAILBOX_EXEC,
+                count=prefetch_offset + PNU_MAILBOX_PREFETCH_DATA_REGS,
+            ).registers
+
+        data_regs, missing = parse_mailbox_read(pnu, registers)
+        if missing > 0:
+            # Data does not fit into the prefetched registers, read the rest
+            with self.lock:
+                data_regs += self.modbus_client.read_holding_registers(
+                    address=REG_PNU_MAILBOX_DATA + len(data_regs), count=missing
+                ).registers
+
+        return mailbox_read_result(pnu, subindex, data_regs)
+
+    @mailbox_transaction
     def write_pnu_raw(
         self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
     ) -> bool:
         """Writes raw bytes to a PNU on the EDrive"""
+        if self.batched_pnu_access:
+            return self._write_pnu_raw_batched(pnu, subindex, num_elements, value)
+
         try:
             with self.lock:
                 self.modbus_client.write_register(REG_PNU_MAILBOX_PNU, pnu)
@@ -227,14 +436,11 @@ class ComModbus(ComBase):
                 )
                 self.modbus_client.write_register(REG_PNU_MAILBOX_DATA_LEN, len(value))
 
-            # Convert to list of words
-            word_list = [
-                int.from_bytes(value[i : i + 2], "little")
-                for i in range(0, len(value), 2)
-            ]
             with self.lock:
                 # Write data
-                self.modbus_client.write_registers(REG_PNU_MAILBOX_DATA, word_list)
+                self.modbus_client.write_registers(
+                    REG_PNU_MAILBOX_DATA, words_from_bytes(value)
+                )
 
                 # Execute
                 self.modbus_client.write_register(
@@ -243,33 +449,75 @@ class ComModbus(ComBase):
                 status = self.modbus_client.read_holding_registers(
                     address=REG_PNU_MAILBOX_EXEC, count=1
                 ).registers[0]
-            if status != PNU_MAILBOX_EXEC_DONE:
-                Logging.logger.error(f"Error writing PNU {pnu}, status: {status}")
-                return False
+            return mailbox_write_result(pnu, subindex, value, status)
 
-            Logging.logger.info(
-                f"Successful write of PNU {pnu} (subindex: {subindex}): {value} "
-            )
-            return True
+        except AttributeError:
+            traceback.print_exc()
+            logger.error("Could not access PNU register")
+            return False
+
+    @mailbox_transaction
+    def _write_pnu_raw_batched(
+        self, pnu: int, subindex: int = 0, num_elements: int = 1, value: bytes = b"\x00"
+    ) -> bool:
+        """Writes a PNU using multi-register writes. The mailbox header is written
+        last, so that the execute command is issued with the same request."""
+        try:
+            with self.lock:
+                self.modbus_client.write_registers(
+                    REG_PNU_MAILBOX_DATA_LEN, [len(value)]
+                )
+                self.modbus_client.write_registers(
+                    REG_PNU_MAILBOX_DATA, words_from_bytes(value)
+                )
+                self.modbus_client.write_registers(
+                    REG_PNU_MAILBOX_PNU,
+                    mailbox_header(pnu, subindex, num_elements, PNU_MAILBOX_EXEC_WRITE),
+                )
+                status = self.modbus_client.read_holding_registers(
+                    address=REG_PNU_MAILBOX_EXEC, count=1
+                ).registers[0]
 
         except AttributeError:
             traceback.print_exc()
-            Logging.logger.error("Could not access PNU register")
+            logger.error("Could not access PNU register")
             return False
 
+        return mailbox_write_result(pnu, subindex, value, status)
+
     def io_active(self):
         """Provides information about connection status."""
         return self.io_thread.active
 
+    def io_cycle_event(self):
+        """Provides the event which is set whenever the i/o thread executed a cycle."""
+        if self.io_thread is None:
+            return None
+        return self.io_thread.exe_event
+
+    def io_statistics(self) -> dict:
+        """Provides timing statistics of the i/o data process.
+
+        Returns:
+            dict: Containing cycles, overruns, achieved period and jitter (in ms)
+        """
+        if self.io_thread is None:
+            return None
+        return self.io_thread.statistics.summary()
+
     def start_io(self):
-        """Starts i/o data process"""
-        self.io_thread = IOThread(self.perform_io, self.cycle_time)
+        """Starts i/o data process (or joins the i/o thread of the AxisGroup)"""
+        if self.io_scheduler is not None:
+            self.io_thread = self.io_scheduler.start_io()
+            return
+        self.io_thread = IOThread(self.perform_io, self.cycle_time, self.overrun_policy)
         self.io_thread.start()
 
     def stop_io(self):
         """Stops i/o data process"""
         self.send_io(b"\x00" * IO_DATA_SIZE)
-        self.io_thread.stop()
+        if self.io_scheduler is None:
+            self.io_thread.stop()
 
     def send_io(self, data: bytes, nonblocking: bool = False):
         """Sends data to the output
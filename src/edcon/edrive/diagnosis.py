@@ -4,8 +4,8 @@ from collections import namedtuple
 from importlib.resources import files
 from pathlib import PurePath
 from functools import lru_cache
-import csv
 from edcon.utils.logging import Logging
+from edcon.utils.csv_cache import read_csv_rows
 
 
 @lru_cache
@@ -21,12 +21,11 @@ def read_icp_map_file(icp_map_file: str = None):
     if not icp_map_file:
         icp_map_file = PurePath(files("edcon") / "edrive" / "data" / "icp_map.csv")
 
-    with open(icp_map_file, encoding="utf-8") as csvfile:
-        reader = csv.reader(csvfile, delimiter=";")
-        # Define a namedtuple where the header row determines the field names
-        icp_item = namedtuple("icp_item", next(reader, None))
-        # Create a dict where the first column determines the key
-        icp_name_dict = {int(row[0]): icp_item(*row) for row in reader}
+    header, rows = read_csv_rows(icp_map_file, encoding="utf-8")
+    # Define a namedtuple where the header row determines the field names
+    icp_item = namedtuple("icp_item", header)
+    # Create a dict where the first column determines the key
+    icp_name_dict = {int(row[0]): icp_item(*row) for row in rows}
     return icp_name_dict
 
 
@@ -65,3 +64,17 @@ def diagnosis_remedy(icp_number: int, icp_map_file: str = None) -> list:
         Logging.logger.error(f"No entry for ICP {icp_number}")
     remedy_list = [x.strip("-") for x in icp_map[icp_number].remedy.split("\n")]
     return remedy_list
+
+
+def fault_description(icp_number: int) -> str:
+    """Describes a fault by its diagnosis name and the possible remedies.
+
+    Parameters:
+        icp_number (int): ICP number (fault code) of the fault
+    Returns:
+        value: Multi-line str describing the fault
+    """
+    fault_desc = f"Cancelled due to fault: {diagnosis_name(icp_number)} ({icp_number})"
+    for i, remedy in enumerate(diagnosis_remedy(icp_number)):
+        fault_desc += f"\nPossible remedy {str(i+1)}: {remedy}"
+    return fault_desc
@@ -3,12 +3,31 @@ Contains Parameter class which is used to represent a parameter of EDrives.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from edcon.edrive.parameter_mapping import ParameterMap
 from edcon.edrive.pnu_packing import pnu_pack, pnu_unpack
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def resolve_pnu(axis: int, data_id: int, instance: int) -> int:
+    """Determines the PNU of a parameter (the result is cached)
+
+    Parameters:
+        axis (int): Axis of the parameter
+        data_id (int): Data id of the parameter
+        instance (int): Instance of the parameter
+
+    Returns:
+        int: PNU of the parameter, None if it is not available in the parameter map
+    """
+    item = ParameterMap().mapping.get(f"{axis}.{data_id}.{instance}")
+    if item is None:
+        return None
+    return item.pnu
+
+
+@dataclass(slots=True)
 class Parameter:
     """Class representing a parameter."""
 
@@ -55,15 +74,19 @@ class Parameter:
         Returns:
             Any: Value in correct data type
         """
-        parameter_map = ParameterMap()
-        pnu = parameter_map[self.uid()].pnu
-        return pnu_unpack(pnu, self.value_raw)
+        return pnu_unpack(self.pnu(), self.value_raw)
 
     @value.setter
     def value(self, value: Any):
-        parameter_map = ParameterMap()
-        pnu = parameter_map[self.uid()].pnu
-        self.value_raw = pnu_pack(pnu, value)
+        self.value_raw = pnu_pack(self.pnu(), value)
+
+    def pnu(self) -> int:
+        """Returns the PNU of the parameter.
+
+        Returns:
+            int: PNU, None if the parameter is not available in the parameter map
+        """
+        return resolve_pnu(self.axis, self.data_id, self.instance)
 
     def uid(self) -> str:
         """Returns the uid of the parameter.
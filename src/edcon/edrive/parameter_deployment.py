@@ -0,0 +1,120 @@
+"""
+Contains functions to deploy a parameter set to multiple EDrives concurrently.
+"""
+
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pymodbus.exceptions import ModbusException
+from edcon.utils.logging import Logging
+from edcon.edrive.parameter_handler import ParameterHandler, ParameterLoadResult
+
+
+@dataclass
+class DeploymentResult:
+    """Class containing the result of the deployment to a single EDrive."""
+
+    ip_address: str
+    result: ParameterLoadResult = None
+    duration: float = 0.0
+    error: str = None
+
+    @property
+    def ok(self) -> bool:
+        """Returns True if all parameters have been written successfully"""
+        return self.error is None and not self.result.failed
+
+    def summary(self) -> str:
+        """Returns a string containing the outcome of the deployment"""
+        outcome = self.error if self.error is not None else self.result.summary()
+        return f"{self.ip_address}: {outcome} ({self.duration:.1f} s)"
+
+
+def read_inventory_file(inventory_file: str) -> list:
+    """Reads the IP addresses of an inventory CSV file.
+
+    The first column of each row contains the IP address. Empty rows,
+    rows starting with '#' and a header row (first column 'ip_address') are ignored.
+
+    Parameters:
+        inventory_file (str): CSV file containing the IP addresses
+
+    Returns:
+        list: IP addresses
+    """
+    ip_addresses = []
+    with open(inventory_file, encoding="utf-8") as csvfile:
+        for line in csvfile:
+            ip_address = line.replace(";", ",").split(",")[0].strip()
+            if not ip_address or ip_address.startswith("#"):
+                continue
+            if ip_address.lower() == "ip_address":
+                continue
+            ip_addresses.append(ip_address)
+    return ip_addresses
+
+
+def deploy_parameters(  # pylint: disable=too-many-arguments
+    com_factory,
+    ip_addresses: list,
+    parameters: list,
+    max_workers: int = 8,
+    *,
+    only_changed: bool = False,
+    verify: bool = False,
+    callback=None,
+) -> list:
+    """Writes the same parameters to multiple EDrives concurrently.
+
+    Every EDrive uses its own connection, at most max_workers connections are
+    open at the same time. The parameters (including their raw values) are
+    shared between all EDrives.
+
+    Parameters:
+        com_factory (Callable): Creates a communication driver from an IP address
+        ip_addresses (list): IP addresses of the EDrives
+        parameters (list): Parameters that should be written
+        max_workers (int): Maximum number of EDrives that are configured concurrently
+        only_changed (bool): See ParameterHandler.load_parameters
+        verify (bool): See ParameterHandler.load_parameters
+        callback (Callable): Called with each DeploymentResult as soon as it is available
+
+    Returns:
+        list: DeploymentResult for each provided IP address (same order, without duplicates)
+    """
+    ip_addresses = list(dict.fromkeys(ip_addresses))
+
+    def deploy(ip_address):
+        Logging.logger.info(
+            f"{ip_address}: Start deployment of {len(parameters)} parameters"
+        )
+        start = time.monotonic()
+        deployment = DeploymentResult(ip_address)
+        com = None
+        try:
+            com = com_factory(ip_address)
+            deployment.result = ParameterHandler(com).load_parameters(
+                parameters, only_changed=only_changed, verify=verify
+            )
+        except (ModbusException, ConnectionError, OSError, ValueError) as error:
+            Logging.logger.error(traceback.format_exc())
+            deployment.error = f"{type(error).__name__}: {error}"
+        finally:
+            if com is not None:
+                com.shutdown()
+        deployment.duration = time.monotonic() - start
+        Logging.logger.info(f"Deployment finished: {deployment.summary()}")
+        return deployment
+
+    results = {}
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(ip_addresses))),
+        thread_name_prefix="edcon-deployment",
+    ) as executor:
+        futures = {executor.submit(deploy, ip): ip for ip in ip_addresses}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if callback is not None:
+                callback(results[futures[future]])
+    return [results[ip] for ip in ip_addresses]
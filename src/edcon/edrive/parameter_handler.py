@@ -2,11 +2,70 @@
 Contains ParameterSet class which is used to represent parameter sets of EDrives.
 """
 
+from dataclasses import dataclass, field
 from typing import Any
 from edcon.utils.logging import Logging
 from edcon.edrive.com_base import ComBase
-from edcon.edrive.parameter_mapping import ParameterMap
-from edcon.edrive.parameter import Parameter
+from edcon.edrive.parameter_mapping import ParameterMap, create_parameter_map
+from edcon.edrive.parameter import Parameter, resolve_pnu
+from edcon.edrive.parameter_store import ParameterStore
+from edcon.edrive.pnu_packing import pnu_codec
+
+
+def raw_values_equal(configured_raw: bytes, value_raw: bytes) -> bool:
+    """Compares a raw value read from the EDrive with a raw parameter value.
+    Additional zero bytes of the read value (padding of the bus) are ignored.
+
+    Returns:
+        bool: True if the values are equal
+    """
+    if configured_raw is None or value_raw is None:
+        return False
+    return configured_raw[: len(value_raw)] == value_raw and not any(
+        configured_raw[len(value_raw) :]
+    )
+
+
+@dataclass
+class ParameterLoadResult:
+    """Class containing the result of ParameterHandler.load_parameters."""
+
+    written: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)
+    failed: list = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Returns a string containing the number of written, skipped and failed parameters"""
+        return (
+            f"{len(self.written)} written, {len(self.skipped)} skipped (unchanged), "
+            f"{len(self.failed)} failed"
+        )
+
+
+def snapshot_entries() -> list:
+    """Determines all parameters of the parameter map that are part of a snapshot.
+    Strings are represented by one parameter per character (like in .pck files).
+
+    Returns:
+        list: Parameter (without value) for each entry
+    """
+    entries = []
+    for parameter_id, item in create_parameter_map().items():
+        axis, data_id, instance = (int(x) for x in parameter_id.split("."))
+        subindices = 1
+        if "STRING" in item.data_type:
+            subindices = int(item.data_type.strip("STRING()"))
+        entries += [
+            Parameter(axis, data_id, instance, subindex, None)
+            for subindex in range(subindices)
+        ]
+    return entries
+
+
+def _value_size(pnu: int) -> int:
+    """Returns the size (in bytes) of a single value of the provided PNU"""
+    codec = pnu_codec(pnu)
+    return codec.struct.size if codec.struct is not None else 1
 
 
 class ParameterHandler:
@@ -68,3 +127,166 @@ class ParameterHandler:
         return self.com.write_pnu_raw(
             pnu=pnu, subindex=parameter.subindex, value=parameter.value_raw
         )
+
+    def read_parameters(self, parameter_uids: list) -> list:
+        """Read values from multiple parameter_uids using one batched transfer
+
+        Parameters:
+            parameter_uids (list): uids (including subindex) of the parameters to read
+
+        Returns:
+            list: Parameter for each provided uid (False if uid is not available)
+        """
+        parameters = [
+            (
+                Parameter.from_uid_raw(uid, None)
+                if self._check_parameter_uid(uid)
+                else False
+            )
+            for uid in parameter_uids
+        ]
+        valid = [parameter for parameter in parameters if parameter]
+        raw_values = self.com.read_pnus_raw(
+            [
+                (self.parameter_map[parameter.uid()].pnu, parameter.subindex)
+                for parameter in valid
+            ]
+        )
+        for parameter, value_raw in zip(valid, raw_values):
+            parameter.value_raw = value_raw
+        return parameters
+
+    def write_parameters(self, parameters: list) -> list:
+        """Write values of multiple parameters using one batched transfer
+
+        Parameters:
+            parameters (list): Parameters that should be written
+
+        Returns:
+            list: Write status (bool) for each provided parameter
+        """
+        status_list = [self._check_parameter_uid(p.uid()) for p in parameters]
+        valid_indices = [i for i, status in enumerate(status_list) if status]
+        valid_status = self.com.write_pnus_raw(
+            [
+                (
+                    self.parameter_map[parameters[i].uid()].pnu,
+                    parameters[i].subindex,
+                    parameters[i].value_raw,
+                )
+                for i in valid_indices
+            ]
+        )
+        for i, status in zip(valid_indices, valid_status):
+            status_list[i] = status
+        return status_list
+
+    def changed_parameters(self, parameters: list) -> list:
+        """Determines the parameters whose value differs from the value configured
+        on the EDrive using one batched read transfer
+
+        Parameters:
+            parameters (list): Parameters that should be compared
+
+        Returns:
+            list: Parameters that differ (or could not be read)
+        """
+        configured = self.read_parameters([p.uid() for p in parameters])
+        return [
+            parameter
+            for parameter, configured_parameter in zip(parameters, configured)
+            if not configured_parameter
+            or not raw_values_equal(configured_parameter.value_raw, parameter.value_raw)
+        ]
+
+    def load_parameters(
+        self, parameters: list, only_changed: bool = False, verify: bool = False
+    ) -> ParameterLoadResult:
+        """Writes multiple parameters using batched transfers
+
+        Parameters:
+            parameters (list): Parameters that should be written
+            only_changed (bool): If True, the configured values are read first and
+                                 only parameters with a different value are written
+            verify (bool): If True, the written parameters are read back and compared
+
+        Returns:
+            ParameterLoadResult: Containing the written, skipped and failed parameters
+        """
+        result = ParameterLoadResult()
+        to_write = parameters
+        if only_changed:
+            to_write = self.changed_parameters(parameters)
+            changed_ids = {id(parameter) for parameter in to_write}
+            result.skipped = [p for p in parameters if id(p) not in changed_ids]
+            Logging.logger.info(
+                f"{len(to_write)} of {len(parameters)} parameters differ"
+            )
+
+        for parameter, status in zip(to_write, self.write_parameters(to_write)):
+            if status:
+                result.written.append(parameter)
+            else:
+                Logging.logger.error(
+                    f"Setting {parameter.uid()} to {parameter.value_raw} failed"
+                )
+                result.failed.append(parameter)
+
+        if verify and result.written:
+            mismatches = self.changed_parameters(result.written)
+            for parameter in mismatches:
+                Logging.logger.error(f"Verification of {parameter.uid()} failed")
+            mismatch_ids = {id(parameter) for parameter in mismatches}
+            result.written = [p for p in result.written if id(p) not in mismatch_ids]
+            result.failed += mismatches
+
+        return result
+
+    def snapshot(self, baseline=None) -> ParameterStore:
+        """Reads the parameters of the EDrive using batched transfers.
+
+        Without baseline, all parameters of the parameter map are requested and
+        parameters that can not be read (not available on the device) are omitted.
+        With baseline (e.g. a ParameterSet of a previous snapshot), only the
+        parameters contained in the baseline are read and the number of changed
+        parameters is logged.
+
+        Parameters:
+            baseline (Iterable): Optional parameters of a previous snapshot
+
+        Returns:
+            ParameterStore: Parameters containing the configured values
+        """
+        entries = snapshot_entries() if baseline is None else list(baseline)
+        pnus = [resolve_pnu(p.axis, p.data_id, p.instance) for p in entries]
+        # Parameters of the baseline which are not available in the parameter map
+        for entry in [e for e, pnu in zip(entries, pnus) if pnu is None]:
+            self._check_parameter_uid(entry.uid())
+        entries = [entry for entry, pnu in zip(entries, pnus) if pnu is not None]
+        pnus = [pnu for pnu in pnus if pnu is not None]
+        Logging.logger.info(f"Read {len(entries)} parameters for snapshot")
+        raw_values = self.com.read_pnus_raw(
+            [(pnu, entry.subindex) for pnu, entry in zip(pnus, entries)]
+        )
+
+        store = ParameterStore()
+        changed = 0
+        for entry, pnu, value_raw in zip(entries, pnus, raw_values):
+            if value_raw is None:
+                continue
+            # Remove the padding added by the bus
+            value_raw = value_raw[: _value_size(pnu)]
+            if baseline is not None and value_raw != entry.value_raw:
+                changed += 1
+            store.append(
+                Parameter(
+                    entry.axis, entry.data_id, entry.instance, entry.subindex, value_raw
+                )
+            )
+
+        if baseline is not None:
+            Logging.logger.info(
+                f"{changed} of {len(entries)} parameters changed since baseline"
+            )
+        Logging.logger.info(f"Snapshot contains {len(store)} parameters")
+        return store
@@ -4,8 +4,8 @@ from collections import namedtuple
 from importlib.resources import files
 from pathlib import PurePath
 from functools import lru_cache
-import csv
 from edcon.utils.logging import Logging
+from edcon.utils.csv_cache import read_csv_rows
 
 
 @lru_cache
@@ -20,14 +20,13 @@ def read_pnu_map_file(pnu_map_file: str = None) -> list:
     """
     if not pnu_map_file:
         pnu_map_file = PurePath(files("edcon") / "edrive" / "data" / "pnu_map.csv")
-    with open(pnu_map_file, encoding="ascii") as csvfile:
-        reader = csv.reader(csvfile, delimiter=";")
-        # Define a namedtuple where the header row determines the field names
-        pnu_map_item = namedtuple("pnu_map_item", next(reader, None))
-
-        Logging.logger.info(f"Load PNU map file: {pnu_map_file}")
-        # Interpret the first row element (PNU) as int
-        return [pnu_map_item(int(row[0]), *row[1:]) for row in reader]
+    # Interpret the first row element (PNU) as int
+    header, rows = read_csv_rows(pnu_map_file, encoding="ascii", int_columns=(0,))
+    # Define a namedtuple where the header row determines the field names
+    pnu_map_item = namedtuple("pnu_map_item", header)
+
+    Logging.logger.info(f"Load PNU map file: {pnu_map_file}")
+    return list(map(pnu_map_item._make, rows))
 
 
 @lru_cache
@@ -4,36 +4,167 @@ Contains ParameterSet class which is used to represent parameter sets of EDrives
 
 from edcon.edrive.parameter import Parameter
 from edcon.edrive.parameter_mapping import ParameterMap
+from edcon.edrive.parameter_store import ParameterStore, BINARY_MAGIC
 from edcon.utils.logging import Logging
 
+PARAMETER_SET_MARKER = b"----"
+
+
+def _string_last_index(data_type: str) -> int:
+    """Returns the subindex of the null terminator of a STRING data type (None otherwise)"""
+    if "STRING" not in data_type:
+        return None
+    return int(data_type.strip("STRING()")) - 1
 
-class ParameterSet:
-    """Class representing a parameter set."""
 
-    def __init__(self, parameterset_file, strip_null_terminators=True) -> None:
-        self.parameters = []
-        with open(parameterset_file, "rb") as pfile:
-            lines = pfile.readlines()
+def _read_pck_file(parameterset_file):
+    """Generator which reads the parameters of a .pck file line by line"""
+    with open(parameterset_file, "rb") as pfile:
+        if pfile.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+            for view in ParameterStore.from_bytes(BINARY_MAGIC + pfile.read()):
+                yield view.to_parameter()
+            return
+        pfile.seek(0)
 
-        start_idx = lines.index(b"----\r\n") + 1
-        end_idx = start_idx + lines[start_idx:].index(b"----\r\n")
+        # Parameters are located between the first two marker lines
+        for line in pfile:
+            if line.rstrip() == PARAMETER_SET_MARKER:
+                break
 
-        for item in lines[start_idx:end_idx]:
-            key, hex_value = item.decode().strip("P").split(";")
+        for line in pfile:
+            line = line.strip()
+            if line == PARAMETER_SET_MARKER:
+                return
+            if not line:
+                continue
+            key, hex_value = line.decode().strip("P").split(";")
             value_raw = bytes.fromhex(hex_value.split("x")[1])[::-1]
+            yield Parameter.from_uid_raw(key, value_raw)
+
+
+def read_parameter_set(parameterset_file, strip_null_terminators=True):
+    """Generator which reads the parameters of a parameter set file one by one.
+
+    For .pck files only the current line is kept in memory, both '\r\n' and '\n'
+    line endings are supported. Binary parameter sets (see write_parameter_set)
+    are detected automatically.
+
+    Parameters:
+        parameterset_file (str): Parameter set file (.pck or binary)
+        strip_null_terminators (bool): If True, parameters representing the
+                                       null terminator of a string are skipped
+
+    Yields:
+        Parameter: Next parameter of the parameter set
+    """
+    mapping = ParameterMap().mapping
+    # Subindex of the null terminator per parameter id (None if not a string)
+    last_indices = {}
+
+    for parameter in _read_pck_file(parameterset_file):
+        if strip_null_terminators:
+            parameter_id = f"{parameter.axis}.{parameter.data_id}.{parameter.instance}"
+            if parameter_id not in last_indices:
+                item = mapping.get(parameter_id)
+                last_indices[parameter_id] = (
+                    _string_last_index(item.data_type) if item else None
+                )
+            if parameter.subindex == last_indices[parameter_id]:
+                Logging.logger.debug(
+                    f"Parameter {parameter.uid()} is a null terminator"
+                )
+                continue
+
+        yield parameter
+
+
+def write_parameter_set(
+    parameterset_file, parameters, header: list = None, binary: bool = False
+):
+    """Writes parameters to a parameter set file.
+
+    Parameters:
+        parameterset_file (str): File that should be written
+        parameters (Iterable): Parameters that should be written
+        header (list): Lines written before the parameters (.pck only)
+        binary (bool): If True, the compact binary representation of
+                       ParameterStore is written instead of a .pck file
+    """
+    if binary:
+        if not isinstance(parameters, ParameterStore):
+            parameters = ParameterStore(parameters)
+        with open(parameterset_file, "wb") as pfile:
+            pfile.write(parameters.to_bytes())
+        return
 
-            self.parameters.append(Parameter.from_uid_raw(key, value_raw))
+    with open(parameterset_file, "wb") as pfile:
+        for line in header or []:
+            pfile.write(line.encode() + b"\r\n")
+        pfile.write(PARAMETER_SET_MARKER + b"\r\n")
+        for parameter in parameters:
+            hex_value = parameter.value_raw[::-1].hex().upper()
+            pfile.write(f"P{parameter.uid()};0x{hex_value}\r\n".encode())
+        pfile.write(PARAMETER_SET_MARKER + b"\r\n")
+
+
+class ParameterSet:
+    """Class representing a parameter set.
+
+    By default all parameters are loaded on construction into a compact
+    ParameterStore, iterating provides a Parameter object for each entry.
+    If lazy is True, the file is read again on every iteration, so the
+    memory usage does not depend on the size of the parameter set.
+    """
+
+    def __init__(
+        self, parameterset_file, strip_null_terminators=True, lazy=False
+    ) -> None:
+        self.parameterset_file = parameterset_file
+        self._strip_null_terminators = strip_null_terminators
+        self.parameters = None
+        self._index = None
 
         if strip_null_terminators:
             Logging.logger.info("Stripping null terminators from parameter set")
-            self.strip_null_terminators()
+        if not lazy:
+            self.parameters = ParameterStore(self._read())
+
+    def _read(self):
+        return read_parameter_set(self.parameterset_file, self._strip_null_terminators)
 
     def __iter__(self):
-        return iter(self.parameters)
+        if self.parameters is None:
+            return self._read()
+        return (view.to_parameter() for view in self.parameters)
 
     def __len__(self):
+        if self.parameters is None:
+            return sum(1 for _ in self._read())
         return len(self.parameters)
 
+    def __contains__(self, uid: str):
+        return uid in self.index()
+
+    def __getitem__(self, uid: str) -> Parameter:
+        """Determines the parameter with the provided uid
+
+        Parameters:
+            uid (str): uid of the parameter (including subindex)
+        Returns:
+            Parameter: Parameter of the parameter set
+        """
+        return self.index()[uid]
+
+    def index(self) -> dict:
+        """Returns a dict mapping the uids to the parameters (created on first use)
+
+        Returns:
+            dict: uid (key) and Parameter (value)
+        """
+        if self._index is None:
+            self._index = {parameter.uid(): parameter for parameter in self}
+        return self._index
+
     def _is_parameter_null_terminator(self, parameter: Parameter):
         """Determines if the parameter is a null terminator.
 
@@ -44,18 +175,15 @@ class ParameterSet:
         if not parameter.uid() in parameter_map:
             return None
 
-        data_type = parameter_map[parameter.uid()].data_type
-        if "STRING" in data_type:
-            last_index = int(data_type.strip("STRING()")) - 1
-            if parameter.subindex == last_index:
-                Logging.logger.debug(
-                    f"Parameter {parameter.uid()} is a null terminator"
-                )
-                return True
+        last_index = _string_last_index(parameter_map[parameter.uid()].data_type)
+        if parameter.subindex == last_index:
+            Logging.logger.debug(f"Parameter {parameter.uid()} is a null terminator")
+            return True
         return False
 
     def strip_null_terminators(self):
         """Removes all parameters from the parameter set that represent null terminators."""
-        self.parameters = list(
-            filter(lambda v: not self._is_parameter_null_terminator(v), self.parameters)
+        self.parameters = ParameterStore(
+            filter(lambda v: not self._is_parameter_null_terminator(v), self)
         )
+        self._index = None
@@ -0,0 +1,215 @@
+"""
+Contains ParameterStore class which stores many parameters of EDrives in a compact,
+columnar representation.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Any
+from edcon.edrive.parameter import Parameter, resolve_pnu
+from edcon.edrive.pnu_packing import pnu_unpack
+
+# Identifies the binary representation of a ParameterStore (see ParameterStore.to_bytes)
+BINARY_MAGIC = b"EDCONPS1"
+
+
+class ParameterView:
+    """Class providing the Parameter interface for one entry of a ParameterStore."""
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index: int):
+        self.store = store
+        self.index = index
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(axis={self.axis}, data_id={self.data_id}, "
+            f"instance={self.instance}, subindex={self.subindex}, "
+            f"value_raw={self.value_raw!r})"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, (ParameterView, Parameter)):
+            return NotImplemented
+        return (
+            self.axis == other.axis
+            and self.data_id == other.data_id
+            and self.instance == other.instance
+            and self.subindex == other.subindex
+            and self.value_raw == other.value_raw
+        )
+
+    __hash__ = None
+
+    @property
+    def axis(self) -> int:
+        """Returns the axis of the parameter"""
+        return self.store.axes[self.index]
+
+    @property
+    def data_id(self) -> int:
+        """Returns the data id of the parameter"""
+        return self.store.data_ids[self.index]
+
+    @property
+    def instance(self) -> int:
+        """Returns the instance of the parameter"""
+        return self.store.instances[self.index]
+
+    @property
+    def subindex(self) -> int:
+        """Returns the subindex of the parameter"""
+        return self.store.subindices[self.index]
+
+    @property
+    def value_raw(self) -> bytes:
+        """Returns the raw value of the parameter"""
+        offsets = self.store.offsets
+        return bytes(self.store.values[offsets[self.index] : offsets[self.index + 1]])
+
+    @property
+    def value(self) -> Any:
+        """Returns the value of the parameter.
+
+        Returns:
+            Any: Value in correct data type
+        """
+        return pnu_unpack(self.pnu(), self.value_raw)
+
+    def pnu(self) -> int:
+        """Returns the PNU of the parameter.
+
+        Returns:
+            int: PNU, None if the parameter is not available in the parameter map
+        """
+        return resolve_pnu(self.axis, self.data_id, self.instance)
+
+    def uid(self) -> str:
+        """Returns the uid of the parameter.
+
+        Returns:
+            str: uid
+        """
+        return f"{self.axis}.{self.data_id}.{self.instance}.{self.subindex}"
+
+    def to_parameter(self) -> Parameter:
+        """Returns an independent Parameter containing the values of the entry"""
+        return Parameter(
+            self.axis, self.data_id, self.instance, self.subindex, self.value_raw
+        )
+
+
+class ParameterStore:
+    """Class storing parameters in parallel arrays.
+
+    The ids of the parameters are stored in array('I') columns and all raw values
+    in a single contiguous buffer (with offsets), instead of one object per parameter.
+    Iteration and indexing provide ParameterView objects which can be used like
+    Parameter objects (but are read-only).
+    """
+
+    def __init__(self, parameters=None):
+        """Constructor of the ParameterStore class.
+
+        Parameters:
+            parameters (Iterable): Optional parameters to add to the store
+        """
+        self.axes = array("I")
+        self.data_ids = array("I")
+        self.instances = array("I")
+        self.subindices = array("I")
+        self.offsets = array("I", [0])
+        self.values = bytearray()
+
+        for parameter in parameters or []:
+            self.append(parameter)
+
+    def __len__(self):
+        return len(self.axes)
+
+    def __getitem__(self, index: int) -> ParameterView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ParameterStore index out of range")
+        return ParameterView(self, index)
+
+    def __iter__(self):
+        return (ParameterView(self, index) for index in range(len(self)))
+
+    def append(self, parameter):
+        """Adds a parameter to the store
+
+        Parameters:
+            parameter (Parameter): Parameter that should be added (values are copied)
+        """
+        self.axes.append(parameter.axis)
+        self.data_ids.append(parameter.data_id)
+        self.instances.append(parameter.instance)
+        self.subindices.append(parameter.subindex)
+        self.values += parameter.value_raw or b""
+        self.offsets.append(len(self.values))
+
+    def nbytes(self) -> int:
+        """Returns the size (in bytes) of the stored data
+
+        Returns:
+            int: Size of the columns and the value buffer
+        """
+        return sum(column.itemsize * len(column) for column in self._columns()) + len(
+            self.values
+        )
+
+    def _columns(self) -> list:
+        return [self.axes, self.data_ids, self.instances, self.subindices, self.offsets]
+
+    def to_bytes(self) -> bytes:
+        """Returns the binary representation of the store.
+
+        It consists of BINARY_MAGIC, the number of parameters, the columns
+        (little-endian uint32) and the value buffer.
+
+        Returns:
+            bytes: Binary representation
+        """
+        chunks = [BINARY_MAGIC, struct.pack("<I", len(self))]
+        for column in self._columns():
+            column = array("I", column)
+            if sys.byteorder == "big":
+                column.byteswap()
+            chunks.append(column.tobytes())
+        chunks.append(bytes(self.values))
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """Creates a store from its binary representation (see to_bytes)
+
+        Parameters:
+            data (bytes): Binary representation
+
+        Returns:
+            ParameterStore: Store containing the parameters
+
+        Raises:
+            ValueError: If the data is not a valid binary representation
+        """
+        if not data.startswith(BINARY_MAGIC):
+            raise ValueError("Data is not a binary parameter store")
+        (length,) = struct.unpack_from("<I", data, len(BINARY_MAGIC))
+        position = len(BINARY_MAGIC) + 4
+
+        store = cls()
+        for column in store._columns():
+            count = length + 1 if column is store.offsets else length
+            del column[:]
+            column.frombytes(data[position : position + 4 * count])
+            if sys.byteorder == "big":
+                column.byteswap()
+            position += 4 * count
+        store.values = bytearray(data[position:])
+        if len(store.offsets) != length + 1 or store.offsets[-1] != len(store.values):
+            raise ValueError("Binary parameter store is truncated")
+        return store
@@ -1,9 +1,12 @@
 """Contains functions which provide mapping of PNU types."""
 
 import struct
+from functools import lru_cache
 from typing import Any
 from edcon.utils.logging import Logging
-from edcon.edrive.parameter_mapping import PnuMap
+from edcon.edrive.parameter_mapping import read_pnu_map_file
+
+logger = Logging.get_logger("pnu")
 
 PNU_TYPE_TO_FORMAT_CHAR = {
     "BOOL": "?",
@@ -19,6 +22,118 @@ PNU_TYPE_TO_FORMAT_CHAR = {
 }
 
 
+class PnuCodec:
+    """Class that packs and unpacks the values of one PNU.
+
+    The struct is compiled once, so packing and unpacking only requires
+    a single call of the precompiled struct.
+    """
+
+    __slots__ = ("pnu", "name", "data_type", "struct", "convert")
+
+    def __init__(self, pnu: int, name: str, data_type: str):
+        """Constructor of the PnuCodec class.
+
+        Parameters:
+            pnu (int): PNU number
+            name (str): Name of the PNU
+            data_type (str): Data type of the PNU as used in the pnu_map_file
+        """
+        self.pnu = pnu
+        self.name = name
+        self.data_type = data_type
+        self.struct = None
+        self.convert = None
+        if "STRING" not in data_type:
+            self.struct = struct.Struct(PNU_TYPE_TO_FORMAT_CHAR[data_type])
+        if "INT" in data_type:
+            self.convert = int
+        elif "REAL" in data_type:
+            self.convert = float
+
+    def unpack(self, raw: bytes) -> Any:
+        """Unpacks a raw byte value (trailing padding bytes are ignored)
+
+        Parameters:
+            raw (bytes): Raw bytes value that should be unpacked.
+
+        Returns:
+            value: Unpacked value
+        """
+        if self.struct is None:
+            return bytes(raw)
+        return self.struct.unpack_from(raw)[0]
+
+    def pack(self, value: Any) -> bytes:
+        """Packs a provided value to raw bytes object
+
+        Parameters:
+            value: Value that should be packed.
+
+        Returns:
+            bytes: Packed value
+        """
+        if self.struct is None:
+            return bytes(value, encoding="ascii")
+        if self.convert is not None:
+            value = self.convert(value)
+        return self.struct.pack(value)
+
+
+@lru_cache
+def create_pnu_codec_table() -> dict:
+    """Creates a dict based on the PNU map items shipped with the package.
+        It maps PNU ids to precompiled PnuCodec instances.
+
+    Returns:
+        dict: PNU ids (key) and PnuCodec instances (value)
+    """
+    pnu_list = read_pnu_map_file()
+    logger.info("Create codec table for %s PNUs", len(pnu_list))
+    return {
+        item.pnu: PnuCodec(item.pnu, item.name, item.data_type) for item in pnu_list
+    }
+
+
+@lru_cache
+def forced_format_struct(forced_format: str) -> struct.Struct:
+    """Returns the precompiled struct for a forced format
+
+    Parameters:
+        forced_format (str): Format char (see struct)
+
+    Returns:
+        Struct: Precompiled struct
+    """
+    return struct.Struct(forced_format)
+
+
+def pnu_codec(pnu: int) -> PnuCodec:
+    """Determines the PnuCodec of a provided PNU
+
+    Parameters:
+        pnu (int): PNU number.
+
+    Returns:
+        PnuCodec: Codec of the PNU
+
+    Raises:
+        KeyError: If the PNU is not available in the pnu_map_file
+    """
+    try:
+        return create_pnu_codec_table()[pnu]
+    except KeyError:
+        logger.error("PNU %s not available in pnu_map", pnu)
+        raise
+
+
+def _unpack_forced(raw: bytes, forced_format: str) -> Any:
+    """Unpacks a raw byte value using a forced format"""
+    if forced_format == "s":
+        return bytes(raw)
+    return forced_format_struct(forced_format).unpack_from(raw)[0]
+
+
 def pnu_unpack(pnu: int, raw: bytes, forced_format: str = None) -> Any:
     """Unpacks a raw byte value to specific type.
        The type is determined by the pnu_map_file shipped with the package.
@@ -31,34 +146,16 @@ def pnu_unpack(pnu: int, raw: bytes, forced_format: str = None) -> Any:
     Returns:
         value: Unpacked value with determined type
     """
-    if forced_format:
-        Logging.logger.info(f"PNU {pnu} forced to type ({forced_format})")
-        unpack_data_type = forced_format
-    else:
-        pnu_map = PnuMap()
-        pnu_data_type = pnu_map[pnu].data_type
-        pnu_name = pnu_map[pnu].name
-        Logging.logger.info(f"PNU {pnu} ({pnu_name}) is of type {pnu_data_type}")
-        if "STRING" in pnu_data_type:
-            unpack_data_type = f"{len(raw)}s"
-
-        else:
-            unpack_data_type = PNU_TYPE_TO_FORMAT_CHAR[pnu_data_type]
-
     try:
-        if unpack_data_type == "s":
-            value = struct.unpack(f"{len(raw)}s", raw)[0]
-        if unpack_data_type == "?":
-            value = struct.unpack("b", raw[0:1])[0]
-        if unpack_data_type == "B":
-            value = struct.unpack("B", raw[0:1])[0]
-        if unpack_data_type == "b":
-            value = struct.unpack("b", raw[0:1])[0]
-        else:
-            value = struct.unpack(unpack_data_type, raw)[0]
-        return value
+        if forced_format:
+            logger.info("PNU %s forced to type (%s)", pnu, forced_format)
+            return _unpack_forced(raw, forced_format)
+
+        codec = pnu_codec(pnu)
+        logger.info("PNU %s (%s) is of type %s", pnu, codec.name, codec.data_type)
+        return codec.unpack(raw)
     except struct.error as error:
-        Logging.logger.error(f"Unpack failed: {error}")
+        logger.error("Unpack failed: %s", error)
         return None
 
 
@@ -74,19 +171,52 @@ def pnu_pack(pnu: int, value: Any, forced_format: str = None) -> bytes:
     Returns:
         bytes: Packed value
     """
-    if not forced_format:
-        pnu_map = PnuMap()
-        pnu_data_type = pnu_map[pnu].data_type
-        pnu_name = pnu_map[pnu].name
-        Logging.logger.info(f"PNU {pnu} ({pnu_name}) is of type {pnu_data_type}")
-
-        if "INT" in pnu_data_type:
-            value = int(value)
-        if "REAL" in pnu_data_type:
-            value = float(value)
-        if "STRING" in pnu_data_type:
-            return struct.pack("s", bytes(value, encoding="ascii"))
-        return struct.pack(PNU_TYPE_TO_FORMAT_CHAR[pnu_data_type], value)
-
-    Logging.logger.info(f"PNU {pnu} forced to type ({forced_format})")
-    return struct.pack(forced_format, value)
+    if forced_format:
+        logger.info("PNU %s forced to type (%s)", pnu, forced_format)
+        return forced_format_struct(forced_format).pack(value)
+
+    codec = pnu_codec(pnu)
+    logger.info("PNU %s (%s) is of type %s", pnu, codec.name, codec.data_type)
+    return codec.pack(value)
+
+
+def pnu_unpack_many(items: list, forced_format: str = None) -> list:
+    """Unpacks multiple raw byte values using the codec table.
+
+    Parameters:
+        items (list): List of (pnu, raw) tuples that should be unpacked.
+        forced_format (str): Optional format char (see struct) used for all PNUs.
+
+    Returns:
+        list: Unpacked value for each provided item (None if raw is empty or unpacking failed)
+    """
+    values = []
+    for pnu, raw in items:
+        if not raw:
+            values.append(None)
+            continue
+        try:
+            if forced_format:
+                values.append(_unpack_forced(raw, forced_format))
+            else:
+                values.append(pnu_codec(pnu).unpack(raw))
+        except struct.error as error:
+            logger.error("Unpack of PNU %s failed: %s", pnu, error)
+            values.append(None)
+    return values
+
+
+def pnu_pack_many(items: list, forced_format: str = None) -> list:
+    """Packs multiple values using the codec table.
+
+    Parameters:
+        items (list): List of (pnu, value) tuples that should be packed.
+        forced_format (str): Optional format char (see struct) used for all PNUs.
+
+    Returns:
+        list: Packed value for each provided item
+    """
+    if forced_format:
+        forced_struct = forced_format_struct(forced_format)
+        return [forced_struct.pack(value) for _, value in items]
+    return [pnu_codec(pnu).pack(value) for pnu, value in items]
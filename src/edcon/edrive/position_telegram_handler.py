@@ -2,39 +2,16 @@
 
 from edcon.utils.logging import Logging
 from edcon.edrive.telegram_handler import TelegramHandler
-from edcon.utils.func_helpers import func_sequence, wait_for
+from edcon.edrive.telegram_handler_base import PositionTelegramHandlerBase
+from edcon.utils.func_helpers import func_sequence
 
 
-class PositionTelegramHandler(TelegramHandler):
+class PositionTelegramHandler(TelegramHandler, PositionTelegramHandlerBase):
     """Basic class for executing position telegrams."""
 
     def __init__(self, telegram, com) -> None:
         super().__init__(telegram, com)
-        # Set default bits for position telegrams
-        self.telegram.stw1.do_not_reject_traversing_task = True
-        self.telegram.stw1.no_intermediate_stop = True
-
-    def position_info_string(self):
-        """Returns string containing position information
-
-        Returns:
-            str: String containing position information
-        """
-        return (
-            f"Position [Target, Current]: "
-            f"[{int(self.telegram.mdi_tarpos)}, {int(self.telegram.xist_a)}]"
-        )
-
-    def velocity_info_string(self):
-        """Returns string containing velocity information
-
-        Returns:
-            str: String containing velocity information
-        """
-        return (
-            f"Velocity [Target, Current]: "
-            f"[{int(self.telegram.mdi_velocity)}, {int(self.telegram.nist_b)}]"
-        )
+        self._configure_position_bits()
 
     def configure_traversing_to_fixed_stop(self, active: bool):
         """Configures the traversing to fixed stop option (drive maintains parametrized torque)
@@ -202,21 +179,6 @@ class PositionTelegramHandler(TelegramHandler):
 
         Logging.logger.info("=> Finished record change")
 
-    def _prepare_stop_motion_task_bits(self):
-        """Prepares the telegram bits for stopping the current motion"""
-        # Reset activate_traversing_task bit to prepare for next time
-        self.telegram.stw1.activate_traversing_task = False
-
-        # Reset jog bits (in case jogging motion was performed)
-        self.telegram.stw1.jog1_on = False
-        self.telegram.stw1.jog2_on = False
-
-        # Reset referencing bits (in case referencing motion was performed)
-        self.telegram.stw1.start_homing_procedure = False
-
-        # Actual stop command
-        self.telegram.stw1.do_not_reject_traversing_task = False
-
     def stop_motion_task(self):
         """Stops any currently active motion task"""
         Logging.logger.info("Stopping motion")
@@ -269,10 +231,7 @@ class PositionTelegramHandler(TelegramHandler):
 
     def _prepare_activate_traversing_task(self):
         # If continuous update not active: ensure the generation of a rising edge
-        if (
-            not self.telegram.pos_stw1.continuous_update
-            and self.telegram.stw1.activate_traversing_task
-        ):
+        if self._rising_edge_required():
             self.telegram.stw1.activate_traversing_task = False
             self.update_outputs()
         self.telegram.stw1.activate_traversing_task = True
@@ -284,9 +243,7 @@ class PositionTelegramHandler(TelegramHandler):
         absolute: bool = False,  # pylint: disable=unused-argument
     ):
         """Prepares the telegram bits for positioning task"""
-        self.telegram.pos_stw1.activate_setup = False
-        self.telegram.mdi_tarpos.value = position
-        self.telegram.mdi_velocity.value = velocity
+        self._prepare_position_setpoints(position, velocity)
         self._prepare_activate_traversing_task()
 
     def position_task(
@@ -364,9 +321,7 @@ class PositionTelegramHandler(TelegramHandler):
             return True
 
         # Wait for predefined amount of time
-        if not wait_for(
-            duration, self.not_operational, self.position_info_string, self.fault_string
-        ):
+        if not self.wait_for_or_not_operational(duration, self.position_info_string):
             return False
 
         self.stop_motion_task()
@@ -2,10 +2,9 @@
 
 import time
 from edcon.utils.logging import Logging
-from edcon.edrive.diagnosis import diagnosis_name, diagnosis_remedy
+from edcon.edrive.diagnosis import fault_description
 from edcon.edrive.position_telegram_handler import PositionTelegramHandler
 from edcon.profidrive.telegram111 import Telegram111
-from edcon.utils.func_helpers import wait_for
 from edcon.edrive.parameter_handler import ParameterHandler
 from edcon.edrive.parameter import Parameter
 
@@ -162,12 +161,7 @@ class Telegram111Handler(PositionTelegramHandler):
             if time.time() - start_time > timeout:
                 return f"Fault reason could not be determined within {timeout} s"
 
-        fault_desc = (
-            f"Cancelled due to fault: {diagnosis_name(fault_code)} ({fault_code})"
-        )
-        for i, remedy in enumerate(diagnosis_remedy(fault_code)):
-            fault_desc += f"\nPossible remedy {str(i+1)}: {remedy}"
-        return fault_desc
+        return fault_description(fault_code)
 
     def wait_for_referencing_task_ack(self) -> bool:
         """Waits for drive to be referenced
@@ -241,9 +235,7 @@ class Telegram111Handler(PositionTelegramHandler):
             return False
 
         # Wait for predefined amount of time
-        if not wait_for(
-            duration, self.not_operational, self.velocity_info_string, self.fault_string
-        ):
+        if not self.wait_for_or_not_operational(duration, self.velocity_info_string):
             return False
 
         self.stop_motion_task()
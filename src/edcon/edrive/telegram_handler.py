@@ -3,22 +3,15 @@
 import traceback
 from collections.abc import Callable
 from edcon.utils.logging import Logging
-from edcon.utils.func_helpers import func_sequence, wait_until
+from edcon.utils.func_helpers import func_sequence, wait_for, wait_until
+from edcon.edrive.telegram_handler_base import TelegramHandlerBase
 
 
-class TelegramHandler:
+class TelegramHandler(TelegramHandlerBase):
     """Basic class for executing telegrams."""
 
     def __init__(self, telegram, com) -> None:
-        self.telegram = telegram
-
-        # Configure generic values of the telegram
-        self.telegram.stw1.control_by_plc = True
-        self.telegram.stw1.no_coast_stop = True
-        self.telegram.stw1.no_quick_stop = True
-        self.telegram.stw1.enable_operation = True
-
-        self.com = com
+        super().__init__(telegram, com)
         # Start process data
         self.com.start_io()
 
@@ -72,8 +65,8 @@ class TelegramHandler:
             cond,
             self.fault_present,
             timeout=timeout,
-            info_string=info_string,
-            error_string=self.fault_string,
+            wake_event=self.com.io_cycle_event(),
+            **self._wait_arguments(info_string),
         )
 
     def wait_until_or_not_operational(
@@ -87,17 +80,22 @@ class TelegramHandler:
             cond,
             self.not_operational,
             timeout=timeout,
-            info_string=info_string,
-            error_string=self.fault_string,
+            wake_event=self.com.io_cycle_event(),
+            **self._wait_arguments(info_string),
         )
 
-    def fault_string(self) -> str:
-        """Returns string containing fault reason
-
-        Returns:
-            str: String containing the fault reason
-        """
-        return "Unknown fault"
+    def wait_for_or_not_operational(
+        self,
+        duration: float,
+        info_string: Callable[[], str] = None,
+    ):
+        """Waits for the provided duration until not_operational is present."""
+        return wait_for(
+            duration,
+            self.not_operational,
+            wake_event=self.com.io_cycle_event(),
+            **self._wait_arguments(info_string),
+        )
 
     def fault_present(self) -> bool:
         """Gives information whether a fault is present
@@ -106,10 +104,7 @@ class TelegramHandler:
             bool: True if fault presens, False otherwise
         """
         self.update_inputs()
-        if self.telegram.zsw1.fault_present:
-            Logging.logger.error("Fault bit is present")
-            return True
-        return False
+        return self._fault_bit_present()
 
     def not_operational(self) -> bool:
         """Gives information whether a fault is present
@@ -118,13 +113,7 @@ class TelegramHandler:
             bool: True if fault present, False otherwise
         """
         self.update_inputs()
-        if self.telegram.zsw1.fault_present:
-            Logging.logger.error("Fault bit is present")
-            return True
-        if not self.telegram.zsw1.operation_enabled:
-            Logging.logger.error("Drive is not operational")
-            return True
-        return False
+        return self._not_operational_bits_present()
 
     def plc_control_granted(self) -> bool:
         """Gives information if PLC control is granted
@@ -135,11 +124,7 @@ class TelegramHandler:
         Logging.logger.info("Check if PLC control is granted")
 
         self.update_inputs()
-        if not self.telegram.zsw1.control_requested:
-            Logging.logger.info("=> PLC control denied")
-            return False
-        Logging.logger.info("=> PLC control granted")
-        return True
+        return self._plc_control_bit_granted()
 
     def ready_for_motion(self):
         """Gives information if motion tasks can be started
@@ -151,35 +136,7 @@ class TelegramHandler:
             return False
         Logging.logger.info("Check if drive is ready for motion")
         self.update_inputs()
-        if not self.telegram.zsw1.operation_enabled:
-            Logging.logger.info("=> Drive not ready for motion")
-            return False
-        Logging.logger.info("=> Drive is ready for motion")
-        return True
-
-    def configure_coast_stop(self, active: bool):
-        """Configures the coast stop option
-
-        Parameters:
-            active (bool): True => activate coasting, False => deactivate coasting
-        """
-        self.telegram.stw1.no_coast_stop = not active
-
-    def configure_quick_stop(self, active: bool):
-        """Configures the quick stop option
-
-        Parameters:
-            active (bool): True => activate quick stop, False => deactivate quick stop
-        """
-        self.telegram.stw1.no_quick_stop = not active
-
-    def configure_brake(self, active: bool):
-        """Configures the holding brake
-
-        Parameters:
-            active (bool): True => activate brake, False => release brake
-        """
-        self.telegram.stw1.open_holding_brake = not active
+        return self._ready_for_motion_bits_present()
 
     def acknowledge_faults(self, timeout: float = 5.0) -> bool:
         """Send telegram to acknowledge present faults of the EDrive
@@ -233,12 +190,9 @@ class TelegramHandler:
             self.update_inputs()
             return self.telegram.zsw1.operation_enabled
 
-        if not self.wait_until_or_fault(cond, timeout=timeout):
-            Logging.logger.error("Operation inhibited")
-            return False
-
-        Logging.logger.info("=> Powerstage enabled")
-        return True
+        return self._powerstage_result(
+            self.wait_until_or_fault(cond, timeout=timeout), "enabled"
+        )
 
     def disable_powerstage(self, timeout: float = 5.0) -> bool:
         """Send telegram to disable the power stage"""
@@ -250,9 +204,6 @@ class TelegramHandler:
             self.update_inputs()
             return not self.telegram.zsw1.operation_enabled
 
-        if not self.wait_until_or_fault(cond, timeout=timeout):
-            Logging.logger.error("Operation inhibited")
-            return False
-
-        Logging.logger.info("=> Powerstage disabled")
-        return True
+        return self._powerstage_result(
+            self.wait_until_or_fault(cond, timeout=timeout), "disabled"
+        )
@@ -0,0 +1,197 @@
+"""
+Contains the parts of the telegram handlers which do not depend on how the
+process data is exchanged. They are shared by the blocking and the asyncio
+telegram handlers.
+"""
+
+from collections.abc import Callable
+from edcon.utils.logging import Logging
+from edcon.utils.progress_reporter import ProgressReporter
+
+
+class TelegramHandlerBase:
+    """Basic class containing the telegram configuration and status evaluation."""
+
+    # Minimum time (in s) between two progress messages of the wait functions
+    progress_interval: float = 0.5
+
+    def __init__(self, telegram, com) -> None:
+        self.telegram = telegram
+
+        # Configure generic values of the telegram
+        self.telegram.stw1.control_by_plc = True
+        self.telegram.stw1.no_coast_stop = True
+        self.telegram.stw1.no_quick_stop = True
+        self.telegram.stw1.enable_operation = True
+
+        self.com = com
+
+    def _wait_arguments(self, info_string: Callable[[], str]) -> dict:
+        """Returns the keyword arguments shared by all wait functions"""
+        return {
+            "info_string": self._progress_reporter(info_string),
+            "error_string": self.fault_string,
+        }
+
+    def _progress_reporter(self, info_string: Callable[[], str]) -> ProgressReporter:
+        """Returns a ProgressReporter which logs changed info strings at a limited rate"""
+        if info_string is None:
+            return None
+        return ProgressReporter(info_string, interval=self.progress_interval)
+
+    def fault_string(self) -> str:
+        """Returns string containing fault reason
+
+        Returns:
+            str: String containing the fault reason
+        """
+        return "Unknown fault"
+
+    def _fault_bit_present(self) -> bool:
+        """Evaluates the fault bit of the last received inputs
+
+        Returns:
+            bool: True if fault present, False otherwise
+        """
+        if self.telegram.zsw1.fault_present:
+            Logging.logger.error("Fault bit is present")
+            return True
+        return False
+
+    def _not_operational_bits_present(self) -> bool:
+        """Evaluates the fault and operation enabled bits of the last received inputs
+
+        Returns:
+            bool: True if fault present or operation not enabled, False otherwise
+        """
+        if self._fault_bit_present():
+            return True
+        if not self.telegram.zsw1.operation_enabled:
+            Logging.logger.error("Drive is not operational")
+            return True
+        return False
+
+    def _plc_control_bit_granted(self) -> bool:
+        """Evaluates the control requested bit of the last received inputs
+
+        Returns:
+            bool: True if PLC control is granted, False otherwise
+        """
+        if not self.telegram.zsw1.control_requested:
+            Logging.logger.info("=> PLC control denied")
+            return False
+        Logging.logger.info("=> PLC control granted")
+        return True
+
+    def _ready_for_motion_bits_present(self) -> bool:
+        """Evaluates the operation enabled bit of the last received inputs
+
+        Returns:
+            bool: True if drive is ready for motion tasks, False otherwise
+        """
+        if not self.telegram.zsw1.operation_enabled:
+            Logging.logger.info("=> Drive not ready for motion")
+            return False
+        Logging.logger.info("=> Drive is ready for motion")
+        return True
+
+    def _powerstage_result(self, success: bool, state: str) -> bool:
+        """Logs the result of enabling or disabling the power stage
+
+        Parameters:
+            success (bool): True if the expected state was reached
+            state (str): Reached state, e.g. "enabled"
+
+        Returns:
+            bool: success
+        """
+        if not success:
+            Logging.logger.error("Operation inhibited")
+            return False
+
+        Logging.logger.info(f"=> Powerstage {state}")
+        return True
+
+    def configure_coast_stop(self, active: bool):
+        """Configures the coast stop option
+
+        Parameters:
+            active (bool): True => activate coasting, False => deactivate coasting
+        """
+        self.telegram.stw1.no_coast_stop = not active
+
+    def configure_quick_stop(self, active: bool):
+        """Configures the quick stop option
+
+        Parameters:
+            active (bool): True => activate quick stop, False => deactivate quick stop
+        """
+        self.telegram.stw1.no_quick_stop = not active
+
+    def configure_brake(self, active: bool):
+        """Configures the holding brake
+
+        Parameters:
+            active (bool): True => activate brake, False => release brake
+        """
+        self.telegram.stw1.open_holding_brake = not active
+
+
+class PositionTelegramHandlerBase(TelegramHandlerBase):
+    """Basic class containing the bit handling of position telegrams."""
+
+    def _configure_position_bits(self):
+        """Sets the default bits for position telegrams"""
+        self.telegram.stw1.do_not_reject_traversing_task = True
+        self.telegram.stw1.no_intermediate_stop = True
+
+    def position_info_string(self):
+        """Returns string containing position information
+
+        Returns:
+            str: String containing position information
+        """
+        return (
+            f"Position [Target, Current]: "
+            f"[{int(self.telegram.mdi_tarpos)}, {int(self.telegram.xist_a)}]"
+        )
+
+    def velocity_info_string(self):
+        """Returns string containing velocity information
+
+        Returns:
+            str: String containing velocity information
+        """
+        return (
+            f"Velocity [Target, Current]: "
+            f"[{int(self.telegram.mdi_velocity)}, {int(self.telegram.nist_b)}]"
+        )
+
+    def _prepare_stop_motion_task_bits(self):
+        """Prepares the telegram bits for stopping the current motion"""
+        # Reset activate_traversing_task bit to prepare for next time
+        self.telegram.stw1.activate_traversing_task = False
+
+        # Reset jog bits (in case jogging motion was performed)
+        self.telegram.stw1.jog1_on = False
+        self.telegram.stw1.jog2_on = False
+
+        # Reset referencing bits (in case referencing motion was performed)
+        self.telegram.stw1.start_homing_procedure = False
+
+        # Actual stop command
+        self.telegram.stw1.do_not_reject_traversing_task = False
+
+    def _rising_edge_required(self) -> bool:
+        """Determines whether activate_traversing_task has to be reset first
+        (if continuous update is not active) to generate a rising edge"""
+        return (
+            not self.telegram.pos_stw1.continuous_update
+            and self.telegram.stw1.activate_traversing_task
+        )
+
+    def _prepare_position_setpoints(self, position: int, velocity: int):
+        """Sets the setpoints of a positioning task"""
+        self.telegram.pos_stw1.activate_setup = False
+        self.telegram.mdi_tarpos.value = position
+        self.telegram.mdi_velocity.value = velocity
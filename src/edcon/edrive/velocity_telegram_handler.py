@@ -2,7 +2,6 @@
 
 from edcon.utils.logging import Logging
 from edcon.edrive.telegram_handler import TelegramHandler
-from edcon.utils.func_helpers import wait_for
 
 
 class VelocityTelegramHandler(TelegramHandler):
@@ -59,9 +58,7 @@ class VelocityTelegramHandler(TelegramHandler):
             return True
 
         # Wait for predefined amount of time
-        if not wait_for(
-            duration, self.not_operational, self.velocity_info_string, self.fault_string
-        ):
+        if not self.wait_for_or_not_operational(duration, self.velocity_info_string):
             return False
 
         self.stop_motion_task()
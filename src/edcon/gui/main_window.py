@@ -11,6 +11,7 @@ from edcon.gui.parameter_tab import ParameterTab
 from edcon.gui.processdata_tab import ProcessDataTab
 from edcon.gui.motion_tab import MotionTab
 from edcon.edrive.com_modbus import ComModbus
+from edcon.edrive.com_cache import CachedCom
 
 
 class MainWindow(QMainWindow):
@@ -31,9 +32,12 @@ class MainWindow(QMainWindow):
 
         self.tabWidget.addTab(MotionTab(self.get_com_function), "Motion")
         self.tabWidget.addTab(ProcessDataTab(self.get_com_function), "Process data")
-        self.tabWidget.addTab(
-            ParameterTab(self.pnu_read_function, self.pnu_write_function), "Parameter"
+        self.parameter_tab = ParameterTab(
+            self.pnu_read_function,
+            self.pnu_write_function,
+            self.get_pnus_read_function,
         )
+        self.tabWidget.addTab(self.parameter_tab, "Parameter")
         self.tabWidget.currentChanged.connect(self.on_tab_change)
 
     # pylint: disable=unused-argument
@@ -43,6 +47,13 @@ class MainWindow(QMainWindow):
         for i in range(self.tabWidget.count()):
             self.tabWidget.widget(i).reset()
 
+    # pylint: disable=invalid-name
+    # PyQt API naming
+    def closeEvent(self, event):
+        """Stops the background PNU reads before the window is closed."""
+        self.parameter_tab.model.stop_updates()
+        super().closeEvent(event)
+
     @property
     def com(self):
         """
@@ -54,8 +65,11 @@ class MainWindow(QMainWindow):
         return self._com
 
     def connect_function(self, ip_address):
-        """Establishes the connection using the communication driver."""
-        self._com = ComModbus(ip_address=ip_address, timeout_ms=0)
+        """Establishes the connection using the communication driver.
+        Reads of static configuration PNUs (e.g. scaling factors) are cached."""
+        self._com = CachedCom(
+            ComModbus(ip_address=ip_address, timeout_ms=0, batched_pnu_access=True)
+        )
 
     def get_com_function(self):
         """
@@ -68,6 +82,17 @@ class MainWindow(QMainWindow):
         """Reads a PNU using the communication driver."""
         return self.com.read_pnu(pnu)
 
+    def get_pnus_read_function(self):
+        """
+        Returns a function reading multiple PNUs using the communication driver.
+        Trys to establish the connection if not yet established.
+        The returned function can be called from other threads.
+        """
+        com = self.com
+        if com is None:
+            return None
+        return lambda pnus: com.read_pnus([(pnu, 0) for pnu in pnus])
+
     def pnu_write_function(self, pnu, value):
         """Writes a PNU using the communication driver."""
         return self.com.write_pnu(pnu, value=value)
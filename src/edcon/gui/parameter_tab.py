@@ -13,12 +13,14 @@ from edcon.gui.pyqt_helpers import checkmark, ballot
 class ParameterTab(QWidget):
     """Defines the parameter tab widget."""
 
-    def __init__(self, pnu_read_func, pnu_write_func):
+    def __init__(self, pnu_read_func, pnu_write_func, get_pnus_read_func=None):
         super().__init__()
         loadUi(PurePath(files("edcon") / "gui" / "ui" / "parameter_tab.ui"), self)
 
         self.read_pnu = pnu_read_func
         self.write_pnu = pnu_write_func
+        # Provides the function used to read the PNU list in a background thread
+        self.get_pnus_read_func = get_pnus_read_func
         # Create an instance of ParameterTableModel
         self.model = ParameterTableModel()
 
@@ -83,4 +85,9 @@ class ParameterTab(QWidget):
 
     def button_pnu_list_update_clicked(self):
         """Button click callback for PNU list update."""
-        self.model.update_all_values(self.read_pnu)
+        if self.get_pnus_read_func is None:
+            self.model.update_all_values(self.read_pnu)
+            return
+        pnus_read_func = self.get_pnus_read_func()
+        if pnus_read_func is not None:
+            self.model.start_update_all_values(pnus_read_func)
@@ -3,7 +3,8 @@
 from dataclasses import dataclass, astuple, fields
 from typing import Any
 from PyQt5 import QtCore
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from pymodbus.exceptions import ModbusException
 from edcon.utils.logging import Logging
 from edcon.edrive.parameter_mapping import read_pnu_map_file
 
@@ -19,6 +20,69 @@ class PnuDataItem:
     value: Any
 
 
+class ParameterRefreshThread(QThread):
+    """Thread reading the values of PNUs in batches.
+
+    The values of each batch are provided by the values_read signal together
+    with the generation of the refresh. If a batch can not be read, its PNUs
+    are read one at a time, so only the PNUs that fail are missing. The thread
+    stops after the current PNU access if an interruption is requested.
+    """
+
+    read_errors = (ModbusException, ValueError, AttributeError, ConnectionError)
+
+    values_read = pyqtSignal(int, list)
+
+    def __init__(self, generation, pnus, pnus_read_func, batch_size=32):
+        """Constructor of the ParameterRefreshThread class.
+
+        Parameters:
+            generation (int): Generation of the refresh provided with the values
+            pnus (list): PNUs that should be read
+            pnus_read_func (function): function to read a list of PNUs
+            batch_size (int): Number of PNUs read by one call of pnus_read_func
+        """
+        super().__init__()
+        self.generation = generation
+        self.pnus = pnus
+        self.pnus_read_func = pnus_read_func
+        self.batch_size = batch_size
+
+    def run(self):
+        """Reads the PNUs batch by batch until finished or interrupted"""
+        for start in range(0, len(self.pnus), self.batch_size):
+            if self.isInterruptionRequested():
+                Logging.logger.info("PNU list update cancelled")
+                return
+            batch = self.pnus[start : start + self.batch_size]
+            try:
+                values = list(zip(batch, self.pnus_read_func(batch)))
+            except self.read_errors:
+                Logging.logger.error("Could not access PNU registers %s", batch)
+                values = self.read_single(batch)
+            if values:
+                self.values_read.emit(self.generation, values)
+
+    def read_single(self, pnus):
+        """Reads the PNUs one at a time, PNUs that can not be read are omitted
+
+        Parameters:
+            pnus (list): PNUs that should be read
+
+        Returns:
+            list: (pnu, value) tuples of the PNUs that have been read
+        """
+        values = []
+        for pnu in pnus:
+            if self.isInterruptionRequested():
+                break
+            try:
+                values.append((pnu, self.pnus_read_func([pnu])[0]))
+            except self.read_errors:
+                Logging.logger.error("Could not access PNU register %s", pnu)
+        return values
+
+
 class ParameterTableModel(QtCore.QAbstractTableModel):
     """Defines the model for the parameter table."""
 
@@ -30,22 +94,89 @@ class ParameterTableModel(QtCore.QAbstractTableModel):
         self._headers = [field.name for field in fields(PnuDataItem)]
 
         self._data = [PnuDataItem(*pnu, "") for pnu in pnu_list]
+        self._items = {data.pnu: data for data in self._data}
         self._filtered_data = self._data
+        self._rows = {data.pnu: row for row, data in enumerate(self._filtered_data)}
+
+        # Results of cancelled refreshes (older generations) are discarded
+        self._refresh_generation = 0
+        self._refresh_threads = set()
 
     def set_name_filter(self, name_filter):
-        """uses name filter to filter the data
+        """uses name filter to filter the data, a running update is cancelled
 
         Parameters:
             name_filter (str): string sequence used to filter the pnu names
         """
+        self.cancel_update()
         self._name_filter = name_filter
-        if self._name_filter == "":
-            self._filtered_data = self._data
         self._filtered_data = [
             data for data in self._data if self._name_filter in data.name
         ]
+        self._rows = {data.pnu: row for row, data in enumerate(self._filtered_data)}
         self.layoutChanged.emit()
 
+    def start_update_all_values(self, pnus_read_func, batch_size=32):
+        """Fill the column "value" for all rows in a background thread.
+
+        The PNUs are read in batches, the affected rows are updated as soon as
+        a batch has been read. A running update is cancelled.
+
+        Parameters:
+            pnus_read_func (function): function to read a list of PNUs,
+                                       called from the background thread
+            batch_size (int): Number of PNUs read by one call of pnus_read_func
+
+        Returns:
+            ParameterRefreshThread: The started thread
+        """
+        self.cancel_update()
+        thread = ParameterRefreshThread(
+            self._refresh_generation,
+            [data.pnu for data in self._filtered_data],
+            pnus_read_func,
+            batch_size,
+        )
+        thread.values_read.connect(self._apply_values)
+        # Keep a reference until the thread has finished
+        self._refresh_threads.add(thread)
+        thread.finished.connect(lambda: self._refresh_threads.discard(thread))
+        thread.start()
+        return thread
+
+    def cancel_update(self):
+        """Cancels running updates, values that have already been read are discarded"""
+        self._refresh_generation += 1
+        for thread in self._refresh_threads:
+            thread.requestInterruption()
+
+    def stop_updates(self):
+        """Cancels running updates and waits until their threads have finished"""
+        self.cancel_update()
+        for thread in list(self._refresh_threads):
+            thread.wait()
+        self._refresh_threads.clear()
+
+    def _apply_values(self, generation, values):
+        """Stores the values read by a ParameterRefreshThread and updates the affected rows
+
+        Parameters:
+            generation (int): Generation of the refresh that read the values
+            values (list): (pnu, value) tuples
+        """
+        if generation != self._refresh_generation:
+            return
+        rows = []
+        for pnu, value in values:
+            self._items[pnu].value = value
+            if pnu in self._rows:
+                rows.append(self._rows[pnu])
+        if rows:
+            column = self._headers.index("value")
+            self.dataChanged.emit(
+                self.index(min(rows), column), self.index(max(rows), column)
+            )
+
     def update_all_values(self, pnu_read_func):
         """Fill the column "value" for all rows.
 
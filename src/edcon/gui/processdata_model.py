@@ -133,8 +133,7 @@ class ProcessDataModel(QStandardItemModel):
             root.appendRow([word_item, hex_string_item, bin_string_item])
 
             # Add bit items to word item
-            item_name_list = [x.name for x in fields(word)]
-            for item_name in item_name_list:
+            for item_name in word.bit_names:
                 item_value = getattr(word, item_name)
                 self.append_bitwise_word_item(
                     word_item, item_name, item_value, readonly
@@ -1,8 +1,54 @@
 """Contains code that is related to PROFIDRIVE telegram base class"""
 
+import struct
 from dataclasses import fields
 
 
+class TelegramLayout:
+    """Holds the precompiled byte layout of the input and output words of a telegram class"""
+
+    def __init__(self, telegram_cls):
+        """Constructor of the TelegramLayout class.
+
+        Parameters:
+            telegram_cls (type): Telegram class whose layout should be compiled
+        """
+        telegram = telegram_cls()
+        names = {
+            id(getattr(telegram, item.name)): item.name for item in fields(telegram)
+        }
+
+        self.input_names = tuple(names[id(word)] for word in telegram.inputs())
+        self.output_names = tuple(names[id(word)] for word in telegram.outputs())
+        self.input_struct = struct.Struct(
+            "<" + "".join(word.struct_format for word in telegram.inputs())
+        )
+        self.output_struct = struct.Struct(
+            "<" + "".join(word.struct_format for word in telegram.outputs())
+        )
+
+    def unpack_inputs(self, telegram, data: bytes):
+        """Updates the input words of the telegram in place from provided byte data"""
+        if len(data) < self.input_struct.size:
+            data = bytes(data).ljust(self.input_struct.size, b"\x00")
+        for name, value in zip(self.input_names, self.input_struct.unpack_from(data)):
+            getattr(telegram, name).set_int(value)
+
+    def pack_outputs(self, telegram) -> bytes:
+        """Returns the byte representation of the output words of the telegram"""
+        return self.output_struct.pack(
+            *[int(getattr(telegram, name)) for name in self.output_names]
+        )
+
+    def pack_outputs_into(self, telegram, buffer: bytearray, offset: int = 0):
+        """Writes the byte representation of the output words into provided buffer"""
+        self.output_struct.pack_into(
+            buffer,
+            offset,
+            *[int(getattr(telegram, name)) for name in self.output_names],
+        )
+
+
 class TelegramBase:
     """Holds the base implementation of PROFIDRIVE telegrams"""
 
@@ -54,21 +100,24 @@ class TelegramBase:
         """Returns list of output words"""
         raise NotImplementedError
 
+    @classmethod
+    def layout(cls) -> TelegramLayout:
+        """Returns the byte layout of the telegram class (compiled on first use)"""
+        # Look up in the class dict only, derived telegrams need their own layout
+        layout = cls.__dict__.get("_layout")
+        if layout is None:
+            layout = TelegramLayout(cls)
+            cls._layout = layout
+        return layout
+
     def input_bytes(self, data: bytes):
         """Sets the input words from provided byte data"""
-        pos = 0
-        for inp in self.inputs():
-            inp_name = type(inp).__name__.lower().replace("_pm", "").replace("_sm", "")
-            setattr(
-                self,
-                inp_name,
-                inp.from_bytes(data[pos : pos + inp.byte_size]),
-            )
-            pos += inp.byte_size
+        self.layout().unpack_inputs(self, data)
 
     def output_bytes(self) -> bytes:
         """Returns the byte representation of the output words"""
-        out_bytes = b""
-        for outp in self.outputs():
-            out_bytes += outp.to_bytes()
-        return out_bytes
+        return self.layout().pack_outputs(self)
+
+    def output_bytes_into(self, buffer: bytearray, offset: int = 0):
+        """Writes the byte representation of the output words into provided buffer"""
+        self.layout().pack_outputs_into(self, buffer, offset)
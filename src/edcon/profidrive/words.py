@@ -1,13 +1,84 @@
 """Contains code that is related to PROFIDRIVE words"""
 
-from dataclasses import dataclass, fields
-from edcon.utils.boollist import bytes_to_boollist, boollist_to_bytes
+from dataclasses import dataclass
 
 
-class BitwiseWord:
-    """This is the base class for any word that is considered a set of bitwise values"""
+def _bit_property(name: str, mask: int) -> property:
+    """Returns a property accessing the bit(s) of mask within the word value"""
+
+    def getter(self) -> bool:
+        return self.value & mask != 0
+
+    def setter(self, bit: bool):
+        if bit:
+            self.value |= mask
+        else:
+            self.value &= ~mask
+
+    return property(getter, setter, doc=f"Bit {name} of the word")
+
+
+class BitwiseWordMeta(type):
+    """Metaclass that generates a bit property for each bool annotation of a BitwiseWord.
+
+    The bits are assigned in order of declaration, starting with the least significant bit.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        annotations = namespace.get("__annotations__", {})
+        bit_names = tuple(
+            attr
+            for attr, attr_type in annotations.items()
+            if attr_type in (bool, "bool")
+        )
+        for position, bit_name in enumerate(bit_names):
+            namespace[bit_name] = _bit_property(bit_name, 1 << position)
+        if bit_names:
+            namespace["bit_names"] = bit_names
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class BitwiseWord(metaclass=BitwiseWordMeta):
+    """This is the base class for any word that is considered a set of bitwise values.
+
+    The word is stored as a single integer (value), the named bits are accessed
+    using the properties generated from the bool annotations of derived classes.
+    """
+
+    __slots__ = ("value",)
 
     byte_size: int = 2
+    struct_format = "H"
+    bit_names = ()
+
+    def __init__(self, *bits: bool, **kwargs: bool):
+        if len(bits) > len(self.bit_names):
+            raise TypeError(
+                f"{type(self).__name__} takes at most {len(self.bit_names)} bits "
+                f"({len(bits)} given)"
+            )
+        self.value = 0
+        for bit_name, bit in zip(self.bit_names, bits):
+            setattr(self, bit_name, bit)
+        for bit_name, bit in kwargs.items():
+            if bit_name not in self.bit_names:
+                raise TypeError(
+                    f"{type(self).__name__} got an unexpected keyword argument '{bit_name}'"
+                )
+            setattr(self, bit_name, bit)
+
+    def __repr__(self):
+        """Returns the representation containing the values of all named bits"""
+        bits = ", ".join(
+            f"{bit_name}={getattr(self, bit_name)}" for bit_name in self.bit_names
+        )
+        return f"{type(self).__name__}({bits})"
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return self.value == other.value
+        return NotImplemented
 
     def __len__(self):
         """Returns the size of the word in bytes"""
@@ -15,24 +86,32 @@ class BitwiseWord:
 
     def __int__(self):
         """Returns the integer representation"""
-        return int.from_bytes(self.to_bytes(), "little")
+        return self.value
 
     def size(self):
         """Returns the size of the word in bytes"""
-        return len(self.to_bytes())
+        return self.byte_size
 
     def to_bytes(self):
         """Returns the bytes representation"""
-        return boollist_to_bytes(self.to_boollist())
+        return self.value.to_bytes(self.byte_size, "little")
 
     def to_boollist(self):
         """Returns the boollist representation"""
-        return [getattr(self, v.name) for v in fields(self)]
+        return [
+            self.value >> position & 1 == 1 for position in range(len(self.bit_names))
+        ]
+
+    def set_int(self, value: int):
+        """Updates all bits in place from an integer"""
+        self.value = value
 
     @classmethod
     def from_bytes(cls, data: bytes):
         """Initializes a BitwiseWord from a byte representation"""
-        return cls(*bytes_to_boollist(data))
+        word = cls()
+        word.value = int.from_bytes(data, "little")
+        return word
 
     @classmethod
     def from_int(cls, value: int):
@@ -40,13 +119,9 @@ class BitwiseWord:
         return cls.from_bytes(value.to_bytes(cls.byte_size, "little"))
 
 
-@dataclass
 class BitwiseWordGeneric(BitwiseWord):
     """This is a generic derivative of BitwiseWord e.g. to test it's methods"""
 
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
-
     bit0: bool = False
     bit1: bool = False
     bit2: bool = False
@@ -65,14 +140,9 @@ class BitwiseWordGeneric(BitwiseWord):
     bit15: bool = False
 
 
-@dataclass
 class STW1_SM(BitwiseWord):
     """Implementation of STW1 in velocity mode"""
 
-    # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
-
     # pylint: disable=invalid-name
     on: bool = False
     no_coast_stop: bool = False
@@ -92,14 +162,9 @@ class STW1_SM(BitwiseWord):
     reserved1: bool = False
 
 
-@dataclass
 class STW1_PM(BitwiseWord):
     """Implementation of STW1 in position mode"""
 
-    # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
-
     # pylint: disable=invalid-name
     on: bool = False
     no_coast_stop: bool = False
@@ -119,13 +184,10 @@ class STW1_PM(BitwiseWord):
     reserved2: bool = False
 
 
-@dataclass
 class SATZANW(BitwiseWord):
     """Implementation of SATZANW"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     satzanw_bit0: bool = False
     satzanw_bit1: bool = False
@@ -145,13 +207,10 @@ class SATZANW(BitwiseWord):
     mdi_active: bool = False
 
 
-@dataclass
 class STW2(BitwiseWord):
     """Implementation of STW2"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     reserved1: bool = False
     reserved2: bool = False
@@ -171,13 +230,10 @@ class STW2(BitwiseWord):
     sign_of_life3: bool = False
 
 
-@dataclass
 class POS_STW1(BitwiseWord):
     """Implementation of POS_STW1"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
     record_table_selection0: bool = False
     record_table_selection1: bool = False
     record_table_selection2: bool = False
@@ -196,13 +252,10 @@ class POS_STW1(BitwiseWord):
     activate_mdi: bool = False
 
 
-@dataclass
 class POS_STW2(BitwiseWord):
     """Implementation of POS_STW1"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
     activate_tracking_mode: bool = False
     set_reference_point: bool = False
     reserved1: bool = False
@@ -221,13 +274,10 @@ class POS_STW2(BitwiseWord):
     activate_hardware_limit_switch: bool = False
 
 
-@dataclass
 class ZSW1_SM(BitwiseWord):
     """Implementation of ZSW1 in velocity mode"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     ready_to_switch_on: bool = False
     ready_to_operate: bool = False
@@ -247,13 +297,10 @@ class ZSW1_SM(BitwiseWord):
     ps_temp_warning_inactive: bool = False
 
 
-@dataclass
 class ZSW1_PM(BitwiseWord):
     """Implementation of ZSW1 in position mode"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     ready_to_switch_on: bool = False
     ready_to_operate: bool = False
@@ -273,13 +320,10 @@ class ZSW1_PM(BitwiseWord):
     axis_decelerates: bool = False
 
 
-@dataclass
 class AKTSATZ(BitwiseWord):
     """Implementation of AKTSATZ"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     aktsatz_bit0: bool = False
     aktsatz_bit1: bool = False
@@ -299,13 +343,10 @@ class AKTSATZ(BitwiseWord):
     mdi_active: bool = False
 
 
-@dataclass
 class ZSW2(BitwiseWord):
     """Implementation of ZSW2"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     reserved1: bool = False
     reserved2: bool = False
@@ -325,13 +366,10 @@ class ZSW2(BitwiseWord):
     sign_of_life3: bool = False
 
 
-@dataclass
 class POS_ZSW1(BitwiseWord):
     """Implementation of POS_ZSW1"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     record_table_selection0: bool = False
     record_table_selection1: bool = False
@@ -351,13 +389,10 @@ class POS_ZSW1(BitwiseWord):
     mdi_active: bool = False
 
 
-@dataclass
 class POS_ZSW2(BitwiseWord):
     """Implementation of POS_ZSW2"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     tracking_mode_active: bool = False
     velocity_limiting_active: bool = False
@@ -377,13 +412,10 @@ class POS_ZSW2(BitwiseWord):
     traversing_command_active: bool = False
 
 
-@dataclass
 class MELDW(BitwiseWord):
     """Implementation of MELDW"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     ramp_function_completed: bool = False
     torque_utilization_lower_threshold: bool = False
@@ -403,13 +435,10 @@ class MELDW(BitwiseWord):
     reserved5: bool = False
 
 
-@dataclass
 class G1_STW(BitwiseWord):
     """Implementation of G1_STW"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     function0: bool = False
     function1: bool = False
@@ -429,13 +458,10 @@ class G1_STW(BitwiseWord):
     acknowledge_sens_err: bool = False
 
 
-@dataclass
 class G1_ZSW(BitwiseWord):
     """Implementation of G1_ZSW"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     function_status0: bool = False
     function_status1: bool = False
@@ -455,13 +481,10 @@ class G1_ZSW(BitwiseWord):
     sens_error: bool = False
 
 
-@dataclass
 class MDI_MOD(BitwiseWord):
     """Implementation of MDI_MOD"""
 
     # pylint: disable=invalid-name
-    # pylint: disable=too-many-instance-attributes
-    # Sixteen is needed here
 
     absolute_position: bool = False
     modulo_direction_positive: bool = False
@@ -487,6 +510,7 @@ class IntWord:
 
     value: int = 0
     byte_size: int = 2
+    struct_format = "h"
 
     def __len__(self):
         """Returns the size of the word in bytes"""
@@ -494,12 +518,16 @@ class IntWord:
 
     def __int__(self):
         """Returns the integer representation"""
-        return getattr(self, fields(self)[0].name)
+        return self.value
 
     def to_bytes(self) -> bytes:
         """Returns the bytes representation"""
         return int(self).to_bytes(2, "little", signed=True)
 
+    def set_int(self, value: int):
+        """Updates the value in place from an integer"""
+        self.value = value
+
     @classmethod
     def from_bytes(cls, data: bytes):
         """Initializes a int word value from a byte representation"""
@@ -549,6 +577,7 @@ class IntDoubleWord:
 
     value: int = 0
     byte_size: int = 4
+    struct_format = "i"
 
     def __len__(self):
         """Returns the size of the word in bytes"""
@@ -556,12 +585,16 @@ class IntDoubleWord:
 
     def __int__(self):
         """Returns the integer representation"""
-        return getattr(self, fields(self)[0].name)
+        return self.value
 
     def to_bytes(self) -> bytes:
         """Returns the bytes representation"""
         return int(self).to_bytes(4, "little", signed=True)
 
+    def set_int(self, value: int):
+        """Updates the value in place from an integer"""
+        self.value = value
+
     @classmethod
     def from_bytes(cls, data: bytes):
         """Initializes a int double word value from a byte representation"""
@@ -1,37 +1,35 @@
 """Helper functions for converting lists of boolean values"""
 
+from itertools import chain
+
+# Lookup tables between a byte value and its bits (least significant bit first)
+_BYTE_TO_BITS = tuple(
+    tuple(value >> position & 1 == 1 for position in range(8)) for value in range(256)
+)
+_BITS_TO_BYTE = {bits: value for value, bits in enumerate(_BYTE_TO_BITS)}
+
 
 def bytes_to_boollist(data: bytes, num_bytes: int = None):
     """Converts data in byte representation to a list of bools"""
-    # Compose list of single bytes
-    chunkeddata = [data[i : i + 1] for i in range(0, len(data), 1)]
-    # Compose a list of single boolean values
-    boollist = sum(
-        (
-            [int.from_bytes(chunk, "little") >> i & 1 == 1 for i in range(8)]
-            for chunk in chunkeddata
-        ),
-        [],
-    )
-
     if num_bytes is None:
         num_bytes = len(data)
 
+    # Compose a list of single boolean values using the lookup table
+    boollist = list(
+        chain.from_iterable(map(_BYTE_TO_BITS.__getitem__, data[:num_bytes]))
+    )
+
     if num_bytes > len(data):
         boollist += [False] * ((num_bytes - len(data)) * 8)
 
-    boollist = boollist[: num_bytes * 8]
-
     return boollist
 
 
 def boollist_to_bytes(boollist: list):
     """Converts a list of bools to byte representation"""
-    # Compose list of chunks of 8 bools
-    chunkedlist = [boollist[i : i + 8] for i in range(0, len(boollist), 8)]
-    # Compose a list where every chunk is an int
-    intlist = [
-        sum(int(bit) << position for (position, bit) in enumerate(chunk))
-        for chunk in chunkedlist
-    ]
-    return bytes(intlist)
+    # Fill up the last chunk to 8 bools
+    if len(boollist) % 8:
+        boollist = list(boollist) + [False] * (8 - len(boollist) % 8)
+    # Compose chunks of 8 bools and look up their byte values
+    chunks = zip(*[iter(boollist)] * 8)
+    return bytes(map(_BITS_TO_BYTE.__getitem__, chunks))
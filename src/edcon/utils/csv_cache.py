@@ -0,0 +1,126 @@
+"""Contains functions to read CSV map files using a compact binary cache.
+
+Parsing the map files shipped with the package (e.g. pnu_map.csv) is a
+noticeable part of the startup time of the command line interface. Therefore
+the parsed rows are stored in a marshal file in the user cache directory on
+first use. The cache file is only used if it was created from a CSV file with
+identical content (checked via SHA-256 digest).
+
+The cache directory can be configured using the EDCON_CACHE_DIR environment
+variable. Setting it to an empty string disables the cache.
+"""
+
+import csv
+import hashlib
+import io
+import marshal
+import os
+import sys
+from pathlib import Path
+from edcon.utils.logging import Logging
+
+logger = Logging.get_logger("cache")
+
+# Increment if the layout of the cached data changes
+CACHE_FORMAT_VERSION = 1
+
+
+def cache_dir() -> Path:
+    """Determines the directory used for cache files
+
+    Returns:
+        Path: Cache directory, None if caching is disabled
+    """
+    if "EDCON_CACHE_DIR" in os.environ:
+        directory = os.environ["EDCON_CACHE_DIR"]
+        return Path(directory) if directory else None
+    if sys.platform == "win32" and "LOCALAPPDATA" in os.environ:
+        return Path(os.environ["LOCALAPPDATA"]) / "festo-edcon" / "cache"
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "festo-edcon"
+
+
+def _cache_file(csv_file: Path, digest: str) -> Path:
+    """Returns the path of the cache file for the provided CSV file"""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    python_version = f"py{sys.version_info[0]}{sys.version_info[1]}"
+    return directory / f"{csv_file.stem}-{digest[:16]}-{python_version}.marshal"
+
+
+def _parse_csv(data: bytes, encoding: str, delimiter: str, int_columns: tuple) -> tuple:
+    """Parses the provided CSV data
+
+    Returns:
+        tuple: Header (tuple of str) and rows (tuple of tuples)
+    """
+    with io.TextIOWrapper(io.BytesIO(data), encoding=encoding) as csvfile:
+        reader = csv.reader(csvfile, delimiter=delimiter)
+        header = tuple(next(reader, ()))
+        rows = tuple(
+            tuple(
+                int(value) if index in int_columns else value
+                for index, value in enumerate(row)
+            )
+            for row in reader
+        )
+    return header, rows
+
+
+def _load_cache(cache_file: Path, key: tuple) -> tuple:
+    """Loads header and rows from the provided cache file
+
+    Returns:
+        tuple: Header and rows, None if the cache file is missing or outdated
+    """
+    try:
+        cached_key, header, rows = marshal.loads(cache_file.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if cached_key != key:
+        return None
+    return header, rows
+
+
+def _store_cache(cache_file: Path, key: tuple, header: tuple, rows: tuple):
+    """Stores header and rows in the provided cache file (errors are ignored)"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so concurrent readers never see partial data
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(marshal.dumps((key, header, rows)))
+        os.replace(tmp_file, cache_file)
+    except OSError as error:
+        logger.debug("Could not write cache file %s: %s", cache_file, error)
+
+
+def read_csv_rows(
+    csv_file: str, encoding: str, delimiter: str = ";", int_columns: tuple = ()
+) -> tuple:
+    """Reads header and rows of a CSV file using the binary cache if possible
+
+    Parameters:
+        csv_file (str): CSV file that should be read
+        encoding (str): Encoding of the CSV file
+        delimiter (str): Delimiter of the CSV file
+        int_columns (tuple): Indices of the columns whose values are interpreted as int
+
+    Returns:
+        tuple: Header (tuple of str) and rows (tuple of tuples)
+    """
+    csv_file = Path(csv_file)
+    data = csv_file.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    key = (CACHE_FORMAT_VERSION, digest, encoding, delimiter, tuple(int_columns))
+    cache_file = _cache_file(csv_file, digest)
+
+    if cache_file is not None:
+        cached = _load_cache(cache_file, key)
+        if cached is not None:
+            return cached
+
+    header, rows = _parse_csv(data, encoding, delimiter, int_columns)
+    if cache_file is not None:
+        _store_cache(cache_file, key, header, rows)
+    return header, rows
@@ -0,0 +1,93 @@
+"""Contains class which collects timing statistics of cyclic tasks."""
+
+from collections import deque
+from threading import Lock
+
+
+class CycleStatistics:
+    """Class that collects period and jitter statistics of a cyclic task."""
+
+    def __init__(self, cycle_time: float, history_size: int = 1000):
+        """Constructor of the CycleStatistics class.
+
+        Parameters:
+            cycle_time (float): Nominal cycle time (in ms)
+            history_size (int): Number of recent periods used for the statistics
+        """
+        self.cycle_time = cycle_time
+        self.cycles = 0
+        self.overruns = 0
+        self._last_start = None
+        self._periods = deque(maxlen=history_size)
+        self._lock = Lock()
+
+    def record_cycle(self, start_time: float):
+        """Records the start of a cycle
+
+        Parameters:
+            start_time (float): Start time of the cycle (monotonic clock, in s)
+        """
+        with self._lock:
+            if self._last_start is not None:
+                self._periods.append((start_time - self._last_start) * 1000.0)
+            self._last_start = start_time
+            self.cycles += 1
+
+    def record_overrun(self):
+        """Records that a cycle missed its deadline"""
+        with self._lock:
+            self.overruns += 1
+
+    def reset(self):
+        """Clears all collected statistics"""
+        with self._lock:
+            self.cycles = 0
+            self.overruns = 0
+            self._last_start = None
+            self._periods.clear()
+
+    def achieved_period(self) -> float:
+        """Returns the mean period (in ms) of the recent cycles
+
+        Returns:
+            float: Mean period or None if less than two cycles were recorded
+        """
+        with self._lock:
+            if not self._periods:
+                return None
+            return sum(self._periods) / len(self._periods)
+
+    def jitter(self, percentiles: tuple = (50, 95, 99)) -> dict:
+        """Returns the jitter (deviation of the period from the cycle time, in ms)
+
+        Parameters:
+            percentiles (tuple): Percentiles of the absolute jitter that should be provided
+
+        Returns:
+            dict: Containing min, max and requested percentiles (e.g. p95) of the jitter
+        """
+        with self._lock:
+            deviations = [period - self.cycle_time for period in self._periods]
+        if not deviations:
+            return {}
+
+        jitter = {"min": min(deviations), "max": max(deviations)}
+        absolute = sorted(abs(deviation) for deviation in deviations)
+        for percentile in percentiles:
+            index = min(len(absolute) - 1, int(len(absolute) * percentile / 100.0))
+            jitter[f"p{percentile}"] = absolute[index]
+        return jitter
+
+    def summary(self) -> dict:
+        """Returns all statistics
+
+        Returns:
+            dict: Containing cycles, overruns, achieved period and jitter
+        """
+        return {
+            "cycles": self.cycles,
+            "overruns": self.overruns,
+            "cycle_time": self.cycle_time,
+            "achieved_period": self.achieved_period(),
+            "jitter": self.jitter(),
+        }
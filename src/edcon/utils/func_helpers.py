@@ -1,8 +1,12 @@
 """Helper functions used to call other functions."""
 
+import asyncio
+import inspect
 import time
 from collections.abc import Callable
+from threading import Condition
 from edcon.utils.logging import Logging
+from edcon.utils.progress_reporter import ProgressReporter
 
 
 def func_sequence(
@@ -21,12 +25,55 @@ def func_sequence(
         time.sleep(delay)
 
 
-def wait_until(
+# Default period (in s) in which wait conditions are evaluated
+DEFAULT_POLL_INTERVAL = 0.01
+# Default minimum time (in s) between two info_string log messages
+DEFAULT_INFO_INTERVAL = 1.0
+
+
+def _progress_reporter(info_string, info_interval: float) -> ProgressReporter:
+    """Returns a ProgressReporter for the provided info_string (if any)"""
+    if info_string is None or isinstance(info_string, ProgressReporter):
+        return info_string
+    return ProgressReporter(info_string, interval=info_interval, only_on_change=False)
+
+
+def _remaining_poll_time(
+    poll_start: float, poll_interval: float, deadline: float = None
+) -> float:
+    """Returns the time (in s) until the next poll should start (limited by deadline)"""
+    wakeup = poll_start + poll_interval
+    if deadline is not None:
+        wakeup = min(wakeup, deadline)
+    return wakeup - time.monotonic()
+
+
+def _wait_for_next_poll(
+    poll_start: float, poll_interval: float, deadline: float = None, wake_event=None
+):
+    """Blocks until the next poll should start or wake_event is set (notified)"""
+    remaining = _remaining_poll_time(poll_start, poll_interval, deadline)
+    if remaining <= 0.0:
+        return
+    if isinstance(wake_event, Condition):
+        with wake_event:
+            wake_event.wait(remaining)
+    elif wake_event is not None:
+        wake_event.wait(remaining)
+    else:
+        time.sleep(remaining)
+
+
+def wait_until(  # pylint: disable=too-many-arguments
     condition: Callable[[], bool] = None,
     error_condition: Callable[[], bool] = None,
     timeout: float = 0.0,
     info_string: Callable[[], str] = None,
     error_string: Callable[[], str] = None,
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    wake_event=None,
+    info_interval: float = DEFAULT_INFO_INTERVAL,
 ) -> bool:
     """Waits until provided condition is satisfied
 
@@ -35,32 +82,48 @@ def wait_until(
         error_condition (Callable): boolean error condition function which terminates waiting
         timeout (float): Time that should be waited for condition to be satisfied (in seconds)
         info_string (Callable): optional callback for string to print during wait process
+                                (or a ProgressReporter)
         error_string (Callable): optional callback for string to print in error case
+        poll_interval (float): Period (in seconds) in which the conditions are evaluated.
+                               Time spent in the conditions (e.g. waiting for process data)
+                               counts towards the period. 0 evaluates continuously.
+        wake_event (Event): optional event or condition (e.g. new process data cycle)
+                            which starts the next evaluation before the poll interval
+                            elapsed
+        info_interval (float): Minimum time (in seconds) between two info_string messages
 
     Returns:
         bool: True if succesful, False otherwise
     """
-    start_time = time.time()
-    while timeout == 0.0 or not time.time() - start_time > timeout:
+    start_time = time.monotonic()
+    deadline = start_time + timeout if timeout != 0.0 else None
+    reporter = _progress_reporter(info_string, info_interval)
+    while deadline is None or not time.monotonic() > deadline:
+        poll_start = time.monotonic()
         if condition and condition():
             return True
         if error_condition and error_condition():
             if error_string:
                 Logging.logger.error(error_string())
             return False
-        if info_string:
-            Logging.logger.info(info_string())
+        if reporter:
+            reporter.report()
+        _wait_for_next_poll(poll_start, poll_interval, deadline, wake_event)
     Logging.logger.error(f"Cancelled due to timeout after {timeout} s")
     if error_string:
         Logging.logger.error(error_string())
     return False
 
 
-def wait_for(
+def wait_for(  # pylint: disable=too-many-arguments
     duration: float,
     error_condition: Callable[[], bool] = None,
     info_string: Callable[[], str] = None,
     error_string: Callable[[], str] = None,
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    wake_event=None,
+    info_interval: float = DEFAULT_INFO_INTERVAL,
 ) -> bool:
     """Waits for provided duration
 
@@ -68,18 +131,143 @@ def wait_for(
         duration (float): time that should be waited for
         error_condition (Callable): boolean error condition function which terminates waiting
         info_string (Callable): optional callback for string to print during wait process
+                                (or a ProgressReporter)
         error_string (Callable): optional callback for string to print in error case
+        poll_interval (float): Period (in seconds) in which the error condition is evaluated
+        wake_event (Event): optional event or condition (e.g. new process data cycle)
+                            which starts the next evaluation before the poll interval
+                            elapsed
+        info_interval (float): Minimum time (in seconds) between two info_string messages
 
     Returns:
         bool: True if succesful, False otherwise
     """
-    start_time = time.time()
-    while duration == 0.0 or not time.time() - start_time > duration:
+    start_time = time.monotonic()
+    deadline = start_time + duration if duration != 0.0 else None
+    reporter = _progress_reporter(info_string, info_interval)
+    while deadline is None or not time.monotonic() > deadline:
+        poll_start = time.monotonic()
         if error_condition and error_condition():
             if error_string:
                 Logging.logger.error(error_string())
             return False
-        if info_string:
-            Logging.logger.info(info_string())
+        if reporter:
+            reporter.report()
+        _wait_for_next_poll(poll_start, poll_interval, deadline, wake_event)
+    Logging.logger.info(f"Duration of {duration} seconds passed")
+    return True
+
+
+async def _await_result(func: Callable):
+    """Calls func and awaits the result if it is awaitable"""
+    result = func()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def async_func_sequence(
+    func: Callable[[bool], None], arg_list: list = True, delay: float = 0.1
+):
+    """Performs a toggling sequence on a provided (async) toggle function
+
+    Parameter:
+        func (Callable): function or coroutine function that is called with arg from arg_list
+        delay (float): delay to use between calls of func
+    """
+    for arg in arg_list:
+        await _await_result(lambda arg=arg: func(arg))
+
+        # Wait for trigger
+        await asyncio.sleep(delay)
+
+
+async def async_wait_until(  # pylint: disable=too-many-arguments
+    condition: Callable[[], bool] = None,
+    error_condition: Callable[[], bool] = None,
+    timeout: float = 0.0,
+    info_string: Callable[[], str] = None,
+    error_string: Callable[[], str] = None,
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    info_interval: float = DEFAULT_INFO_INTERVAL,
+) -> bool:
+    """Waits until provided condition is satisfied without blocking the event loop.
+    Conditions may be functions or coroutine functions.
+
+    Parameter:
+        condition (Callable): boolean condition function
+        error_condition (Callable): boolean error condition function which terminates waiting
+        timeout (float): Time that should be waited for condition to be satisfied (in seconds)
+        info_string (Callable): optional callback for string to print during wait process
+                                (or a ProgressReporter)
+        error_string (Callable): optional callback for string to print in error case
+        poll_interval (float): Period (in seconds) in which the conditions are evaluated
+        info_interval (float): Minimum time (in seconds) between two info_string messages
+
+    Returns:
+        bool: True if succesful, False otherwise
+    """
+    start_time = time.monotonic()
+    deadline = start_time + timeout if timeout != 0.0 else None
+    reporter = _progress_reporter(info_string, info_interval)
+    while deadline is None or not time.monotonic() > deadline:
+        poll_start = time.monotonic()
+        if condition and await _await_result(condition):
+            return True
+        if error_condition and await _await_result(error_condition):
+            if error_string:
+                Logging.logger.error(await _await_result(error_string))
+            return False
+        if reporter:
+            reporter.report()
+        # Always yield to other tasks, even if the conditions did not await anything
+        await asyncio.sleep(
+            max(0.0, _remaining_poll_time(poll_start, poll_interval, deadline))
+        )
+    Logging.logger.error(f"Cancelled due to timeout after {timeout} s")
+    if error_string:
+        Logging.logger.error(await _await_result(error_string))
+    return False
+
+
+async def async_wait_for(  # pylint: disable=too-many-arguments
+    duration: float,
+    error_condition: Callable[[], bool] = None,
+    info_string: Callable[[], str] = None,
+    error_string: Callable[[], str] = None,
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    info_interval: float = DEFAULT_INFO_INTERVAL,
+) -> bool:
+    """Waits for provided duration without blocking the event loop.
+    The error condition may be a function or coroutine function.
+
+    Parameter:
+        duration (float): time that should be waited for
+        error_condition (Callable): boolean error condition function which terminates waiting
+        info_string (Callable): optional callback for string to print during wait process
+                                (or a ProgressReporter)
+        error_string (Callable): optional callback for string to print in error case
+        poll_interval (float): Period (in seconds) in which the error condition is evaluated
+        info_interval (float): Minimum time (in seconds) between two info_string messages
+
+    Returns:
+        bool: True if succesful, False otherwise
+    """
+    start_time = time.monotonic()
+    deadline = start_time + duration if duration != 0.0 else None
+    reporter = _progress_reporter(info_string, info_interval)
+    while deadline is None or not time.monotonic() > deadline:
+        poll_start = time.monotonic()
+        if error_condition and await _await_result(error_condition):
+            if error_string:
+                Logging.logger.error(await _await_result(error_string))
+            return False
+        if reporter:
+            reporter.report()
+        await asyncio.sleep(
+            max(0.0, _remaining_poll_time(poll_start, poll_interval, deadline))
+        )
     Logging.logger.info(f"Duration of {duration} seconds passed")
     return True
@@ -1,15 +1,37 @@
 """Contains class which contains logging methods."""
 
 import logging
-from rich.logging import RichHandler
 
 
 class Logging:
-    """Class that contains common functions for logging."""
+    """Class that contains common functions for logging.
+
+    Subsystems log to child loggers of the "edcon" logger (e.g. "edcon.com.modbus",
+    "edcon.pnu") which can be silenced independently, e.g. using
+    logging.getLogger("edcon.pnu").setLevel(logging.WARNING).
+    Messages of frequently called functions should use %-style arguments,
+    so they are only formatted if the message is actually emitted.
+    """
 
     logger = logging.getLogger("edcon")
 
+    @classmethod
+    def get_logger(cls, subsystem: str) -> logging.Logger:
+        """Returns the logger of the provided subsystem (child of the edcon logger)
+
+        Parameters:
+            subsystem (str): Name of the subsystem, e.g. "com.modbus"
+
+        Returns:
+            Logger: Logger named "edcon.<subsystem>"
+        """
+        return cls.logger.getChild(subsystem)
+
     def __init__(self, logging_level=logging.INFO, filename=None):
+        # pylint: disable=import-outside-toplevel
+        # rich is only imported when logging is configured to keep imports fast
+        from rich.logging import RichHandler
+
         logging.basicConfig(
             format="%(message)s", datefmt="[%X]", handlers=[RichHandler()]
         )
@@ -24,6 +46,9 @@ class Logging:
 
     def enable_stream_logging(self, logging_level):
         """Enables logging to stream using the provided log level with rich log formatting."""
+        # pylint: disable=import-outside-toplevel
+        from rich.logging import RichHandler
+
         handler = RichHandler()
         handler.setLevel(logging_level)
         formatter = logging.Formatter(fmt="%(message)s", datefmt="[%X]")
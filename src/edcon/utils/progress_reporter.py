@@ -0,0 +1,57 @@
+"""Contains class which logs progress messages at a limited rate."""
+
+import logging
+import time
+from collections.abc import Callable
+from edcon.utils.logging import Logging
+
+
+class ProgressReporter:
+    """Class that logs progress messages (e.g. during wait loops) at a limited rate.
+
+    The message callback is only evaluated when a message is due,
+    so formatting costs are limited as well.
+    """
+
+    def __init__(
+        self,
+        message: Callable[[], str],
+        interval: float = 0.5,
+        only_on_change: bool = True,
+    ):
+        """Constructor of the ProgressReporter class.
+
+        Parameters:
+            message (Callable): callback providing the progress message
+            interval (float): Minimum time (in s) between two messages
+            only_on_change (bool): If True, a message is only logged if it differs
+                                   from the previously logged one
+        """
+        self.message = message
+        self.interval = interval
+        self.only_on_change = only_on_change
+        self._next_time = 0.0
+        self._last_message = None
+
+    def reset(self):
+        """Forgets the previously logged message, so the next one is logged immediately"""
+        self._next_time = 0.0
+        self._last_message = None
+
+    def report(self) -> bool:
+        """Logs the progress message if it is due
+
+        Returns:
+            bool: True if a message was logged, False otherwise
+        """
+        now = time.monotonic()
+        if now < self._next_time or not Logging.logger.isEnabledFor(logging.INFO):
+            return False
+        self._next_time = now + self.interval
+
+        message = self.message()
+        if self.only_on_change and message == self._last_message:
+            return False
+        self._last_message = message
+        Logging.logger.info(message)
+        return True
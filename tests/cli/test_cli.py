@@ -1,6 +1,34 @@
 """Contains tests for MotionHandler class"""
+import subprocess
+import sys
+from argparse import Namespace
+import pytest
+from edcon.cli.com_factory import create_driver
+from edcon.cli.parameter_set_save import parameter_set_save_func
 from edcon.cli.position import add_position_parser
-from unittest.mock import Mock
+from edcon.cli.pnu import parse_pnu_batch, execute_pnu_batch, PnuCommand
+from unittest.mock import Mock, patch
+
+# Upper bound for the cumulative import time of edcon.cli.cli (in us)
+CLI_IMPORT_TIME_LIMIT_US = 200000
+
+
+def import_times(statement: str) -> dict:
+    """Executes statement in a new interpreter and returns the cumulative
+    import time (in us) of every imported module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
 
 
 class TestCli:
@@ -8,3 +36,85 @@ class TestCli:
         parser = Mock()
         add_position_parser(parser)
         parser.add_parser.assert_called_with('position')
+
+    def test_cli_import_time(self):
+        times = import_times("import edcon.cli.cli")
+        # Fieldbus stacks and rich are only imported when a subcommand is executed
+        for module in ["pymodbus", "ethernetip", "rich", "edcon.edrive.com_base"]:
+            assert module not in times
+        assert times["edcon.cli.cli"] < CLI_IMPORT_TIME_LIMIT_US
+
+    def test_backend_imports(self):
+        assert "ethernetip" not in import_times("import edcon.edrive.com_modbus")
+        assert "pymodbus" not in import_times("import edcon.edrive.com_ethernetip")
+
+    def test_create_driver_batched_pnu_access(self):
+        with patch("edcon.edrive.com_modbus.ComModbus") as com_modbus:
+            assert create_driver("192.168.0.1") == com_modbus.return_value
+        com_modbus.assert_called_once_with("192.168.0.1", batched_pnu_access=True)
+
+    def test_parse_pnu_batch(self):
+        lines = ["# comment\n", "read 3490\n", "\n", "write 12.1 abc def\n"]
+        assert parse_pnu_batch(lines) == [
+            PnuCommand(2, "read", 3490, 0, None),
+            PnuCommand(4, "write", 12, 1, "abc def"),
+        ]
+
+    @pytest.mark.parametrize("line", ["read", "read 1 2", "write 1", "get 1", "read x"])
+    def test_parse_pnu_batch_invalid(self, line):
+        with pytest.raises(ValueError, match="line 1"):
+            parse_pnu_batch([line])
+
+    def test_execute_pnu_batch(self):
+        com = Mock()
+        com.read_pnus.side_effect = [[111, None], [b"name\x00\x00"]]
+        com.write_pnus.return_value = [True]
+        commands = parse_pnu_batch(
+            ["read 3490", "read 1.2", "write 3490 112", "read 2019"]
+        )
+
+        results = execute_pnu_batch(com, commands)
+        assert com.read_pnus.call_args_list[0].args == ([(3490, 0), (1, 2)],)
+        com.write_pnus.assert_called_once_with([(3490, 0, "112")])
+        assert [(r["value"], r["ok"]) for r in results] == [
+            (111, True),
+            (None, False),
+            ("112", True),
+            ("name", True),
+        ]
+
+    def test_execute_pnu_batch_invalid_access(self):
+        com = Mock()
+        com.read_pnus.side_effect = [KeyError(99999999), [111], KeyError(99999999)]
+        com.write_pnus.side_effect = [ValueError("abc"), ValueError("abc"), [True]]
+        commands = parse_pnu_batch(
+            ["read 3490", "read 99999999", "write 3490 abc", "write 3490 112"]
+        )
+
+        results = execute_pnu_batch(com, commands)
+        assert com.read_pnus.call_args_list[1].args == ([(3490, 0)],)
+        assert com.write_pnus.call_args_list[2].args == ([(3490, 0, "112")],)
+        assert [(r["line"], r["value"], r["ok"]) for r in results] == [
+            (1, 111, True),
+            (2, None, False),
+            (3, "abc", False),
+            (4, "112", True),
+        ]
+
+    def test_parameter_set_save_batched(self, tmp_path):
+        args = Namespace(
+            ip_address="192.168.0.1",
+            ethernetip=False,
+            file=str(tmp_path / "snapshot.pck"),
+            baseline=None,
+            binary=None,
+        )
+        with patch("edcon.edrive.com_modbus.ComModbus") as com_modbus:
+            com = com_modbus.return_value
+            com.read_pnus_raw.side_effect = lambda pnus: [None] * len(pnus)
+            parameter_set_save_func(args)
+
+        # The snapshot is read in one bulk access using batched mailbox transfers
+        com_modbus.assert_called_once_with("192.168.0.1", batched_pnu_access=True)
+        com.read_pnus_raw.assert_called_once()
+        com.read_pnu_raw.assert_not_called()
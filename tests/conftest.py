@@ -0,0 +1,13 @@
+"""Contains fixtures shared by all tests"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def edcon_cache_dir(tmp_path_factory):
+    """Redirects the CSV map cache to a temporary directory, so tests never
+    read or write the cache of the user"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        directory = tmp_path_factory.mktemp("edcon-cache")
+        monkeypatch.setenv("EDCON_CACHE_DIR", str(directory))
+        yield directory
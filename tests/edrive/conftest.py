@@ -0,0 +1,49 @@
+"""Contains fixtures providing communication drivers with mocked fieldbus stacks"""
+
+from threading import RLock
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+import pytest
+from edcon.edrive.async_com_modbus import AsyncComModbus
+from edcon.edrive.com_ethernetip import ComEthernetip
+from edcon.edrive.com_modbus import ComModbus
+
+
+@pytest.fixture
+def create_modbus_com():
+    """Factory creating ComModbus instances with a mocked modbus client"""
+
+    def create(**kwargs):
+        with patch("edcon.edrive.com_modbus.ModbusClient") as client_cls:
+            client_cls.return_value.connect.return_value = False
+            return ComModbus("192.168.0.1", **kwargs)
+
+    return create
+
+
+@pytest.fixture
+def async_modbus_com():
+    """AsyncComModbus instance with a mocked modbus client"""
+    with patch("edcon.edrive.async_com_modbus.AsyncModbusTcpClient") as client_cls:
+        client_cls.return_value = AsyncMock()
+        return AsyncComModbus("192.168.0.1")
+
+
+@pytest.fixture
+def async_com():
+    """Mocked asyncio communication driver with active i/o"""
+    com = AsyncMock()
+    com.io_active = Mock(return_value=True)
+    return com
+
+
+@pytest.fixture
+def ethernetip_com():
+    """ComEthernetip instance with a mocked explicit connection"""
+    com = ComEthernetip.__new__(ComEthernetip)
+    com.pnu_lock = RLock()
+    com.eip = MagicMock()
+    com.connection = MagicMock()
+    com.connection.mkReqPath.side_effect = lambda clas, inst, attr: bytes(
+        [clas & 0xFF, inst & 0xFF, attr or 0]
+    )
+    return com
@@ -0,0 +1,104 @@
+"""Contains tests for AsyncTelegramHandler class"""
+import asyncio
+from unittest.mock import Mock, AsyncMock, patch, call
+from edcon.edrive.async_telegram_handler import AsyncTelegramHandler
+from edcon.edrive.async_telegram111_handler import AsyncTelegram111Handler
+
+
+class TestAsyncTelegramHandler:
+    def test_update_inputs(self, async_com):
+        telegram = Mock()
+        dut = AsyncTelegramHandler(telegram, async_com)
+        asyncio.run(dut.update_inputs())
+
+        async_com.recv_io.assert_awaited()
+
+    def test_update_inputs_not_active_raises(self, async_com):
+        telegram = Mock()
+        async_com.io_active.return_value = False
+        dut = AsyncTelegramHandler(telegram, async_com)
+
+        try:
+            asyncio.run(dut.update_inputs())
+            assert False
+        except ConnectionError:
+            pass
+
+    @patch("edcon.utils.func_helpers.asyncio.sleep", new=AsyncMock())
+    def test_acknowledge_faults_return_true(self, async_com):
+        telegram = Mock()
+        dut = AsyncTelegramHandler(telegram, async_com)
+
+        telegram.zsw1.fault_present = False
+        res = asyncio.run(dut.acknowledge_faults(0.1))
+
+        assert res == True
+
+    @patch("edcon.utils.func_helpers.asyncio.sleep", new=AsyncMock())
+    def test_acknowledge_faults_return_false(self, async_com):
+        telegram = Mock()
+        dut = AsyncTelegramHandler(telegram, async_com)
+
+        telegram.zsw1.fault_present = True
+        res = asyncio.run(dut.acknowledge_faults(0.1))
+
+        assert res == False
+
+
+
+class TestAsyncTelegram111Handler:
+    def test_fault_string_reads_fault_code(self, async_com):
+        dut = AsyncTelegram111Handler(async_com)
+        dut.current_fault_code = AsyncMock(side_effect=[0, 1])
+
+        res = asyncio.run(dut.fault_string())
+
+        assert res.startswith("Cancelled due to fault: ")
+        assert "(1)" in res
+        assert dut.current_fault_code.await_count == 2
+
+
+class TestAsyncComModbus:
+    def test_read_pnu_raw(self, async_modbus_com):
+        """Tests that a PNU is read with one write and one read transaction"""
+        client = async_modbus_com.modbus_client
+        client.read_holding_registers.return_value = Mock(
+            registers=[0x10, 4] + [0] * 5 + [0x0201, 0x0403] + [0] * 14
+        )
+
+        res = asyncio.run(async_modbus_com.read_pnu_raw(12345, 1))
+
+        assert res == b"\x01\x02\x03\x04"
+        client.write_registers.assert_awaited_once_with(500, [12345, 1, 1, 0x01])
+        client.read_holding_registers.assert_awaited_once()
+
+    def test_io_task(self, async_modbus_com):
+        """Tests that the i/o task exchanges data with the awaiting coroutines"""
+        client = async_modbus_com.modbus_client
+        client.read_holding_registers.return_value = Mock(registers=[0x0201] * 32)
+
+        async def run():
+            await async_modbus_com.start_io()
+            await async_modbus_com.send_io(b"\x05\x00" * 32)
+            data = await async_modbus_com.recv_io()
+            await async_modbus_com.stop_io()
+            return data
+
+        assert asyncio.run(run()) == b"\x01\x02" * 32
+        assert call(0, [5] * 32) in client.write_registers.await_args_list
+        assert not async_modbus_com.io_active()
+
+    def test_start_io_twice_keeps_task(self, async_modbus_com):
+        """Tests that starting the i/o data twice does not create a second task"""
+        client = async_modbus_com.modbus_client
+        client.read_holding_registers.return_value = Mock(registers=[0x0201] * 32)
+
+        async def run():
+            await async_modbus_com.start_io()
+            task = async_modbus_com.io_task
+            await async_modbus_com.start_io()
+            same_task = async_modbus_com.io_task is task
+            await async_modbus_com.stop_io()
+            return same_task and task.done()
+
+        assert asyncio.run(run())
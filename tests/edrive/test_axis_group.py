@@ -0,0 +1,91 @@
+"""Contains tests for AxisGroup class"""
+from unittest.mock import Mock
+import pytest
+from pymodbus.exceptions import ModbusException
+from edcon.edrive.axis_group import AxisGroup
+
+
+@pytest.fixture
+def create_com(create_modbus_com):
+    """Factory creating ComModbus instances which receive constant i/o data"""
+
+    def create():
+        com = create_modbus_com()
+        com.modbus_client.read_holding_registers.return_value = Mock(
+            registers=[0x0201] * 28
+        )
+        return com
+
+    return create
+
+
+class TestAxisGroup:
+    def test_perform_io_all_axes(self, create_com):
+        """Tests that one group cycle exchanges the i/o data of all axes"""
+        coms = [create_com() for _ in range(3)]
+        group = AxisGroup(coms)
+        for i, com in enumerate(coms):
+            com.out_data = bytes([i, 0]) * 28
+
+        group.perform_io()
+
+        for i, com in enumerate(coms):
+            com.modbus_client.write_registers.assert_called_once_with(0, [i] * 28)
+            assert com.in_data == b"\x01\x02" * 28
+        assert group.cycle_count == 1
+
+    def test_perform_io_concurrent(self, create_com):
+        """Tests i/o exchange using the thread pool"""
+        coms = [create_com() for _ in range(3)]
+        group = AxisGroup(coms, concurrent=True)
+        group.start_io()
+        group.wait_for_cycle(2, timeout=1.0)
+        group.stop_io()
+
+        for com in coms:
+            assert com.io_thread is group.io_thread
+            com.modbus_client.write_registers.assert_called()
+
+    def test_synchronized_holds_outputs(self, create_com):
+        """Tests that outputs provided within synchronized() are held back"""
+        coms = [create_com() for _ in range(2)]
+        group = AxisGroup(coms)
+
+        with group.synchronized():
+            coms[0].out_data = b"\x05\x00" * 28
+            group.perform_io()
+            coms[0].modbus_client.write_registers.assert_called_once_with(0, [0] * 28)
+
+        group.perform_io()
+        coms[0].modbus_client.write_registers.assert_called_with(0, [5] * 28)
+
+    def test_com_start_io_joins_group(self, create_com):
+        """Tests that start_io of a connection uses the common i/o thread"""
+        com = create_com()
+        group = AxisGroup([com])
+        com.start_io()
+        assert group.io_active()
+        assert com.io_thread is group.io_thread
+        assert com.io_active()
+
+        com.shutdown()
+        assert com not in group.coms
+        assert group.io_active()
+        group.shutdown()
+        assert not group.io_active()
+
+    def test_failed_axis_is_detached(self, create_com):
+        """Tests that a failing connection does not stop the other axes"""
+        coms = [create_com() for _ in range(2)]
+        coms[0].modbus_client.read_holding_registers.side_effect = ModbusException(
+            "lost"
+        )
+        group = AxisGroup(coms)
+        group.start_io()
+        group.wait_for_cycle(3, timeout=1.0)
+
+        assert group.io_active()
+        assert group.coms == [coms[1]]
+        assert not coms[0].io_active()
+        assert coms[1].io_active()
+        group.shutdown()
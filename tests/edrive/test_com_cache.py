@@ -0,0 +1,148 @@
+"""Contains tests for CachedCom class"""
+
+from unittest.mock import MagicMock, patch
+import pytest
+from edcon.edrive.com_cache import CachedCom, TTL_STATIC
+
+STATIC_PNU = 3490
+LIVE_PNU = 11000
+
+
+@pytest.fixture
+def com():
+    """Mocked communication driver returning the PNU as value"""
+    mock = MagicMock()
+    mock.read_pnu_raw.side_effect = lambda pnu, subindex, num_elements: pnu.to_bytes(
+        2, "little"
+    )
+    mock.read_pnus_raw.side_effect = lambda pnus: [
+        pnu.to_bytes(2, "little") for pnu, _ in pnus
+    ]
+    mock.write_pnu_raw.return_value = True
+    mock.write_pnus_raw.side_effect = lambda pnus: [True] * len(pnus)
+    return mock
+
+
+class TestCachedCom:
+    def test_static_pnu_is_read_once(self, com):
+        cached = CachedCom(com)
+
+        assert cached.read_pnu_raw(STATIC_PNU) == b"\xa2\x0d"
+        assert cached.read_pnu(STATIC_PNU) == STATIC_PNU
+
+        com.read_pnu_raw.assert_called_once_with(STATIC_PNU, 0, 1)
+        assert cached.statistics()["hits"] == 1
+        assert cached.statistics()["misses"] == 1
+
+    def test_live_pnu_is_not_cached(self, com):
+        cached = CachedCom(com)
+
+        cached.read_pnu_raw(LIVE_PNU)
+        cached.read_pnu_raw(LIVE_PNU)
+
+        assert com.read_pnu_raw.call_count == 2
+        assert cached.statistics()["entries"] == 0
+
+    def test_subindices_are_cached_separately(self, com):
+        cached = CachedCom(com)
+
+        cached.read_pnu_raw(STATIC_PNU, 0)
+        cached.read_pnu_raw(STATIC_PNU, 1)
+        cached.read_pnu_raw(STATIC_PNU, 1)
+
+        assert com.read_pnu_raw.call_count == 2
+
+    def test_ttl_expires(self):
+        mock = MagicMock()
+        mock.read_pnu_raw.return_value = b"\x01"
+        cached = CachedCom(mock, ttl_policies={LIVE_PNU: 0.5})
+
+        with patch("edcon.edrive.com_cache.time.monotonic", return_value=10.0):
+            cached.read_pnu_raw(LIVE_PNU)
+        with patch("edcon.edrive.com_cache.time.monotonic", return_value=10.4):
+            cached.read_pnu_raw(LIVE_PNU)
+        assert mock.read_pnu_raw.call_count == 1
+
+        with patch("edcon.edrive.com_cache.time.monotonic", return_value=10.6):
+            cached.read_pnu_raw(LIVE_PNU)
+        assert mock.read_pnu_raw.call_count == 2
+
+    def test_write_invalidates(self, com):
+        cached = CachedCom(com)
+
+        cached.read_pnu_raw(STATIC_PNU)
+        assert cached.write_pnu(STATIC_PNU, 0, 111)
+        cached.read_pnu_raw(STATIC_PNU)
+
+        assert com.read_pnu_raw.call_count == 2
+
+    def test_failed_write_invalidates(self, com):
+        com.write_pnu_raw.side_effect = ConnectionError
+        cached = CachedCom(com)
+
+        cached.read_pnu_raw(STATIC_PNU)
+        with pytest.raises(ConnectionError):
+            cached.write_pnu_raw(STATIC_PNU, value=b"\x00\x00")
+
+        assert cached.statistics()["entries"] == 0
+
+    def test_failed_read_is_not_cached(self, com):
+        com.read_pnu_raw.side_effect = None
+        com.read_pnu_raw.return_value = None
+        cached = CachedCom(com)
+
+        assert cached.read_pnu_raw(STATIC_PNU) is None
+        cached.read_pnu_raw(STATIC_PNU)
+
+        assert com.read_pnu_raw.call_count == 2
+
+    def test_lru_eviction(self, com):
+        cached = CachedCom(com, default_ttl=TTL_STATIC, max_entries=2)
+
+        cached.read_pnu_raw(1)
+        cached.read_pnu_raw(2)
+        cached.read_pnu_raw(1)
+        cached.read_pnu_raw(3)
+
+        assert list(cached.entries) == [(1, 0, 1), (3, 0, 1)]
+        assert cached.statistics()["evictions"] == 1
+
+    def test_read_pnus_raw_reads_only_missing(self, com):
+        cached = CachedCom(com, default_ttl=TTL_STATIC)
+        cached.read_pnu_raw(2)
+
+        values = cached.read_pnus_raw([(1, 0), (2, 0), (3, 0)])
+
+        assert values == [b"\x01\x00", b"\x02\x00", b"\x03\x00"]
+        com.read_pnus_raw.assert_called_once_with([(1, 0), (3, 0)])
+        assert cached.read_pnus_raw([(1, 0), (3, 0)]) == [b"\x01\x00", b"\x03\x00"]
+        assert com.read_pnus_raw.call_count == 1
+
+    def test_write_pnus_raw_invalidates(self, com):
+        cached = CachedCom(com, default_ttl=TTL_STATIC)
+        cached.read_pnus_raw([(1, 0), (2, 0)])
+
+        assert cached.write_pnus_raw([(1, 0, b"\x00")]) == [True]
+
+        assert list(cached.entries) == [(2, 0, 1)]
+
+    def test_invalidate_all(self, com):
+        cached = CachedCom(com, default_ttl=TTL_STATIC)
+        cached.read_pnus_raw([(1, 0), (2, 0)])
+
+        cached.invalidate()
+
+        assert cached.statistics()["entries"] == 0
+
+    def test_delegates_to_wrapped_driver(self, com):
+        com.device_info = {"product_code": "CMMT-AS"}
+        cached = CachedCom(com)
+
+        cached.start_io()
+        cached.send_io(b"\x01")
+        cached.shutdown()
+
+        assert cached.device_info == {"product_code": "CMMT-AS"}
+        com.start_io.assert_called_once()
+        com.send_io.assert_called_once_with(b"\x01", False)
+        com.shutdown.assert_called_once()
@@ -0,0 +1,183 @@
+"""Contains tests for ComDaemon and ComDaemonClient classes"""
+
+import json
+import tempfile
+import time
+import os
+from threading import Thread
+from unittest.mock import MagicMock
+import pytest
+from pymodbus.exceptions import ConnectionException
+from edcon.edrive.com_daemon import (
+    ComDaemon,
+    ComDaemonClient,
+    encode_value,
+    decode_value,
+)
+
+
+@pytest.fixture
+def daemon():
+    """Runs a ComDaemon with mocked drivers in a background thread"""
+    coms = {}
+
+    def com_factory(ip_address, ethernetip):
+        com = MagicMock()
+        com.read_pnu_raw.return_value = b"\x6f\x00"
+        com.start_io.return_value = None
+        coms[(ip_address, ethernetip)] = com
+        return com
+
+    with tempfile.TemporaryDirectory() as directory:
+        com_daemon = ComDaemon(com_factory, os.path.join(directory, "edcon.sock"))
+        com_daemon.created_coms = coms
+        thread = Thread(target=com_daemon.serve_forever)
+        thread.start()
+        while com_daemon.server is None:
+            thread.join(0.01)
+        yield com_daemon
+        com_daemon.shutdown()
+        thread.join()
+
+
+class TestComDaemon:
+    def test_encode_value(self):
+        value = [(1, 2, b"\x01\x02"), None, True]
+        assert encode_value(value) == [[1, 2, {"bytes": "0102"}], None, True]
+        assert decode_value(encode_value(value)) == [[1, 2, b"\x01\x02"], None, True]
+
+    def test_execute_reuses_connection(self):
+        com_factory = MagicMock()
+        com_daemon = ComDaemon(com_factory)
+        request = {"ip_address": "192.168.0.1", "method": "read_pnu_raw", "args": [1]}
+        com_factory.return_value.read_pnu_raw.return_value = b"\x01"
+
+        assert com_daemon.execute(request) == {"result": {"bytes": "01"}}
+        assert com_daemon.execute(request) == {"result": {"bytes": "01"}}
+        com_factory.assert_called_once_with("192.168.0.1", False)
+
+    def test_execute_unsupported_method(self):
+        com_daemon = ComDaemon(MagicMock())
+        response = com_daemon.execute({"ip_address": "1", "method": "shutdown"})
+        assert "error" in response
+        assert not com_daemon.coms
+
+    def test_execute_error_closes_connection(self):
+        com_factory = MagicMock()
+        com_factory.return_value.read_pnu_raw.side_effect = OSError("broken")
+        com_daemon = ComDaemon(com_factory)
+
+        response = com_daemon.execute({"ip_address": "1", "method": "read_pnu_raw"})
+        assert response == {"error": "OSError: broken"}
+        com_factory.return_value.shutdown.assert_called_once()
+        assert not com_daemon.coms
+
+    def test_execute_modbus_error_closes_connection(self):
+        com_factory = MagicMock()
+        com_factory.return_value.read_pnu_raw.side_effect = ConnectionException("lost")
+        com_daemon = ComDaemon(com_factory)
+
+        response = com_daemon.execute({"ip_address": "1", "method": "read_pnu_raw"})
+        assert response["error"].startswith("ConnectionException:")
+        com_factory.return_value.shutdown.assert_called_once()
+        assert not com_daemon.coms
+
+    def test_execute_malformed_arguments(self):
+        com_daemon = ComDaemon(MagicMock())
+        request = {"ip_address": "1", "method": "read_pnu_raw", "args": 3490}
+
+        assert com_daemon.execute(request)["error"].startswith("TypeError:")
+
+    def test_execute_serializes_requests(self):
+        active = []
+        overlaps = []
+
+        def read_pnu_raw(*_):
+            overlaps.append(bool(active))
+            active.append(True)
+            time.sleep(0.01)
+            active.pop()
+            return b"\x00"
+
+        com_factory = MagicMock()
+        com_factory.return_value.read_pnu_raw.side_effect = read_pnu_raw
+        com_daemon = ComDaemon(com_factory)
+        request = {"ip_address": "1", "method": "read_pnu_raw", "args": [3490]}
+        threads = [Thread(target=com_daemon.execute, args=(request,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == [False] * 4
+
+    def test_release_stops_io(self):
+        com_factory = MagicMock()
+        com_daemon = ComDaemon(com_factory)
+        com_daemon.execute({"ip_address": "1", "method": "start_io"})
+        com_daemon.execute({"ip_address": "1", "method": "release"})
+        com_daemon.execute({"ip_address": "1", "method": "release"})
+        com_factory.return_value.stop_io.assert_called_once()
+
+
+class TestComDaemonClient:
+    def test_read_pnu(self, daemon):
+        client = ComDaemonClient("192.168.0.1", socket_path=daemon.socket_path)
+        assert client.read_pnu(3490) == 111
+        assert client.read_pnu(3490) == 111
+        client.shutdown()
+
+        com = daemon.created_coms[("192.168.0.1", False)]
+        assert com.read_pnu_raw.call_count == 2
+        com.shutdown.assert_not_called()
+
+    def test_write_pnus_raw(self, daemon):
+        client = ComDaemonClient("192.168.0.1", True, socket_path=daemon.socket_path)
+        com = MagicMock()
+        com.write_pnus_raw.return_value = [True]
+        daemon.coms[("192.168.0.1", True)] = com
+
+        assert client.write_pnus_raw([(3490, 0, b"\x6f\x00")]) == [True]
+        com.write_pnus_raw.assert_called_once_with([[3490, 0, b"\x6f\x00"]])
+        client.shutdown()
+
+    def test_disconnect_stops_io(self, daemon):
+        client = ComDaemonClient("192.168.0.1", socket_path=daemon.socket_path)
+        client.start_io()
+        # Simulate a client which terminates without releasing the connection
+        client.file.close()
+        client.sock.close()
+        client.sock = None
+
+        com = daemon.created_coms[("192.168.0.1", False)]
+        for _ in range(100):
+            if com.stop_io.called:
+                break
+            time.sleep(0.01)
+        com.stop_io.assert_called_once()
+
+    def test_error(self, daemon):
+        client = ComDaemonClient("192.168.0.1", socket_path=daemon.socket_path)
+        daemon.coms[("192.168.0.1", False)] = MagicMock(
+            **{"read_pnu_raw.side_effect": ValueError("failed")}
+        )
+        with pytest.raises(ConnectionError):
+            client.read_pnu_raw(3490)
+        client.shutdown()
+
+    def test_malformed_request(self, daemon):
+        client = ComDaemonClient("192.168.0.1", socket_path=daemon.socket_path)
+        for line in [b"{no json\n", b"[1, 2]\n"]:
+            client.file.write(line)
+            client.file.flush()
+            assert "error" in json.loads(client.file.readline())
+        # The connection is still served after malformed requests
+        assert client.read_pnu(3490) == 111
+        client.shutdown()
+
+    def test_socket_only_accessible_by_user(self, daemon):
+        assert os.stat(daemon.socket_path).st_mode & 0o777 == 0o600
+
+    def test_daemon_not_running(self, tmp_path):
+        with pytest.raises(OSError):
+            ComDaemonClient("192.168.0.1", socket_path=str(tmp_path / "missing.sock"))
@@ -0,0 +1,130 @@
+"""Contains tests for ComEthernetip class"""
+import time
+from threading import Condition, Thread, Timer
+from edcon.edrive.com_ethernetip import (
+    ComEthernetip,
+    NotifyingExpConnection,
+    pack_multiple_service_request,
+    unpack_multiple_service_response,
+)
+
+
+def create_connection():
+    """Creates a NotifyingExpConnection without opening any sockets"""
+    conn = NotifyingExpConnection.__new__(NotifyingExpConnection)
+    conn.io_condition = Condition()
+    conn.produce_started = 0
+    conn.produced = 0
+    conn.consumed = 0
+    conn.frame_callbacks = []
+    conn.inAssem = [False] * 8
+    conn.outAssem = [False] * 8
+    return conn
+
+
+class TestNotifyingExpConnection:
+    def test_wait_for_consumed(self):
+        """Tests that waiting returns as soon as a new input frame is set"""
+        conn = create_connection()
+        Timer(0.01, conn.set_input, [[True] * 8]).start()
+
+        assert conn.wait_for_consumed(timeout=1.0)
+        assert conn.inAssem == [True] * 8
+
+    def test_wait_for_consumed_timeout(self):
+        """Tests that waiting returns False if no input frame is received"""
+        conn = create_connection()
+        assert not conn.wait_for_consumed(timeout=0.01)
+
+    def test_wait_for_produced(self):
+        """Tests that waiting returns once a frame with the new output was produced"""
+        conn = create_connection()
+        frame = conn.set_output([True] * 8)
+
+        assert not conn.wait_for_produced(frame, timeout=0.01)
+        conn.produced = frame
+        assert conn.wait_for_produced(frame, timeout=0.01)
+
+
+class TestMultipleServicePacket:
+    def test_pack_request(self):
+        """Tests packing of multiple service request data"""
+        data = pack_multiple_service_request([(0x0E, b"\x01\x02"), (0x10, b"\x03")])
+        assert data == b"\x02\x00\x06\x00\x09\x00\x0e\x01\x02\x10\x03"
+
+    def test_unpack_response(self):
+        """Tests unpacking of multiple service response data"""
+        data = (
+            b"\x02\x00\x06\x00\x0c\x00"
+            + b"\x8e\x00\x00\x00\x6f\x00"
+            + b"\x8e\x00\x05\x01\xff\xff"
+        )
+        assert unpack_multiple_service_response(data) == [(0, b"\x6f\x00"), (5, b"")]
+
+
+class TestComEthernetipBulkPnuAccess:
+    def test_read_pnus_raw(self, ethernetip_com):
+        """Tests bulk read using one multiple service packet"""
+        ethernetip_com.connection.unconnSend.return_value = [
+            0x1E,
+            b"\x02\x00\x06\x00\x0c\x00"
+            + b"\x8e\x00\x00\x00\x6f\x00"
+            + b"\x8e\x00\x05\x00",
+        ]
+
+        assert ethernetip_com.read_pnus_raw([(3490, 0), (1, 0)]) == [b"\x6f\x00", None]
+        ethernetip_com.connection.unconnSend.assert_called_once()
+        assert ethernetip_com.connection.unconnSend.call_args.args[0] == 0x0A
+
+    def test_read_pnus_raw_fallback(self, ethernetip_com):
+        """Tests bulk read falling back to single requests"""
+        ethernetip_com.connection.unconnSend.return_value = [0x08, b""]
+        ethernetip_com.connection.getAttrSingle.return_value = (0, b"\x01")
+
+        assert ethernetip_com.read_pnus_raw([(3490, 0), (1, 0)]) == [b"\x01", b"\x01"]
+        assert ethernetip_com.connection.getAttrSingle.call_count == 2
+
+    def test_read_pnus_raw_reply_count_mismatch(self, ethernetip_com):
+        """Tests bulk read falling back to single requests if replies are missing"""
+        ethernetip_com.connection.unconnSend.return_value = [
+            0x00,
+            b"\x01\x00\x04\x00" + b"\x8e\x00\x00\x00\x6f\x00",
+        ]
+        ethernetip_com.connection.getAttrSingle.return_value = (0, b"\x01")
+
+        assert ethernetip_com.read_pnus_raw([(3490, 0), (1, 0)]) == [b"\x01", b"\x01"]
+        assert ethernetip_com.connection.getAttrSingle.call_count == 2
+
+    def test_write_pnus_raw(self, ethernetip_com):
+        """Tests bulk write using one multiple service packet"""
+        ethernetip_com.connection.unconnSend.return_value = [
+            0x00,
+            b"\x01\x00\x04\x00" + b"\x90\x00\x00\x00",
+        ]
+
+        assert ethernetip_com.write_pnus_raw([(3490, 0, b"\x6f\x00")]) == [True]
+
+
+class TestComEthernetipPnuLock:
+    def test_concurrent_pnu_reads_do_not_interleave(self, ethernetip_com):
+        """Tests that explicit requests of different threads are not interleaved"""
+        active = []
+        overlaps = []
+
+        def get_attr_single(*_):
+            overlaps.append(bool(active))
+            active.append(True)
+            time.sleep(0.01)
+            active.pop()
+            return (0, b"\x01")
+
+        ethernetip_com.connection.getAttrSingle.side_effect = get_attr_single
+        threads = [
+            Thread(target=ethernetip_com.read_pnu_raw, args=(3490,)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == [False] * 4
@@ -0,0 +1,207 @@
+"""Contains tests for ComModbus class"""
+import threading
+import time
+from unittest.mock import Mock, patch, call
+from pytest import approx
+from edcon.edrive.com_modbus import IOThread
+
+
+class TestIOThread:
+    @patch("edcon.edrive.com_modbus.time.monotonic", return_value=1.005)
+    def test_next_deadline_in_time(self, _):
+        """Tests deadline calculation without overrun"""
+        thread = IOThread(cycle_time=10)
+        assert thread._next_deadline(1.0, 0.01) == approx(1.01)
+        assert thread.statistics.overruns == 0
+
+    @patch("edcon.edrive.com_modbus.time.monotonic", return_value=1.035)
+    def test_next_deadline_overrun_skip(self, _):
+        """Tests that missed cycles are skipped"""
+        thread = IOThread(cycle_time=10, overrun_policy="skip")
+        assert thread._next_deadline(1.0, 0.01) == approx(1.04)
+        assert thread.statistics.overruns == 1
+
+    @patch("edcon.edrive.com_modbus.time.monotonic", return_value=1.035)
+    def test_next_deadline_overrun_catch_up(self, _):
+        """Tests that missed cycles are caught up"""
+        thread = IOThread(cycle_time=10, overrun_policy="catch-up")
+        assert thread._next_deadline(1.0, 0.01) == approx(1.01)
+        assert thread.statistics.overruns == 1
+
+
+class TestComModbusPerformIo:
+    def test_perform_io(self, create_modbus_com):
+        """Tests I/O exchange using separate read and write transactions"""
+        com = create_modbus_com()
+        client = com.modbus_client
+        client.read_holding_registers.return_value = Mock(registers=[0x0201] * 28)
+
+        com.perform_io()
+
+        assert com.in_data == b"\x01\x02" * 28
+        client.write_registers.assert_called_once_with(0, [0] * 28)
+        client.readwrite_registers.assert_not_called()
+
+    def test_perform_io_readwrite(self, create_modbus_com):
+        """Tests I/O exchange using a single function code 23 transaction"""
+        com = create_modbus_com(readwrite_io=True)
+        client = com.modbus_client
+        client.readwrite_registers.return_value = Mock(
+            registers=[0x0201] * 28, isError=Mock(return_value=False)
+        )
+        com.out_data = b"\x01\x00" + b"\x00" * 54
+
+        com.perform_io()
+
+        assert com.in_data == b"\x01\x02" * 28
+        client.readwrite_registers.assert_called_once_with(
+            read_address=100, read_count=28, write_address=0, values=[1] + [0] * 27
+        )
+        client.read_holding_registers.assert_not_called()
+        client.write_registers.assert_not_called()
+
+    def test_perform_io_readwrite_fallback(self, create_modbus_com):
+        """Tests fallback to separate transactions if function code 23 is rejected"""
+        com = create_modbus_com(readwrite_io=True)
+        client = com.modbus_client
+        client.readwrite_registers.return_value = Mock(isError=Mock(return_value=True))
+        client.read_holding_registers.return_value = Mock(registers=[0x0201] * 28)
+
+        com.perform_io()
+        com.perform_io()
+
+        assert com.in_data == b"\x01\x02" * 28
+        assert not com.readwrite_io
+        client.readwrite_registers.assert_called_once()
+        assert client.read_holding_registers.call_count == 2
+
+
+class TestComModbusBatchedPnuAccess:
+    def test_read_pnu_raw(self, create_modbus_com):
+        """Tests batched read with data contained in the prefetched registers"""
+        com = create_modbus_com(batched_pnu_access=True)
+        client = com.modbus_client
+        client.read_holding_registers.return_value = Mock(
+            registers=[0x10, 4, 0, 0, 0, 0, 0, 0x1234, 0x5678] + [0] * 14
+        )
+
+        data = com.read_pnu_raw(3490, 1)
+
+        assert data == b"\x34\x12\x78\x56"
+        client.write_registers.assert_called_once_with(500, [3490, 1, 1, 0x01])
+        client.read_holding_registers.assert_called_once()
+        client.write_register.assert_not_called()
+
+    def test_read_pnu_raw_exceeding_prefetch(self, create_modbus_com):
+        """Tests batched read with data exceeding the prefetched registers"""
+        com = create_modbus_com(batched_pnu_access=True)
+        client = com.modbus_client
+        client.read_holding_registers.side_effect = [
+            Mock(registers=[0x10, 40, 0, 0, 0, 0, 0] + [0x4141] * 16),
+            Mock(registers=[0x4242] * 4),
+        ]
+
+        data = com.read_pnu_raw(100)
+
+        assert data == b"A" * 32 + b"B" * 8
+        client.read_holding_registers.assert_called_with(address=526, count=4)
+
+    def test_read_pnu_raw_error(self, create_modbus_com):
+        """Tests batched read with error status"""
+        com = create_modbus_com(batched_pnu_access=True)
+        com.modbus_client.read_holding_registers.return_value = Mock(
+            registers=[0x03] + [0] * 22
+        )
+
+        assert com.read_pnu_raw(3490) is None
+
+    def test_write_pnu_raw(self, create_modbus_com):
+        """Tests batched write issuing the execute command with the header"""
+        com = create_modbus_com(batched_pnu_access=True)
+        client = com.modbus_client
+        client.read_holding_registers.return_value = Mock(registers=[0x10])
+
+        assert com.write_pnu_raw(3490, 0, value=b"\x6f\x00")
+        assert client.write_registers.call_args_list == [
+            call(504, [2]),
+            call(510, [0x6F]),
+            call(500, [3490, 0, 1, 0x02]),
+        ]
+        client.write_register.assert_not_called()
+
+    def test_write_pnu_raw_exception_response(self, create_modbus_com):
+        """Tests batched write with a modbus exception response (no registers)"""
+        com = create_modbus_com(batched_pnu_access=True)
+        com.modbus_client.read_holding_registers.return_value = Mock(spec=[])
+
+        assert not com.write_pnu_raw(3490, 0, value=b"\x6f\x00")
+
+
+class TestComModbusBulkPnuAccess:
+    def test_read_pnus_raw(self, create_modbus_com):
+        """Tests bulk read using batched mailbox access"""
+        com = create_modbus_com(batched_pnu_access=True)
+        client = com.modbus_client
+        client.read_holding_registers.return_value = Mock(
+            registers=[0x10, 2, 0, 0, 0, 0, 0, 0x006F] + [0] * 15
+        )
+
+        assert com.read_pnus_raw([(3490, 0), (3490, 1)]) == [b"\x6f\x00"] * 2
+        assert client.write_registers.call_args_list == [
+            call(500, [3490, 0, 1, 0x01]),
+            call(500, [3490, 1, 1, 0x01]),
+        ]
+
+    def test_read_pnus_raw_single_register_access(self, create_modbus_com):
+        """Tests that bulk read uses single register access if not batched"""
+        com = create_modbus_com()
+        client = com.modbus_client
+        client.read_holding_registers.return_value = Mock(registers=[0x10])
+
+        com.read_pnus_raw([(3490, 0), (3490, 1)])
+
+        client.write_registers.assert_not_called()
+        assert client.write_register.call_count == 8
+
+
+class TestComModbusMailboxLock:
+    def test_concurrent_pnu_reads_do_not_interleave(self, create_modbus_com):
+        """Tests that PNU transactions of different threads are not interleaved"""
+        com = create_modbus_com()
+        client = com.modbus_client
+        events = []
+
+        class YieldingLock:
+            """Lock giving other threads the chance to run after releasing it"""
+
+            def __init__(self):
+                self.lock = threading.Lock()
+
+            def __enter__(self):
+                self.lock.acquire()
+
+            def __exit__(self, *_):
+                self.lock.release()
+                time.sleep(0.005)
+
+        com.lock = YieldingLock()
+
+        def record(*_, **__):
+            events.append(threading.get_ident())
+            return Mock(registers=[0x10, 0, 0, 0, 0, 0, 0, 0])
+
+        client.write_register.side_effect = record
+        client.read_holding_registers.side_effect = record
+
+        threads = [
+            threading.Thread(target=com.read_pnu_raw, args=(3490,)) for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Each read consists of seven transfers which must be contiguous
+        assert len(events) == 14
+        assert len(set(events[:7])) == 1
+        assert len(set(events[7:])) == 1
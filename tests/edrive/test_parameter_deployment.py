@@ -0,0 +1,64 @@
+"""Contains tests for parameter deployment functions"""
+
+from threading import Lock
+from unittest.mock import Mock
+from pymodbus.exceptions import ConnectionException
+from edcon.edrive.parameter import Parameter
+from edcon.edrive.parameter_deployment import deploy_parameters, read_inventory_file
+
+UID = "0.31235.0.0"
+
+
+class TestParameterDeployment:
+    def test_read_inventory_file(self, tmp_path):
+        inventory = tmp_path / "inventory.csv"
+        inventory.write_text(
+            "ip_address,name\n192.168.0.1,axis1\n\n# spare\n192.168.0.2;axis2\n"
+        )
+        assert read_inventory_file(inventory) == ["192.168.0.1", "192.168.0.2"]
+
+    def test_deploy_parameters(self):
+        lock = Lock()
+        active = []
+        max_active = []
+
+        def com_factory(ip_address):
+            if ip_address == "192.168.0.3":
+                raise ConnectionError("not reachable")
+            com = Mock()
+
+            def write_pnus_raw(pnus):
+                with lock:
+                    active.append(ip_address)
+                    max_active.append(len(active))
+                with lock:
+                    active.remove(ip_address)
+                return [ip_address != "192.168.0.2"] * len(pnus)
+
+            com.write_pnus_raw.side_effect = write_pnus_raw
+            return com
+
+        parameters = [Parameter.from_uid_raw(UID, b"\x00\x00\x80\x3f")]
+        callback = Mock()
+        ips = ["192.168.0.1", "192.168.0.2", "192.168.0.3", "192.168.0.1"]
+
+        results = deploy_parameters(
+            com_factory, ips, parameters, max_workers=2, callback=callback
+        )
+        assert [r.ip_address for r in results] == ips[:3]
+        assert [r.ok for r in results] == [True, False, False]
+        assert results[0].result.written == parameters
+        assert results[1].result.failed == parameters
+        assert results[2].error == "ConnectionError: not reachable"
+        assert callback.call_count == 3
+        assert max(max_active) <= 2
+
+    def test_deploy_parameters_modbus_error(self):
+        com = Mock()
+        com.write_pnus_raw.side_effect = ConnectionException("connection lost")
+        parameters = [Parameter.from_uid_raw(UID, b"\x00\x00\x80\x3f")]
+
+        results = deploy_parameters(lambda ip_address: com, ["192.168.0.1"], parameters)
+        assert not results[0].ok
+        assert results[0].error.startswith("ConnectionException:")
+        com.shutdown.assert_called_once()
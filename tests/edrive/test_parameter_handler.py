@@ -0,0 +1,105 @@
+"""Contains tests for ParameterHandler class"""
+
+from unittest.mock import Mock
+from edcon.edrive.parameter import Parameter
+from edcon.edrive.parameter_mapping import ParameterMap
+from edcon.edrive.parameter_handler import (
+    ParameterHandler,
+    raw_values_equal,
+    snapshot_entries,
+)
+
+UID_A = "1.11280502.0.0"
+UID_B = "0.31235.0.0"
+PNU_A = ParameterMap()[UID_A].pnu
+PNU_B = ParameterMap()[UID_B].pnu
+
+
+def create_handler(configured: dict):
+    """Creates a ParameterHandler with a mocked driver providing configured raw values"""
+    com = Mock()
+    com.read_pnus_raw.side_effect = lambda pnus: [
+        configured.get(pnu) for pnu, _ in pnus
+    ]
+
+    def write_pnus_raw(pnus):
+        for pnu, _, value in pnus:
+            configured[pnu] = value
+        return [True] * len(pnus)
+
+    com.write_pnus_raw.side_effect = write_pnus_raw
+    return ParameterHandler(com)
+
+
+class TestParameterHandler:
+    def test_raw_values_equal(self):
+        assert raw_values_equal(b"\x01\x00", b"\x01")
+        assert not raw_values_equal(b"\x01\x01", b"\x01")
+        assert not raw_values_equal(b"\x02", b"\x01")
+        assert not raw_values_equal(None, b"\x01")
+
+    def test_load_parameters_only_changed(self):
+        handler = create_handler(
+            {PNU_A: b"\x05\x00\x00\x00", PNU_B: b"\x00\x00\x00\x00"}
+        )
+        parameters = [
+            Parameter.from_uid_raw(UID_A, b"\x05\x00\x00\x00"),
+            Parameter.from_uid_raw(UID_B, b"\x00\x00\x80\x3f"),
+        ]
+
+        result = handler.load_parameters(parameters, only_changed=True, verify=True)
+        assert result.skipped == parameters[:1]
+        assert result.written == parameters[1:]
+        assert not result.failed
+        handler.com.write_pnus_raw.assert_called_once_with(
+            [(PNU_B, 0, b"\x00\x00\x80\x3f")]
+        )
+        assert result.summary() == "1 written, 1 skipped (unchanged), 0 failed"
+
+    def test_load_parameters_all(self):
+        handler = create_handler({PNU_A: b"\x05\x00\x00\x00"})
+        parameters = [Parameter.from_uid_raw(UID_A, b"\x05\x00\x00\x00")]
+
+        result = handler.load_parameters(parameters)
+        assert result.written == parameters
+        handler.com.read_pnus_raw.assert_not_called()
+
+    def test_load_parameters_verify_failed(self):
+        handler = create_handler({})
+        handler.com.write_pnus_raw.side_effect = lambda pnus: [True] * len(pnus)
+        parameters = [Parameter.from_uid_raw(UID_A, b"\x05\x00\x00\x00")]
+
+        result = handler.load_parameters(parameters, verify=True)
+        assert not result.written
+        assert result.failed == parameters
+
+    def test_snapshot_entries(self):
+        uids = {entry.uid() for entry in snapshot_entries()}
+        assert UID_A in uids
+        # STRING(50) is represented by one entry per character
+        assert "0.71.0.49" in uids
+        assert "0.71.0.50" not in uids
+
+    def test_snapshot(self):
+        # Values are padded by the bus, PNU_B is not available on the device
+        handler = create_handler({PNU_A: b"\x00\x00\x80\x3f\x00\x00"})
+
+        snapshot = handler.snapshot()
+        assert [p.uid() for p in snapshot if p.uid() in (UID_A, UID_B)] == [UID_A]
+        assert [p.value_raw for p in snapshot if p.uid() == UID_A] == [
+            b"\x00\x00\x80\x3f"
+        ]
+
+    def test_snapshot_baseline(self):
+        handler = create_handler({PNU_A: b"\x00\x00\x80\x3f", PNU_B: b"\x01\x00"})
+        baseline = [
+            Parameter.from_uid_raw(UID_A, b"\x00\x00\x00\x00"),
+            Parameter.from_uid_raw(UID_B, b"\x00\x00\x00\x00"),
+        ]
+
+        snapshot = handler.snapshot(baseline)
+        handler.com.read_pnus_raw.assert_called_once_with([(PNU_A, 0), (PNU_B, 0)])
+        assert [p.value_raw for p in snapshot] == [
+            b"\x00\x00\x80\x3f",
+            b"\x01\x00",
+        ]
@@ -0,0 +1,72 @@
+"""Contains tests for ParameterSet class"""
+
+import pytest
+from edcon.edrive.parameter import Parameter
+from edcon.edrive.parameter_set import (
+    ParameterSet,
+    read_parameter_set,
+    write_parameter_set,
+)
+
+PARAMETER_SET = [
+    "Header",
+    "----",
+    "P0.31235.0.0;0x3F800000",
+    "P0.71.0.0;0x41",
+    "P0.71.0.49;0x00",
+    "----",
+    "Footer",
+]
+
+
+@pytest.fixture(params=["\r\n", "\n"])
+def parameter_set_file(request, tmp_path):
+    """Creates a parameter set file using the provided line ending"""
+    pck_file = tmp_path / "set.pck"
+    pck_file.write_bytes(request.param.join(PARAMETER_SET).encode() + b"\r\n")
+    return pck_file
+
+
+class TestParameterSet:
+    def test_read_parameter_set(self, parameter_set_file):
+        parameters = list(read_parameter_set(parameter_set_file))
+        assert [p.uid() for p in parameters] == ["0.31235.0.0", "0.71.0.0"]
+        assert parameters[0].value_raw == b"\x00\x00\x80\x3f"
+        assert parameters[1].value_raw == b"\x41"
+
+    def test_read_parameter_set_null_terminators(self, parameter_set_file):
+        parameters = list(read_parameter_set(parameter_set_file, False))
+        assert len(parameters) == 3
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_parameter_set(self, parameter_set_file, lazy):
+        parameter_set = ParameterSet(parameter_set_file, lazy=lazy)
+        assert len(parameter_set) == 2
+        assert [p.uid() for p in parameter_set] == ["0.31235.0.0", "0.71.0.0"]
+        assert "0.71.0.0" in parameter_set
+        assert "0.71.0.49" not in parameter_set
+        assert parameter_set["0.31235.0.0"].value == 1.0
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_parameter_set_provides_parameters(self, parameter_set_file, lazy):
+        parameter_set = ParameterSet(parameter_set_file, lazy=lazy)
+        assert all(isinstance(p, Parameter) for p in parameter_set)
+        assert isinstance(parameter_set["0.71.0.0"], Parameter)
+
+    def test_strip_null_terminators(self, parameter_set_file):
+        parameter_set = ParameterSet(parameter_set_file, strip_null_terminators=False)
+        assert len(parameter_set) == 3
+        parameter_set.strip_null_terminators()
+        assert len(parameter_set) == 2
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_write_parameter_set(self, parameter_set_file, tmp_path, binary):
+        parameters = list(read_parameter_set(parameter_set_file, False))
+        out_file = tmp_path / "out.pck"
+        write_parameter_set(out_file, parameters, ["Header"], binary=binary)
+
+        assert list(read_parameter_set(out_file, False)) == parameters
+        if not binary:
+            assert out_file.read_bytes() == "\r\n".join(PARAMETER_SET[:-1]).encode() + (
+                b"\r\n"
+            )
@@ -0,0 +1,34 @@
+"""Contains tests for ParameterStore class"""
+
+import pytest
+from edcon.edrive.parameter import Parameter
+from edcon.edrive.parameter_store import ParameterStore
+
+PARAMETERS = [
+    Parameter.from_uid_raw("0.31235.0.0", b"\x00\x00\x80\x3f"),
+    Parameter.from_uid_raw("0.71.0.3", b"\x41"),
+]
+
+
+class TestParameterStore:
+    def test_views(self):
+        store = ParameterStore(PARAMETERS)
+        assert len(store) == 2
+        assert list(store) == PARAMETERS
+        assert store[1].uid() == "0.71.0.3"
+        assert store[-1].value_raw == b"\x41"
+        assert store[0].value == 1.0
+        assert store[0].pnu() == PARAMETERS[0].pnu()
+        assert store[0].to_parameter() == PARAMETERS[0]
+
+    def test_index_error(self):
+        with pytest.raises(IndexError):
+            ParameterStore(PARAMETERS)[2]
+
+    def test_read_only(self):
+        with pytest.raises(AttributeError):
+            ParameterStore(PARAMETERS)[0].value_raw = b"\x00"
+
+    def test_nbytes(self):
+        store = ParameterStore(PARAMETERS)
+        assert store.nbytes() == 4 * 2 * 4 + 3 * 4 + 5
@@ -0,0 +1,57 @@
+"""Contains tests for PNU packing functions"""
+
+import struct
+import pytest
+
+from edcon.edrive.pnu_packing import (
+    create_pnu_codec_table,
+    pnu_pack,
+    pnu_unpack,
+    pnu_pack_many,
+    pnu_unpack_many,
+)
+
+
+class TestPnuCodecTable:
+    def test_codec_table(self):
+        table = create_pnu_codec_table()
+        assert table is create_pnu_codec_table()
+        assert table[7].data_type == "DINT"
+        assert table[7].struct.format == "i"
+        assert table[2019].struct is None
+
+    def test_unpack(self):
+        assert pnu_unpack(7, struct.pack("i", -5)) == -5
+        assert pnu_unpack(800, struct.pack("f", 0.5)) == 0.5
+        assert pnu_unpack(2019, b"abc") == b"abc"
+
+    def test_unpack_padded(self):
+        assert pnu_unpack(2012, b"\x01\x00") is True
+        assert pnu_unpack(3673, b"\xff\x00") == -1
+
+    def test_unpack_too_short(self):
+        assert pnu_unpack(7, b"\x01") is None
+
+    def test_unpack_forced(self):
+        assert pnu_unpack(7, b"\x01\x00", forced_format="H") == 1
+        assert pnu_unpack(7, b"abc", forced_format="s") == b"abc"
+
+    def test_unknown_pnu(self):
+        with pytest.raises(KeyError):
+            pnu_unpack(999999, b"\x00")
+
+    def test_pack(self):
+        assert pnu_pack(1, "17") == b"\x11\x00"
+        assert pnu_pack(800, 1) == struct.pack("f", 1.0)
+        assert pnu_pack(2019, "abc") == b"abc"
+        assert pnu_pack(1, 1, forced_format="b") == b"\x01"
+
+    def test_many(self):
+        raw = pnu_pack_many([(1, 3), (7, -1), (800, 0.25)])
+        assert raw == [b"\x03\x00", b"\xff\xff\xff\xff", struct.pack("f", 0.25)]
+        assert pnu_unpack_many(zip([1, 7, 800, 1], raw + [None])) == [
+            3,
+            -1,
+            0.25,
+            None,
+        ]
@@ -1,4 +1,5 @@
 """Contains tests for MotionHandler class"""
+import logging
 from edcon.edrive.telegram_handler import TelegramHandler
 from unittest.mock import Mock
 
@@ -31,3 +32,43 @@ class TestTelegramHandler:
         res = dut.acknowledge_faults(0.1)
 
         assert res == False
+
+    def test_wait_until_or_fault_progress_rate_limited(self, caplog):
+        caplog.set_level(logging.INFO, logger="edcon")
+        telegram = Mock()
+        com = Mock()
+        dut = TelegramHandler(telegram, com)
+
+        telegram.zsw1.fault_present = False
+        info_string = Mock(return_value="progress")
+        cond = Mock(side_effect=[False] * 5 + [True])
+        res = dut.wait_until_or_fault(cond, info_string=info_string)
+
+        assert res == True
+        assert info_string.call_count == 1
+
+    def test_wait_until_or_fault_wakes_on_io_cycle(self):
+        telegram = Mock()
+        com = Mock()
+        dut = TelegramHandler(telegram, com)
+
+        telegram.zsw1.fault_present = False
+        cond = Mock(side_effect=[False, True])
+        res = dut.wait_until_or_fault(cond)
+
+        assert res == True
+        com.io_cycle_event.return_value.wait.assert_called_once()
+
+    def test_wait_for_or_not_operational_progress_rate_limited(self, caplog):
+        caplog.set_level(logging.INFO, logger="edcon")
+        telegram = Mock()
+        com = Mock()
+        dut = TelegramHandler(telegram, com)
+
+        telegram.zsw1.fault_present = False
+        telegram.zsw1.operation_enabled = True
+        info_string = Mock(return_value="progress")
+        res = dut.wait_for_or_not_operational(0.05, info_string=info_string)
+
+        assert res == True
+        assert caplog.messages.count("progress") == 1
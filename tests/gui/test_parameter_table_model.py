@@ -0,0 +1,153 @@
+"""Contains tests for ParameterTableModel and ParameterRefreshThread classes"""
+
+from threading import Event
+from unittest.mock import Mock
+import pytest
+from pymodbus.exceptions import ConnectionException
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+
+from edcon.gui.parameter_table_model import ParameterRefreshThread, ParameterTableModel
+
+TELEGRAM_PNUS = [922, 3314, 3401, 3490, 4713, 4866, 4867, 60104, 60105]
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Provides the Qt application which delivers queued signals"""
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def run_thread(app, thread):
+    """Runs the thread until it finished and delivers its queued signals"""
+    thread.start()
+    assert thread.wait(5000)
+    app.processEvents()
+
+
+def read_pnus(pnus):
+    """Reads the PNU numbers as values"""
+    return [pnu * 2 for pnu in pnus]
+
+
+class TestParameterRefreshThread:
+    def test_run_reads_batches(self, app):
+        pnus_read_func = Mock(side_effect=read_pnus)
+        thread = ParameterRefreshThread(3, [1, 2, 3, 4, 5], pnus_read_func, 2)
+        results = []
+        thread.values_read.connect(lambda *args: results.append(args))
+
+        run_thread(app, thread)
+
+        assert pnus_read_func.call_count == 3
+        assert results == [
+            (3, [(1, 2), (2, 4)]),
+            (3, [(3, 6), (4, 8)]),
+            (3, [(5, 10)]),
+        ]
+
+    def test_run_reads_failed_batch_one_at_a_time(self, app):
+        def pnus_read_func(pnus):
+            if 2 in pnus:
+                raise ConnectionException("PNU 2 not readable")
+            return read_pnus(pnus)
+
+        thread = ParameterRefreshThread(0, [1, 2, 3, 4], pnus_read_func, 2)
+        results = []
+        thread.values_read.connect(lambda *args: results.append(args))
+
+        run_thread(app, thread)
+
+        assert results == [(0, [(1, 2)]), (0, [(3, 6), (4, 8)])]
+
+    def test_run_skips_unreadable_batch(self, app):
+        pnus_read_func = Mock(side_effect=[ConnectionError] * 3 + [[6, 8]])
+        thread = ParameterRefreshThread(0, [1, 2, 3, 4], pnus_read_func, 2)
+        results = []
+        thread.values_read.connect(lambda *args: results.append(args))
+
+        run_thread(app, thread)
+
+        assert results == [(0, [(3, 6), (4, 8)])]
+
+    def test_run_stops_on_interruption(self, app):
+        def pnus_read_func(pnus):
+            thread.requestInterruption()
+            return read_pnus(pnus)
+
+        thread = ParameterRefreshThread(0, [1, 2, 3, 4], pnus_read_func, 2)
+        results = []
+        thread.values_read.connect(lambda *args: results.append(args))
+
+        run_thread(app, thread)
+
+        assert results == [(0, [(1, 2), (2, 4)])]
+
+
+class TestParameterTableModel:
+    def test_start_update_all_values(self, app):
+        model = ParameterTableModel()
+        model.set_name_filter("telegram")
+
+        run_thread(app, model.start_update_all_values(read_pnus, batch_size=4))
+
+        assert [model._items[pnu].value for pnu in TELEGRAM_PNUS] == [
+            pnu * 2 for pnu in TELEGRAM_PNUS
+        ]
+        # Only the filtered PNUs are read
+        assert model._items[1].value == ""
+
+    def test_apply_values_updates_value_column(self, app):
+        model = ParameterTableModel()
+        model.set_name_filter("telegram")
+        changed = []
+        model.dataChanged.connect(
+            lambda first, last: changed.append(
+                (first.row(), first.column(), last.row(), last.column())
+            )
+        )
+
+        model._apply_values(model._refresh_generation, [(3314, 1), (4713, 2)])
+
+        assert model._items[3314].value == 1
+        assert model._items[4713].value == 2
+        assert changed == [(1, 4, 4, 4)]
+
+    def test_apply_values_discards_stale_generation(self, app):
+        model = ParameterTableModel()
+        generation = model._refresh_generation
+        model.set_name_filter("telegram")
+
+        model._apply_values(generation, [(3314, 1)])
+
+        assert model._items[3314].value == ""
+
+    def test_filter_change_discards_running_update(self, app):
+        model = ParameterTableModel()
+        model.set_name_filter("telegram")
+
+        thread = model.start_update_all_values(read_pnus)
+        assert thread.wait(5000)
+        # Values of the finished update are still queued when the filter changes
+        model.set_name_filter("")
+        app.processEvents()
+
+        assert model._items[3490].value == ""
+        assert model._refresh_generation > thread.generation
+
+    def test_stop_updates_waits_for_threads(self, app):
+        model = ParameterTableModel()
+        model.set_name_filter("telegram")
+        reading = Event()
+
+        def pnus_read_func(pnus):
+            reading.set()
+            QtCore.QThread.msleep(50)
+            return read_pnus(pnus)
+
+        thread = model.start_update_all_values(pnus_read_func, batch_size=1)
+        assert reading.wait(5)
+        model.stop_updates()
+
+        assert thread.isFinished()
+        assert not model._refresh_threads
@@ -85,3 +85,47 @@ class TestTelegram111:
             "OVERRIDE=0x0000, MDI_TARPOS=0x00000000, MDI_VELOCITY=0x00000000, MDI_ACC=0x0000, " \
             "MDI_DEC=0x0000, ZSW1=0x0000, POS_ZSW1=0x0000, POS_ZSW2=0x0000, ZSW2=0x0000, " \
             "MELDW=0x0000, XIST_A=0x00000000, NIST_B=0x00000000, FAULT_CODE=0x0000, WARN_CODE=0x0000)"
+
+    def test_input_bytes_in_place(self):
+        """Test that input_bytes updates the existing word objects"""
+        t111 = Telegram111()
+        zsw1 = t111.zsw1
+        xist_a = t111.xist_a
+        t111.input_bytes(bytes([0x01, 0x80]) + b"\x00" * 8 + struct.pack("<i", -1000)
+                         + b"\x00" * 8)
+        assert t111.zsw1 is zsw1
+        assert t111.xist_a is xist_a
+        assert zsw1.ready_to_switch_on
+        assert int(zsw1) == 0x8001
+        assert int(xist_a) == -1000
+
+    def test_input_bytes_longer_data(self):
+        """Test that surplus input data (e.g. modbus process data) is ignored"""
+        t111 = Telegram111()
+        t111.input_bytes(b"\x00" * 10 + struct.pack("<i", 1234) + b"\xff" * 42)
+        assert int(t111.xist_a) == 1234
+
+    def test_output_bytes(self):
+        """Test for Telegram111 output_bytes method"""
+        t111 = Telegram111()
+        t111.stw1.on = True
+        t111.mdi_tarpos.value = -2
+        t111.mdi_dec = t111.mdi_dec.from_int(0x1234)
+        assert t111.output_bytes() == b"\x01\x00" + b"\x00" * 8 \
+            + struct.pack("<i", -2) + b"\x00" * 6 + b"\x34\x12"
+
+    def test_output_bytes_into(self):
+        """Test for Telegram111 output_bytes_into method"""
+        t111 = Telegram111()
+        t111.override.value = 0x4000
+        buffer = bytearray(b"\xff" * 26)
+        t111.output_bytes_into(buffer, 2)
+        assert buffer[:2] == b"\xff\xff"
+        assert bytes(buffer[2:24]) == t111.output_bytes()
+        assert buffer[24:] == b"\xff\xff"
+
+    def test_layout_per_class(self):
+        """Test that each telegram class compiles its own layout"""
+        assert Telegram111.layout() is Telegram111.layout()
+        assert Telegram1.layout() is not Telegram111.layout()
+        assert Telegram111.layout().output_struct.size == 22
@@ -1,5 +1,6 @@
 """Contains code that is related to PROFIDRIVE words"""
 
+import pytest
 from edcon.profidrive.words import BitwiseWordGeneric, IntWord, IntDoubleWord
 
 # Test BitwiseWordGeneric
@@ -37,6 +38,12 @@ class TestBitwiseWordGeneric:
         bwg.bit0 = False
         assert bwg.to_bytes() == b'\xaa\xcd'
 
+    def test_set_int(self):
+        """Test for BitwiseWordGeneric set_int method"""
+        bwg = BitwiseWordGeneric()
+        bwg.set_int(0xcdab)
+        assert bwg == BitwiseWordGeneric.from_bytes(b'\xab\xcd')
+
 
 class TestIntWord:
     def test_int(self):
@@ -66,3 +73,34 @@ class TestIntDoubleWord:
 
         idw = IntDoubleWord.from_bytes(b'\xab\xcd\x00\x00')
         assert str(idw) == "IntDoubleWord(value=52651, byte_size=4)"
+
+
+class TestBitwiseWord:
+    def test_bit_properties(self):
+        """Test that named bits map to the bits of the integer value"""
+        bwg = BitwiseWordGeneric(True, bit15=True)
+        assert int(bwg) == 0x8001
+        bwg.bit15 = False
+        bwg.bit3 = True
+        assert int(bwg) == 0x0009
+        assert bwg.bit3 is True
+        assert bwg.bit2 is False
+
+    def test_invalid_arguments(self):
+        """Test that unknown bits are rejected"""
+        with pytest.raises(TypeError):
+            BitwiseWordGeneric(unknown=True)
+        with pytest.raises(TypeError):
+            BitwiseWordGeneric(*([False] * 17))
+
+    def test_slots(self):
+        """Test that words do not carry an instance dict"""
+        bwg = BitwiseWordGeneric()
+        assert not hasattr(bwg, "__dict__")
+        with pytest.raises(AttributeError):
+            bwg.unknown = True
+
+    def test_to_boollist(self):
+        """Test for BitwiseWordGeneric to_boollist method"""
+        bwg = BitwiseWordGeneric.from_int(0x8002)
+        assert bwg.to_boollist() == [False, True] + [False] * 13 + [True]
@@ -44,3 +44,17 @@ class TestBoollistToBytes:
         """Tests the function boollist_to_bytes with 16 bits"""
         assert boollist_to_bytes([True, False, True, False, False, True, False, True,
                                   False, True, False, True, True, False, True, False]) == b'\xa5Z'
+
+    def test_partial_byte(self):
+        """Tests the function boollist_to_bytes with a length not divisible by 8"""
+        assert boollist_to_bytes([True, False, True, False, False, True, False, True,
+                                  False, True]) == b'\xa5\x02'
+
+
+class TestRoundTrip:
+    def test_large_assembly(self):
+        """Tests the conversion of a 512 byte assembly in both directions"""
+        data = bytes(range(256)) * 2
+        boollist = bytes_to_boollist(data)
+        assert len(boollist) == 4096
+        assert boollist_to_bytes(boollist) == data
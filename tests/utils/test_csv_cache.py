@@ -0,0 +1,54 @@
+"""Contains tests for csv_cache module"""
+
+from edcon.utils.csv_cache import read_csv_rows, cache_dir
+
+CSV_DATA = 'pnu;name\n1;"first\nline"\n2;second\n'
+
+
+def write_csv(tmp_path, data=CSV_DATA):
+    csv_file = tmp_path / "map.csv"
+    csv_file.write_text(data, encoding="ascii")
+    return csv_file
+
+
+class TestCsvCache:
+    def test_cache_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("EDCON_CACHE_DIR", str(tmp_path))
+        assert cache_dir() == tmp_path
+        monkeypatch.setenv("EDCON_CACHE_DIR", "")
+        assert cache_dir() is None
+
+    def test_read_csv_rows(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("EDCON_CACHE_DIR", str(tmp_path / "cache"))
+        csv_file = write_csv(tmp_path)
+
+        expected = (("pnu", "name"), ((1, "first\nline"), (2, "second")))
+        assert read_csv_rows(csv_file, "ascii", int_columns=(0,)) == expected
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+        # Second read uses the cache file
+        assert read_csv_rows(csv_file, "ascii", int_columns=(0,)) == expected
+        # Different column interpretation is not taken from the cache
+        assert read_csv_rows(csv_file, "ascii")[1][0] == ("1", "first\nline")
+
+    def test_read_csv_rows_changed_file(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("EDCON_CACHE_DIR", str(tmp_path / "cache"))
+        csv_file = write_csv(tmp_path)
+        read_csv_rows(csv_file, "ascii")
+
+        write_csv(tmp_path, "pnu;name\n3;third\n")
+        assert read_csv_rows(csv_file, "ascii") == (("pnu", "name"), (("3", "third"),))
+
+    def test_read_csv_rows_corrupt_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("EDCON_CACHE_DIR", str(tmp_path / "cache"))
+        csv_file = write_csv(tmp_path)
+        read_csv_rows(csv_file, "ascii")
+        for cache_file in (tmp_path / "cache").iterdir():
+            cache_file.write_bytes(b"corrupt")
+
+        assert read_csv_rows(csv_file, "ascii")[1][1] == ("2", "second")
+
+    def test_read_csv_rows_disabled(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("EDCON_CACHE_DIR", "")
+        csv_file = write_csv(tmp_path)
+        assert read_csv_rows(csv_file, "ascii")[1][1] == ("2", "second")
+        assert list(tmp_path.iterdir()) == [csv_file]
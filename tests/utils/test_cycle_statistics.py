@@ -0,0 +1,46 @@
+"""Contains tests for CycleStatistics class"""
+from pytest import approx
+from edcon.utils.cycle_statistics import CycleStatistics
+
+
+class TestCycleStatistics:
+    def test_achieved_period(self):
+        """Tests mean period calculation"""
+        stats = CycleStatistics(10)
+        for start in [0.0, 0.010, 0.021, 0.030]:
+            stats.record_cycle(start)
+
+        assert stats.cycles == 4
+        assert stats.achieved_period() == approx(10.0)
+
+    def test_no_periods(self):
+        """Tests statistics without enough recorded cycles"""
+        stats = CycleStatistics(10)
+        stats.record_cycle(0.0)
+
+        assert stats.achieved_period() is None
+        assert stats.jitter() == {}
+
+    def test_jitter(self):
+        """Tests jitter calculation"""
+        stats = CycleStatistics(10)
+        for start in [0.0, 0.010, 0.022, 0.031]:
+            stats.record_cycle(start)
+
+        jitter = stats.jitter(percentiles=(50, 100))
+        assert jitter["min"] == approx(-1.0)
+        assert jitter["max"] == approx(2.0)
+        assert jitter["p50"] == approx(1.0)
+        assert jitter["p100"] == approx(2.0)
+
+    def test_reset(self):
+        """Tests reset of the statistics"""
+        stats = CycleStatistics(10)
+        stats.record_cycle(0.0)
+        stats.record_cycle(0.01)
+        stats.record_overrun()
+        stats.reset()
+
+        assert stats.summary()["cycles"] == 0
+        assert stats.summary()["overruns"] == 0
+        assert stats.summary()["achieved_period"] is None
@@ -1,5 +1,7 @@
 """Contains tests for MotionHandler class"""
+import logging
 import time
+from threading import Condition, Event, Timer
 from edcon.utils.func_helpers import func_sequence, wait_until, wait_for
 from unittest.mock import Mock, call
 from pytest import approx
@@ -80,3 +82,53 @@ class TestFuncHelpers:
 
         assert res == False
         assert elapsed_time == approx(0.0, abs=0.01)
+
+    def test_wait_for_poll_interval(self):
+        """Tests that the error condition is evaluated once per poll interval"""
+        err_cond = Mock(return_value=False)
+        res = wait_for(0.1, err_cond, poll_interval=0.02)
+
+        assert res == True
+        assert 4 <= err_cond.call_count <= 7
+
+    def test_wait_until_info_string_rate_limited(self, caplog):
+        """Tests that info_string is logged at most once per info interval"""
+        caplog.set_level(logging.INFO, logger="edcon")
+        info_string = Mock(return_value="info")
+        start_time = time.monotonic()
+        res = wait_until(Mock(return_value=False), timeout=0.1, info_string=info_string,
+                         poll_interval=0.0, info_interval=0.06)
+        elapsed = time.monotonic() - start_time
+
+        assert res == False
+        # A busy test machine may stall the loop beyond the timeout
+        assert 2 <= info_string.call_count <= 1 + elapsed // 0.06
+
+    def test_wait_until_wake_event(self):
+        """Tests that a wake event starts the next evaluation early"""
+        wake_event = Event()
+        wake_event.set()
+        cond = Mock(side_effect=[False, False, True])
+        start_time = time.time()
+        res = wait_until(cond, poll_interval=1.0, wake_event=wake_event)
+        elapsed_time = time.time() - start_time
+
+        assert res == True
+        assert elapsed_time == approx(0.0, abs=0.01)
+
+    def test_wait_until_wake_condition(self):
+        """Tests that a notified wake condition starts the next evaluation early"""
+        wake_condition = Condition()
+
+        def notify():
+            with wake_condition:
+                wake_condition.notify_all()
+
+        cond = Mock(side_effect=[False, True])
+        Timer(0.05, notify).start()
+        start_time = time.time()
+        res = wait_until(cond, poll_interval=1.0, wake_event=wake_condition)
+        elapsed_time = time.time() - start_time
+
+        assert res == True
+        assert elapsed_time < 0.5
@@ -0,0 +1,40 @@
+"""Contains tests for ProgressReporter class"""
+import logging
+from unittest.mock import Mock, patch
+from edcon.utils.progress_reporter import ProgressReporter
+
+
+class TestProgressReporter:
+    def test_rate_limited(self, caplog):
+        """Tests that messages are logged at most once per interval"""
+        caplog.set_level(logging.INFO, logger="edcon")
+        message = Mock(side_effect=["a", "b", "c"])
+        reporter = ProgressReporter(message, interval=1.0)
+
+        with patch("edcon.utils.progress_reporter.time.monotonic",
+                   side_effect=[10.0, 10.5, 11.0]):
+            assert reporter.report() == True
+            assert reporter.report() == False
+            assert reporter.report() == True
+
+        assert message.call_count == 2
+        assert [r.message for r in caplog.records] == ["a", "b"]
+
+    def test_only_on_change(self, caplog):
+        """Tests that unchanged messages are not logged again"""
+        caplog.set_level(logging.INFO, logger="edcon")
+        reporter = ProgressReporter(lambda: "same", interval=0.0)
+
+        assert reporter.report() == True
+        assert reporter.report() == False
+        reporter.reset()
+        assert reporter.report() == True
+
+    def test_not_formatted_if_disabled(self, caplog):
+        """Tests that the message is not evaluated if info logging is disabled"""
+        caplog.set_level(logging.WARNING, logger="edcon")
+        message = Mock(return_value="msg")
+        reporter = ProgressReporter(message)
+
+        assert reporter.report() == False
+        message.assert_not_called()